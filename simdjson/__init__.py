@@ -6,8 +6,21 @@ try:
         Parser,
         Array,
         Object,
+        CachedParser,
+        Predicate,
+        Schema,
+        LazyDict,
+        LazyList,
+        autotune,
+        validate,
+        validate_many,
+        validate_utf8,
+        validate_utf8_many,
+        minify,
+        load_many,
         MAXSIZE_BYTES,
-        PADDING
+        PADDING,
+        VERSION
     )
 except ImportError:
     raise RuntimeError('Unable to import low-level simdjson bindings.')
@@ -16,8 +29,21 @@ _ALL_IMPORTS = [
     Parser,
     Array,
     Object,
+    CachedParser,
+    Predicate,
+    Schema,
+    LazyDict,
+    LazyList,
+    autotune,
+    validate,
+    validate_many,
+    validate_utf8,
+    validate_utf8_many,
+    minify,
+    load_many,
     MAXSIZE_BYTES,
-    PADDING
+    PADDING,
+    VERSION
 ]
 
 
@@ -1,16 +1,22 @@
 import json
+from mmap import mmap
+from multiprocessing.shared_memory import SharedMemory
+from os import PathLike
 from pathlib import Path
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Dict,
     Final,
+    Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
     Tuple,
+    TypedDict,
     Union,
     ValuesView,
     overload,
@@ -24,6 +30,13 @@ except ImportError:
 Primitives = Union[int, float, str, bool]
 SimValue = Optional[Union['Object', 'Array', Primitives]]
 UnboxedValue = Optional[Union[Primitives, Dict[str, Any], List[Any]]]
+Keys = Iterable[Union[str, bytes]]
+
+
+class PartialOptions(TypedDict, total=False):
+    max_depth: Optional[int]
+    include: Keys
+    exclude: Keys
 
 
 class Object(Mapping[str, SimValue]):
@@ -36,7 +49,37 @@ class Object(Mapping[str, SimValue]):
     def __len__(self) -> int:
         ...
 
-    def as_dict(self) -> Dict[str, UnboxedValue]:
+    def as_dict(
+        self,
+        *,
+        max_depth: Optional[int] = ...,
+        include: Optional[Keys] = ...,
+        exclude: Optional[Keys] = ...
+    ) -> Dict[str, UnboxedValue]:
+        ...
+
+    def save_tape(self, path: Union[str, bytes, PathLike]) -> None:
+        ...
+
+    def share(self) -> SharedMemory:
+        ...
+
+    def digest(self, *, ignore_order: bool = ...) -> int:
+        ...
+
+    def get_int(self, key: Union[str, bytes]) -> int:
+        ...
+
+    def get_float(self, key: Union[str, bytes]) -> float:
+        ...
+
+    def get_bool(self, key: Union[str, bytes]) -> bool:
+        ...
+
+    def get_str(self, key: Union[str, bytes]) -> str:
+        ...
+
+    def get_bytes(self, key: Union[str, bytes]) -> bytes:
         ...
 
     def at_pointer(self, key: str) -> SimValue:
@@ -45,10 +88,14 @@ class Object(Mapping[str, SimValue]):
     def keys(self) -> AbstractSet[str]:
         ...
 
-    def values(self) -> ValuesView[SimValue]:
+    def values(self, *, recursive: bool = ...) -> ValuesView[SimValue]:
         ...
 
-    def items(self) -> AbstractSet[Tuple[str, SimValue]]:
+    def items(
+        self,
+        *,
+        recursive: bool = ...
+    ) -> AbstractSet[Tuple[str, SimValue]]:
         ...
 
     @property
@@ -56,6 +103,63 @@ class Object(Mapping[str, SimValue]):
         ...
 
 
+Comparison = Literal['==', '!=', '<', '<=', '>', '>=']
+
+
+class Predicate:
+    def __init__(
+        self,
+        pointer: str,
+        op: Comparison,
+        value: Optional[Union[Primitives, bytes]]
+    ) -> None:
+        ...
+
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        ...
+
+    def __or__(self, other: 'Predicate') -> 'Predicate':
+        ...
+
+    def __invert__(self) -> 'Predicate':
+        ...
+
+
+class Schema:
+    def __init__(self, schema: Union[bool, Mapping[str, Any]]) -> None:
+        ...
+
+    def validate(
+        self,
+        doc: Union['Object', 'Array']
+    ) -> Optional[Tuple[str, str]]:
+        ...
+
+
+class LazyDict(Dict[str, Any]):
+    def as_dict(self) -> Dict[str, Any]:
+        ...
+
+
+class LazyList(List[Any]):
+    def as_list(self) -> List[Any]:
+        ...
+
+
+class ArrowColumn:
+    def __len__(self) -> int:
+        ...
+
+    def __arrow_c_schema__(self) -> object:
+        ...
+
+    def __arrow_c_array__(
+        self,
+        requested_schema: Optional[object] = ...
+    ) -> Tuple[object, object]:
+        ...
+
+
 class Array(Sequence[SimValue]):
     def __len__(self) -> int:
         ...
@@ -63,12 +167,97 @@ class Array(Sequence[SimValue]):
     def __getitem__(self, idx: Union[int, slice]) -> 'Array':
         ...
 
-    def as_list(self) -> List[Optional[Union[Primitives, dict, list]]]:
+    def as_list(
+        self,
+        *,
+        max_depth: Optional[int] = ...,
+        include: Optional[Keys] = ...,
+        exclude: Optional[Keys] = ...
+    ) -> List[Optional[Union[Primitives, dict, list]]]:
+        ...
+
+    def save_tape(self, path: Union[str, bytes, PathLike]) -> None:
+        ...
+
+    def share(self) -> SharedMemory:
+        ...
+
+    def digest(self, *, ignore_order: bool = ...) -> int:
+        ...
+
+    def get_int(self, index: int) -> int:
+        ...
+
+    def get_float(self, index: int) -> float:
+        ...
+
+    def get_bool(self, index: int) -> bool:
+        ...
+
+    def get_str(self, index: int) -> str:
+        ...
+
+    def get_bytes(self, index: int) -> bytes:
         ...
 
     def as_buffer(self, *, of_type: Literal['d', 'i', 'u']) -> bytes:
         ...
 
+    @overload
+    def filter(
+        self,
+        predicate: Predicate,
+        *,
+        indices: Literal[False] = ...,
+        recursive: bool = ...
+    ) -> List[SimValue]:
+        ...
+
+    @overload
+    def filter(
+        self,
+        predicate: Predicate,
+        *,
+        indices: Literal[True],
+        recursive: bool = ...
+    ) -> List[int]:
+        ...
+
+    @overload
+    def filter(
+        self,
+        pointer: str,
+        op: Comparison,
+        value: Optional[Union[Primitives, bytes]],
+        *,
+        indices: Literal[False] = ...,
+        recursive: bool = ...
+    ) -> List[SimValue]:
+        ...
+
+    @overload
+    def filter(
+        self,
+        pointer: str,
+        op: Comparison,
+        value: Optional[Union[Primitives, bytes]],
+        *,
+        indices: Literal[True],
+        recursive: bool = ...
+    ) -> List[int]:
+        ...
+
+    def to_arrow(self) -> ArrowColumn:
+        ...
+
+    def iter_chunks(
+        self,
+        size: int,
+        *,
+        recursive: bool = ...
+    ) -> Iterator[List[SimValue]]:
+        ...
+
     def at_pointer(self, key: str) -> SimValue:
         ...
 
@@ -78,7 +267,54 @@ class Array(Sequence[SimValue]):
 
 
 class Parser:
-    def __init__(self, max_capacity: int = ...) -> None:
+    def __init__(
+        self,
+        max_capacity: int = ...,
+        *,
+        initial_capacity: int = ...,
+        max_depth: int = ...,
+        shrink_after: int = ...,
+        strings: Literal['str', 'bytes'] = ...,
+        keys: Literal['str', 'bytes'] = ...,
+        implementation: Optional[str] = ...,
+        stats: bool = ...,
+        stats_hook: Optional[Callable[[Dict[str, int]], Any]] = ...,
+        stats_interval: int = ...
+    ) -> None:
+        ...
+
+    @property
+    def stats(self) -> Optional[Dict[str, int]]:
+        ...
+
+    def reset_stats(self) -> None:
+        ...
+
+    def shrink(self, to: Optional[int] = ...) -> None:
+        ...
+
+    @property
+    def strings(self) -> Literal['str', 'bytes']:
+        ...
+
+    @property
+    def keys(self) -> Literal['str', 'bytes']:
+        ...
+
+    @property
+    def capacity(self) -> int:
+        ...
+
+    @property
+    def max_depth(self) -> int:
+        ...
+
+    @property
+    def initial_capacity(self) -> int:
+        ...
+
+    @property
+    def shrink_after(self) -> int:
         ...
 
     def get_implementations(
@@ -107,26 +343,198 @@ class Parser:
     def load(
         self,
         path: Union[str, Path],
-        recursive: Literal[True],
+        recursive: Literal[True, 'lazy'],
     ) -> UnboxedValue:
         ...
 
+    @overload
+    def load(
+        self,
+        path: Union[str, Path],
+        recursive: PartialOptions,
+    ) -> Union[SimValue, UnboxedValue]:
+        ...
+
+    @overload
+    def load_tape(
+        self,
+        path: Union[str, bytes, PathLike],
+        recursive: Literal[False] = ...,
+    ) -> SimValue:
+        ...
+
+    @overload
+    def load_tape(
+        self,
+        path: Union[str, bytes, PathLike],
+        recursive: Literal[True, 'lazy'],
+    ) -> UnboxedValue:
+        ...
+
+    @overload
+    def load_tape(
+        self,
+        path: Union[str, bytes, PathLike],
+        recursive: PartialOptions,
+    ) -> Union[SimValue, UnboxedValue]:
+        ...
+
+    @overload
+    def load_shared(
+        self,
+        name: str,
+        recursive: Literal[False] = ...,
+    ) -> SimValue:
+        ...
+
+    @overload
+    def load_shared(
+        self,
+        name: str,
+        recursive: Literal[True, 'lazy'],
+    ) -> UnboxedValue:
+        ...
+
+    @overload
+    def load_shared(
+        self,
+        name: str,
+        recursive: PartialOptions,
+    ) -> Union[SimValue, UnboxedValue]:
+        ...
+
     @overload
     def parse(
         self,
-        data: Union[str, bytes, bytearray, memoryview],
+        data: Union[str, bytes, bytearray, memoryview, mmap],
         recursive: Literal[False] = ...,
+        *,
+        offset: int = ...,
+        length: Optional[int] = ...
     ) -> SimValue:
         ...
 
     @overload
     def parse(
         self,
-        data: Union[str, bytes, bytearray, memoryview],
-        recursive: Literal[True],
+        data: Union[str, bytes, bytearray, memoryview, mmap],
+        recursive: Literal[True, 'lazy'],
+        *,
+        offset: int = ...,
+        length: Optional[int] = ...
+    ) -> UnboxedValue:
+        ...
+
+    @overload
+    def parse(
+        self,
+        data: Union[str, bytes, bytearray, memoryview, mmap],
+        recursive: PartialOptions,
+        *,
+        offset: int = ...,
+        length: Optional[int] = ...
+    ) -> Union[SimValue, UnboxedValue]:
+        ...
+
+
+class DocumentStream(Iterator[UnboxedValue]):
+    def __iter__(self) -> 'DocumentStream':
+        ...
+
+    def __next__(self) -> UnboxedValue:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    def __enter__(self) -> 'DocumentStream':
+        ...
+
+    def __exit__(self, *exc: Any) -> None:
+        ...
+
+
+class CachedParser:
+    max_entries: int
+    max_bytes: int
+    copy: bool
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = ...,
+        max_bytes: int = ...,
+        copy: bool = ...,
+        **kwargs: Any
+    ) -> None:
+        ...
+
+    def parse(
+        self,
+        data: Union[str, bytes, bytearray, memoryview]
     ) -> UnboxedValue:
         ...
 
+    def clear(self) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        ...
+
+
+def autotune(
+    sample_docs: Iterable[Union[str, bytes, bytearray, memoryview]],
+    *,
+    repeat: int = ...,
+    apply: bool = ...
+) -> str:
+    ...
+
+
+Source = Union[str, bytes, bytearray, memoryview]
+ValidationResult = Optional[Tuple[str, Optional[int]]]
+
+
+def validate(src: Source) -> ValidationResult:
+    ...
+
+
+def validate_many(sources: Iterable[Source]) -> List[ValidationResult]:
+    ...
+
+
+def validate_utf8(src: Source) -> Optional[int]:
+    ...
+
+
+def validate_utf8_many(sources: Iterable[Source]) -> List[Optional[int]]:
+    ...
+
+
+@overload
+def minify(src: Source, out: None = ...) -> bytes:
+    ...
+
+
+@overload
+def minify(src: Source, out: Union[bytearray, memoryview]) -> int:
+    ...
+
+
+def load_many(
+    path: Union[str, bytes, PathLike],
+    compression: Optional[Literal['gzip', 'zstd', 'auto']] = ...,
+    *,
+    chunk_size: int = ...,
+    max_line_length: int = ...,
+    **kwargs: Any
+) -> DocumentStream:
+    ...
+
 
 dumps = json.dumps
 dump = json.dump
@@ -0,0 +1,629 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <new>
+#include <string>
+#include <string_view>
+#include <unordered_map>
+#include <vector>
+#include "simdjson.h"
+#include "tape.h"
+
+// The Arrow C Data Interface, as given by the specification at
+// https://arrow.apache.org/docs/format/CDataInterface.html. These
+// definitions are ABI-stable and meant to be copied into producers.
+#ifndef ARROW_C_DATA_INTERFACE
+#define ARROW_C_DATA_INTERFACE
+
+#define ARROW_FLAG_DICTIONARY_ORDERED 1
+#define ARROW_FLAG_NULLABLE 2
+#define ARROW_FLAG_MAP_KEYS_SORTED 4
+
+extern "C" {
+    struct ArrowSchema {
+        const char* format;
+        const char* name;
+        const char* metadata;
+        int64_t flags;
+        int64_t n_children;
+        struct ArrowSchema** children;
+        struct ArrowSchema* dictionary;
+        void (*release)(struct ArrowSchema*);
+        void* private_data;
+    };
+
+    struct ArrowArray {
+        int64_t length;
+        int64_t null_count;
+        int64_t offset;
+        int64_t n_buffers;
+        int64_t n_children;
+        const void** buffers;
+        struct ArrowArray** children;
+        struct ArrowArray* dictionary;
+        void (*release)(struct ArrowArray*);
+        void* private_data;
+    };
+}
+
+#endif  // ARROW_C_DATA_INTERFACE
+
+#ifndef _PY_SIMDJSON_ARROW
+#define _PY_SIMDJSON_ARROW
+    // Conversion of a parsed array into Arrow columnar memory, walking the
+    // tape directly without creating any Python objects.
+    //
+    // Every element of the source array becomes one row. The column type is
+    // inferred in a first pass over the tape, then the buffers are filled in
+    // a second pass.
+    //
+    // This header must only ever be included by csimdjson.
+    namespace arrow_export {
+        using simdjson::internal::tape_type;
+
+        enum class kind {
+            null,
+            boolean,
+            int64,
+            uint64,
+            float64,
+            string,
+            list,
+            object
+        };
+
+        inline const char *kind_name(kind k) {
+            switch (k) {
+                case kind::null: return "null";
+                case kind::boolean: return "bool";
+                case kind::int64: return "int64";
+                case kind::uint64: return "uint64";
+                case kind::float64: return "double";
+                case kind::string: return "string";
+                case kind::list: return "array";
+                case kind::object: return "object";
+            }
+            return "unknown";
+        }
+
+        struct column {
+            kind type = kind::null;
+            // Use 64-bit offsets, decided after inference.
+            bool large = false;
+            int64_t length = 0;
+            int64_t null_count = 0;
+
+            std::vector<uint8_t> validity;
+            // Numbers, string bytes, or the bitmap of a boolean column.
+            std::vector<uint8_t> values;
+            // 32 or 64-bit offsets into `values` or the child column.
+            std::vector<uint8_t> offsets;
+
+            // The total string bytes or list items seen during inference.
+            size_t extent = 0;
+
+            // Struct fields in first-seen order, or the list item column.
+            std::vector<std::string> names;
+            std::vector<column> children;
+
+            // Only used while building. Keys point into the document's
+            // string buffer.
+            std::unordered_map<std::string_view, size_t> fields;
+            // The tape index of each field in the current row of a struct
+            // column, or 0 if it's missing.
+            std::vector<size_t> row;
+
+            column &field(std::string_view name) {
+                auto found = fields.find(name);
+                if (found != fields.end()) {
+                    return children[found->second];
+                }
+                fields.emplace(name, children.size());
+                names.emplace_back(name);
+                children.emplace_back();
+                return children.back();
+            }
+        };
+
+        struct source {
+            const uint64_t *tape;
+            const uint8_t *strings;
+        };
+
+        inline kind tape_kind(const uint64_t *tape, size_t i) {
+            switch (tape_type(tape[i] >> 56)) {
+                case tape_type::TRUE_VALUE:
+                case tape_type::FALSE_VALUE:
+                    return kind::boolean;
+                case tape_type::INT64:
+                    return kind::int64;
+                case tape_type::UINT64:
+                    return kind::uint64;
+                case tape_type::DOUBLE:
+                    return kind::float64;
+                case tape_type::STRING:
+                    return kind::string;
+                case tape_type::START_ARRAY:
+                    return kind::list;
+                case tape_type::START_OBJECT:
+                    return kind::object;
+                default:
+                    return kind::null;
+            }
+        }
+
+        // Merge a new value of kind `k` into the column, returning false if
+        // the two can't share a single Arrow type. Mixed numbers are
+        // promoted to doubles.
+        inline bool merge(column &c, kind k) {
+            if (k == kind::null || c.type == k) return true;
+            if (c.type == kind::null) {
+                c.type = k;
+                return true;
+            }
+
+            auto numeric = [](kind n) {
+                return n == kind::int64 || n == kind::uint64
+                    || n == kind::float64;
+            };
+            if (numeric(c.type) && numeric(k)) {
+                c.type = kind::float64;
+                return true;
+            }
+            return false;
+        }
+
+        // The path to a conflicting value, built innermost first as the
+        // inference pass unwinds.
+        struct conflict {
+            std::vector<std::string> path;
+            kind expected;
+            kind found;
+        };
+
+        inline std::string escape_pointer(std::string_view token) {
+            std::string out;
+            out.reserve(token.size());
+            for (char ch : token) {
+                if (ch == '~') out += "~0";
+                else if (ch == '/') out += "~1";
+                else out += ch;
+            }
+            return out;
+        }
+
+        inline bool infer(column &c, source src, size_t i, conflict &error) {
+            kind k = tape_kind(src.tape, i);
+            if (!merge(c, k)) {
+                error.expected = c.type;
+                error.found = k;
+                return false;
+            }
+
+            if (k == kind::string) {
+                c.extent += tape_string(src.tape, src.strings, i).size();
+            } else if (k == kind::list) {
+                if (c.children.empty()) {
+                    c.names.emplace_back("item");
+                    c.children.emplace_back();
+                }
+                size_t end = uint32_t(src.tape[i]) - 1;
+                size_t n = 0;
+                for (size_t j = i + 1; j < end; j = next_index(src.tape, j)) {
+                    if (!infer(c.children[0], src, j, error)) {
+                        error.path.push_back(std::to_string(n));
+                        return false;
+                    }
+                    n++;
+                }
+                c.extent += n;
+            } else if (k == kind::object) {
+                size_t end = uint32_t(src.tape[i]) - 1;
+                for (size_t j = i + 1; j < end; ) {
+                    std::string_view key = tape_string(src.tape, src.strings, j);
+                    if (!infer(c.field(key), src, j + 1, error)) {
+                        error.path.push_back(escape_pointer(key));
+                        return false;
+                    }
+                    j = next_index(src.tape, j + 1);
+                }
+            }
+            return true;
+        }
+
+        // Offsets may only be 32-bit when they fit.
+        inline void choose_offsets(column &c) {
+            c.large = c.extent > size_t(INT32_MAX);
+            for (column &child : c.children) {
+                choose_offsets(child);
+            }
+        }
+
+        inline void push_offset(column &c, int64_t value) {
+            if (c.large) {
+                const uint8_t *p = reinterpret_cast<const uint8_t *>(&value);
+                c.offsets.insert(c.offsets.end(), p, p + sizeof(value));
+            } else {
+                int32_t narrow = int32_t(value);
+                const uint8_t *p = reinterpret_cast<const uint8_t *>(&narrow);
+                c.offsets.insert(c.offsets.end(), p, p + sizeof(narrow));
+            }
+        }
+
+        template<typename T>
+        inline void push_value(column &c, T value) {
+            const uint8_t *p = reinterpret_cast<const uint8_t *>(&value);
+            c.values.insert(c.values.end(), p, p + sizeof(value));
+        }
+
+        inline void set_bit(std::vector<uint8_t> &bitmap, int64_t i,
+                bool value) {
+            if (size_t(i >> 3) >= bitmap.size()) {
+                bitmap.push_back(0);
+            }
+            if (value) {
+                bitmap[i >> 3] |= uint8_t(1 << (i & 7));
+            }
+        }
+
+        // Prepare the buffers of every column for the filling pass.
+        inline void start(column &c) {
+            if (c.type == kind::string || c.type == kind::list) {
+                push_offset(c, 0);
+            }
+            if (c.type == kind::string) {
+                c.values.reserve(c.extent);
+            } else if (c.type == kind::object) {
+                c.row.resize(c.children.size());
+            }
+            for (column &child : c.children) {
+                start(child);
+            }
+        }
+
+        // Drop everything that's only needed while building.
+        inline void finish(column &c) {
+            c.fields.clear();
+            c.row = std::vector<size_t>();
+            for (column &child : c.children) {
+                finish(child);
+            }
+        }
+
+        inline void append_null(column &c) {
+            set_bit(c.validity, c.length, false);
+            c.null_count++;
+
+            switch (c.type) {
+                case kind::boolean:
+                    set_bit(c.values, c.length, false);
+                    break;
+                case kind::int64:
+                case kind::uint64:
+                case kind::float64:
+                    push_value<uint64_t>(c, 0);
+                    break;
+                case kind::string:
+                    push_offset(c, int64_t(c.values.size()));
+                    break;
+                case kind::list:
+                    push_offset(c, c.children[0].length);
+                    break;
+                case kind::object:
+                    // Struct children always have the same length as their
+                    // parent.
+                    for (column &child : c.children) {
+                        append_null(child);
+                    }
+                    break;
+                case kind::null:
+                    break;
+            }
+            c.length++;
+        }
+
+        inline void append(column &c, source src, size_t i) {
+            const uint64_t *tape = src.tape;
+            auto type = tape_type(tape[i] >> 56);
+            if (type == tape_type::NULL_VALUE) {
+                append_null(c);
+                return;
+            }
+
+            set_bit(c.validity, c.length, true);
+            switch (c.type) {
+                case kind::boolean:
+                    set_bit(c.values, c.length, type == tape_type::TRUE_VALUE);
+                    break;
+                case kind::int64:
+                case kind::uint64:
+                    push_value<uint64_t>(c, tape[i + 1]);
+                    break;
+                case kind::float64: {
+                    double value;
+                    if (type == tape_type::INT64) {
+                        int64_t v;
+                        std::memcpy(&v, &tape[i + 1], sizeof(v));
+                        value = double(v);
+                    } else if (type == tape_type::UINT64) {
+                        value = double(tape[i + 1]);
+                    } else {
+                        std::memcpy(&value, &tape[i + 1], sizeof(value));
+                    }
+                    push_value<double>(c, value);
+                    break;
+                }
+                case kind::string: {
+                    std::string_view s = tape_string(tape, src.strings, i);
+                    c.values.insert(c.values.end(), s.begin(), s.end());
+                    push_offset(c, int64_t(c.values.size()));
+                    break;
+                }
+                case kind::list: {
+                    column &items = c.children[0];
+                    size_t end = uint32_t(tape[i]) - 1;
+                    for (size_t j = i + 1; j < end; j = next_index(tape, j)) {
+                        append(items, src, j);
+                    }
+                    push_offset(c, items.length);
+                    break;
+                }
+                case kind::object: {
+                    // Like a dict, the last of any duplicate keys wins.
+                    std::fill(c.row.begin(), c.row.end(), 0);
+                    size_t end = uint32_t(tape[i]) - 1;
+                    for (size_t j = i + 1; j < end; ) {
+                        std::string_view key = tape_string(tape, src.strings, j);
+                        c.row[c.fields.find(key)->second] = j + 1;
+                        j = next_index(tape, j + 1);
+                    }
+                    for (size_t f = 0; f < c.children.size(); f++) {
+                        if (c.row[f]) {
+                            append(c.children[f], src, c.row[f]);
+                        } else {
+                            append_null(c.children[f]);
+                        }
+                    }
+                    break;
+                }
+                case kind::null:
+                    break;
+            }
+            c.length++;
+        }
+
+        // Exported schemas and arrays keep the whole column tree alive, so
+        // the same column can be exported any number of times.
+        struct schema_data {
+            std::shared_ptr<const column> owner;
+            std::string format;
+            std::string name;
+            std::vector<ArrowSchema> children;
+            std::vector<ArrowSchema *> child_pointers;
+        };
+
+        struct array_data {
+            std::shared_ptr<const column> owner;
+            const void *buffers[3];
+            std::vector<ArrowArray> children;
+            std::vector<ArrowArray *> child_pointers;
+        };
+
+        inline void release_schema(ArrowSchema *schema) {
+            for (int64_t i = 0; i < schema->n_children; i++) {
+                ArrowSchema *child = schema->children[i];
+                if (child->release) child->release(child);
+            }
+            delete static_cast<schema_data *>(schema->private_data);
+            schema->release = nullptr;
+        }
+
+        inline void release_array(ArrowArray *array) {
+            for (int64_t i = 0; i < array->n_children; i++) {
+                ArrowArray *child = array->children[i];
+                if (child->release) child->release(child);
+            }
+            delete static_cast<array_data *>(array->private_data);
+            array->release = nullptr;
+        }
+
+        inline std::string format(const column &c) {
+            switch (c.type) {
+                case kind::null: return "n";
+                case kind::boolean: return "b";
+                case kind::int64: return "l";
+                case kind::uint64: return "L";
+                case kind::float64: return "g";
+                case kind::string: return c.large ? "U" : "u";
+                case kind::list: return c.large ? "+L" : "+l";
+                case kind::object: return "+s";
+            }
+            return "n";
+        }
+
+        inline void export_schema(const std::shared_ptr<const column> &owner,
+                const column &c, const std::string &name, ArrowSchema *out) {
+            auto data = new schema_data();
+            data->owner = owner;
+            data->format = format(c);
+            data->name = name;
+            data->children.resize(c.children.size());
+            for (size_t i = 0; i < c.children.size(); i++) {
+                export_schema(
+                    owner,
+                    c.children[i],
+                    c.names[i],
+                    &data->children[i]
+                );
+                data->child_pointers.push_back(&data->children[i]);
+            }
+
+            out->format = data->format.c_str();
+            out->name = data->name.c_str();
+            out->metadata = nullptr;
+            out->flags = ARROW_FLAG_NULLABLE;
+            out->n_children = int64_t(c.children.size());
+            out->children = data->child_pointers.data();
+            out->dictionary = nullptr;
+            out->release = release_schema;
+            out->private_data = data;
+        }
+
+        inline const void *buffer(const std::vector<uint8_t> &v) {
+            // Arrow requires a non-null pointer even for empty buffers.
+            static const uint64_t empty = 0;
+            return v.empty() ? static_cast<const void *>(&empty) : v.data();
+        }
+
+        inline void export_array(const std::shared_ptr<const column> &owner,
+                const column &c, ArrowArray *out) {
+            auto data = new array_data();
+            data->owner = owner;
+
+            const void *validity = c.null_count ? buffer(c.validity) : nullptr;
+            int64_t n_buffers;
+            switch (c.type) {
+                case kind::null:
+                    n_buffers = 0;
+                    break;
+                case kind::object:
+                    n_buffers = 1;
+                    data->buffers[0] = validity;
+                    break;
+                case kind::list:
+                    n_buffers = 2;
+                    data->buffers[0] = validity;
+                    data->buffers[1] = buffer(c.offsets);
+                    break;
+                case kind::string:
+                    n_buffers = 3;
+                    data->buffers[0] = validity;
+                    data->buffers[1] = buffer(c.offsets);
+                    data->buffers[2] = buffer(c.values);
+                    break;
+                default:
+                    n_buffers = 2;
+                    data->buffers[0] = validity;
+                    data->buffers[1] = buffer(c.values);
+                    break;
+            }
+
+            data->children.resize(c.children.size());
+            for (size_t i = 0; i < c.children.size(); i++) {
+                export_array(owner, c.children[i], &data->children[i]);
+                data->child_pointers.push_back(&data->children[i]);
+            }
+
+            out->length = c.length;
+            out->null_count = c.null_count;
+            out->offset = 0;
+            out->n_buffers = n_buffers;
+            out->n_children = int64_t(c.children.size());
+            out->buffers = data->buffers;
+            out->children = data->child_pointers.data();
+            out->dictionary = nullptr;
+            out->release = release_array;
+            out->private_data = data;
+        }
+
+        inline void release_schema_capsule(PyObject *capsule) {
+            auto schema = static_cast<ArrowSchema *>(
+                PyCapsule_GetPointer(capsule, "arrow_schema")
+            );
+            if (schema->release) schema->release(schema);
+            delete schema;
+        }
+
+        inline void release_array_capsule(PyObject *capsule) {
+            auto array = static_cast<ArrowArray *>(
+                PyCapsule_GetPointer(capsule, "arrow_array")
+            );
+            if (array->release) array->release(array);
+            delete array;
+        }
+    }
+
+    typedef std::shared_ptr<const arrow_export::column> arrow_column;
+
+    inline int64_t arrow_column_length(const arrow_column &c) {
+        return c->length;
+    }
+
+    // Build an Arrow column from the array at `ref`, one row per element.
+    // Returns an empty pointer and sets `error` if the elements can't be
+    // represented by a single Arrow type. Doesn't require the GIL.
+    inline arrow_column build_arrow_column(
+            const simdjson::internal::tape_ref &ref, std::string &error) {
+        using namespace arrow_export;
+        source src{ref.doc->tape.get(), ref.doc->string_buf.get()};
+        size_t i = ref.json_index;
+        size_t end = uint32_t(src.tape[i]) - 1;
+
+        try {
+            auto root = std::make_shared<column>();
+            conflict found;
+            size_t n = 0;
+            for (size_t j = i + 1; j < end; j = next_index(src.tape, j)) {
+                if (!infer(*root, src, j, found)) {
+                    found.path.push_back(std::to_string(n));
+                    error = "Can't store a value of type ";
+                    error += kind_name(found.found);
+                    error += " at ";
+                    for (auto p = found.path.rbegin(); p != found.path.rend();
+                            ++p) {
+                        error += "/" + *p;
+                    }
+                    error += " in an Arrow column of type ";
+                    error += kind_name(found.expected);
+                    error += ".";
+                    return nullptr;
+                }
+                n++;
+            }
+
+            choose_offsets(*root);
+            start(*root);
+            for (size_t j = i + 1; j < end; j = next_index(src.tape, j)) {
+                append(*root, src, j);
+            }
+            finish(*root);
+            return root;
+        } catch (const std::bad_alloc &) {
+            error = "";
+            return nullptr;
+        }
+    }
+
+    inline PyObject *arrow_schema_capsule(const arrow_column &c) {
+        auto schema = new ArrowSchema();
+        arrow_export::export_schema(c, *c, "", schema);
+        PyObject *capsule = PyCapsule_New(
+            schema,
+            "arrow_schema",
+            arrow_export::release_schema_capsule
+        );
+        if (!capsule) {
+            schema->release(schema);
+            delete schema;
+        }
+        return capsule;
+    }
+
+    inline PyObject *arrow_array_capsule(const arrow_column &c) {
+        auto array = new ArrowArray();
+        arrow_export::export_array(c, *c, array);
+        PyObject *capsule = PyCapsule_New(
+            array,
+            "arrow_array",
+            arrow_export::release_array_capsule
+        );
+        if (!capsule) {
+            array->release(array);
+            delete array;
+        }
+        return capsule;
+    }
+#endif
@@ -0,0 +1,291 @@
+"""
+A small, reproducible benchmark suite for pysimdjson.
+
+Run it with::
+
+    python -m simdjson.bench [path ...] [--json results.json]
+
+Each path may be a JSON file or a directory of them (by default,
+``jsonexamples/``). Every file is run through a series of operations, and
+the results are compared against the built-in `json` module and `orjson`
+when it is installed.
+"""
+import argparse
+import contextlib
+import json
+import mmap
+import os
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import simdjson
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows.
+    resource = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _first_pointer(doc):
+    """Returns a JSON pointer to the first child of `doc`, or None."""
+    if isinstance(doc, simdjson.Object):
+        for key in doc:
+            return '/' + key.replace('~', '~0').replace('/', '~1')
+    elif isinstance(doc, simdjson.Array) and len(doc):
+        return '/0'
+    return None
+
+
+@contextlib.contextmanager
+def operations(content):
+    """
+    A context manager giving a dict of ``{name: callable}`` for all of the
+    operations that apply to the document `content`.
+    """
+    parser = simdjson.Parser()
+
+    # The same document as each of the input types Parser.parse() accepts.
+    text = content.decode('utf-8')
+    array = bytearray(content)
+    view = memoryview(content)
+    padded = content + b' ' * simdjson.PADDING
+
+    with mmap.mmap(-1, len(content)) as mapped:
+        mapped.write(content)
+
+        ops = {
+            'parse': lambda: parser.parse(content),
+            'parse_str': lambda: parser.parse(text),
+            'parse_bytearray': lambda: parser.parse(array),
+            'parse_memoryview': lambda: parser.parse(view),
+            'parse_mmap': lambda: parser.parse(mapped),
+            'parse_padded': lambda: parser.parse(padded, length=len(content)),
+            'parse_recursive': lambda: parser.parse(content, True),
+            'loads': lambda: simdjson.loads(content),
+            'minify': lambda: simdjson.minify(content),
+            'json.loads': lambda: json.loads(content),
+        }
+
+        if orjson is not None:
+            ops['orjson.loads'] = lambda: orjson.loads(content)
+
+        # The remaining operations work on an already-parsed document, which
+        # we keep alive for the lifetime of the benchmark.
+        doc = simdjson.Parser().parse(content)
+        if isinstance(doc, (simdjson.Object, simdjson.Array)):
+            ops['mini'] = lambda: doc.mini
+
+            pointer = _first_pointer(doc)
+            if pointer is not None:
+                ops['at_pointer'] = lambda: doc.at_pointer(pointer)
+
+        if isinstance(doc, simdjson.Array):
+            try:
+                doc.as_buffer(of_type='d')
+            except (TypeError, ValueError):
+                pass
+            else:
+                ops['as_buffer'] = lambda: doc.as_buffer(of_type='d')
+
+        yield ops
+
+
+def measure(fn, *, repeat=5, number=None):
+    """
+    Time `fn`, returning a dict of results for a single call.
+
+    Memory is reported as both the number of `allocations` still alive when
+    `fn` returns, and the peak number of bytes allocated during the call,
+    `alloc_peak_bytes`.
+
+    If `number` is not given, it's picked automatically so each timing run
+    takes at least 0.2 seconds.
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    # Measured separately, since tracing has a significant overhead of its
+    # own.
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    # The number of memory blocks still allocated when the call returns,
+    # which is mostly what its result is made of.
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__)
+    ])
+    allocations = sum(stat.count for stat in snapshot.statistics('filename'))
+
+    return {
+        'seconds': best,
+        'docs_per_second': 1 / best if best else None,
+        'allocations': allocations,
+        'alloc_peak_bytes': peak
+    }
+
+
+def peak_rss():
+    """Returns the peak resident set size of this process in bytes, or None
+    if it is unavailable on this platform."""
+    if resource is None:  # pragma: no cover
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def find_documents(paths):
+    """Expand `paths` into a sorted list of JSON files."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(path.glob('*.json'))
+            found.extend(path.glob('small/*.json'))
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def run(paths, *, repeat=5, number=None, only=None, stream=None):
+    """
+    Run the benchmark suite over `paths`, returning the results as a
+    JSON-serializable dict.
+
+    :param paths: Files or directories of JSON documents.
+    :param repeat: The number of timing runs for each operation.
+    :param number: The number of calls in each timing run. [default: auto]
+    :param only: An optional collection of operation names to run.
+    :param stream: If given, a human readable report is written to it as
+                   results become available.
+    """
+    results = {
+        'simdjson': simdjson.VERSION,
+        'implementation': simdjson.Parser().implementation[0],
+        'python': sys.version.split()[0],
+        'orjson': getattr(orjson, '__version__', None),
+        'documents': []
+    }
+
+    for path in find_documents(paths):
+        content = path.read_bytes()
+        try:
+            simdjson.Parser().parse(content)
+        except ValueError as e:
+            if stream:
+                print(f'{path}: skipped ({e})', file=stream)
+            continue
+
+        entry = {
+            'path': str(path),
+            'size': len(content),
+            'operations': {}
+        }
+
+        if stream:
+            print(f'{path} ({len(content)} bytes)', file=stream)
+
+        with operations(content) as ops:
+            for name, fn in ops.items():
+                if only and name not in only:
+                    continue
+
+                result = measure(fn, repeat=repeat, number=number)
+                result['gb_per_second'] = (
+                    len(content) / result['seconds'] / 1e9
+                    if result['seconds'] else None
+                )
+                entry['operations'][name] = result
+
+                if stream:
+                    print(
+                        f'  {name:<16}'
+                        f' {result["gb_per_second"] or 0:>8.3f} GB/s'
+                        f' {result["docs_per_second"] or 0:>12.1f} docs/s'
+                        f' {result["allocations"]:>8} allocs'
+                        f' {result["alloc_peak_bytes"]:>12} B peak alloc',
+                        file=stream
+                    )
+
+        entry['peak_rss_bytes'] = peak_rss()
+        results['documents'].append(entry)
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m simdjson.bench',
+        description='Benchmark pysimdjson against sample JSON documents.'
+    )
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        default=['jsonexamples'],
+        help='JSON files or directories of JSON files. [default: %(default)s]'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Write machine-readable results to PATH ("-" for stdout).'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of timing runs per operation. [default: %(default)s]'
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=None,
+        help='Number of calls per timing run. [default: auto]'
+    )
+    parser.add_argument(
+        '--only',
+        metavar='OP',
+        action='append',
+        help='Only run the named operation. Can be given multiple times.'
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not os.path.exists(path):
+            parser.error(f'No such file or directory: {path}')
+
+    results = run(
+        args.paths,
+        repeat=args.repeat,
+        number=args.number,
+        only=args.only,
+        stream=None if args.json == '-' else sys.stdout
+    )
+
+    if args.json == '-':
+        json.dump(results, sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, 'w') as out:
+            json.dump(results, out, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,12 @@
 # cython: language_level=3
 # distutils: language=c++
-from libc.stdint cimport uint32_t, uint64_t, int64_t
+from libc.stdint cimport uint8_t, uint32_t, uint64_t, int64_t
 from libcpp.string cimport string
+from libcpp.vector cimport vector
 
 cdef extern from "Python.h":
-    # Correct signature is const, but this was only fixed in Py3.7+
-    cdef char* PyUnicode_AsUTF8AndSize(object, Py_ssize_t *)
+    cdef const char* PyUnicode_AsUTF8AndSize(object, Py_ssize_t *) \
+        except NULL
 
 
 cdef extern from "util.h":
@@ -13,17 +14,115 @@ cdef extern from "util.h":
     cdef void * flatten_array[T](simd_array src) \
         except +simdjson_error_handler
     cdef void set_active_implementation(Implementation *)
+    cdef void set_parser_implementation(simd_parser &, const Implementation *) \
+        except +simdjson_error_handler
+    cdef void allocate_parser(simd_parser &, size_t, size_t) \
+        except +simdjson_error_handler
+    cdef size_t tape_length(const simd_parser &)
+    cdef uint64_t monotonic_ns()
+    cdef object unicode_from_utf8(const char *, size_t)
+    cdef size_t invalid_utf8_offset(const char *, size_t) nogil
+    cdef error_code validate_json(const char *, size_t) nogil
+    cdef size_t validate_json_capacity()
+    cdef error_code start_document_stream(simd_parser &, const char *, size_t,
+                                          simd_stream &) nogil
+
+
+cdef extern from "tape.h":
+    cdef cppclass tape_ref "simdjson::internal::tape_ref":
+        size_t json_index
+        size_t after_element()
+
+    cdef cppclass tape_number:
+        pass
+
+    cdef tape_ref get_tape_ref(simd_element)
+    cdef tape_ref get_tape_ref(simd_array)
+    cdef tape_ref get_tape_ref(simd_object)
+    cdef void write_tape(const tape_ref &, const char *) \
+        except +simdjson_error_handler
+    cdef size_t saved_tape_size(const tape_ref &)
+    cdef void copy_saved_tape(const tape_ref &, uint8_t *) nogil
+    cdef simd_element attach_tape(simd_parser &, const uint8_t *, size_t) \
+        except +simdjson_error_handler
+    cdef void release_tape(simd_parser &)
+    cdef uint64_t tape_digest(const tape_ref &, bint)
+    cdef bint tape_equal(const tape_ref &, const tape_ref &)
+    cdef tape_number number_from_int(bint, uint64_t)
+    cdef tape_number number_from_double(double)
+
+
+cdef extern from "arrow.h":
+    cdef cppclass arrow_column:
+        const void *get()
+
+    cdef arrow_column build_arrow_column(const tape_ref &, string &) nogil
+    cdef int64_t arrow_column_length(const arrow_column &)
+    cdef object arrow_schema_capsule(const arrow_column &)
+    cdef object arrow_array_capsule(const arrow_column &)
+
+
+cdef extern from "filter.h":
+    cdef cppclass tape_predicate:
+        bint operator bool()
+
+    cdef tape_predicate predicate_null(const vector[string] &, int)
+    cdef tape_predicate predicate_bool(const vector[string] &, int, bint)
+    cdef tape_predicate predicate_int(const vector[string] &, int, bint,
+                                      uint64_t)
+    cdef tape_predicate predicate_float(const vector[string] &, int, double)
+    cdef tape_predicate predicate_string(const vector[string] &, int,
+                                         const string &)
+    cdef tape_predicate predicate_combine(int, const tape_predicate &,
+                                          const tape_predicate &)
+    cdef vector[size_t] filter_array(const tape_ref &,
+                                     const tape_predicate &) nogil
+
+
+cdef extern from "schema.h":
+    cdef cppclass schema_node:
+        bint operator bool()
+
+    cdef schema_node schema_new()
+    cdef void schema_reject(const schema_node &)
+    cdef void schema_add_type(const schema_node &, uint32_t)
+    cdef void schema_add_null(const schema_node &)
+    cdef void schema_add_bool(const schema_node &, bint)
+    cdef void schema_add_number(const schema_node &, const tape_number &)
+    cdef void schema_add_string(const schema_node &, const string &)
+    cdef void schema_set_enum(const schema_node &)
+    cdef void schema_set_bound(const schema_node &, int, const tape_number &,
+                               const string &)
+    cdef void schema_set_limit(const schema_node &, int, int64_t)
+    cdef void schema_add_required(const schema_node &, const string &)
+    cdef void schema_add_property(const schema_node &, const string &,
+                                  const schema_node &)
+    cdef void schema_set_additional(const schema_node &, const schema_node &)
+    cdef void schema_set_items(const schema_node &, const schema_node &)
+    cdef bint schema_validate(const schema_node &, const tape_ref &, string &,
+                              string &) nogil
 
 
 cdef extern from "simdjson.h" namespace "simdjson":
     cdef size_t SIMDJSON_MAXSIZE_BYTES
     cdef size_t SIMDJSON_PADDING
+    cdef size_t DEFAULT_MAX_DEPTH
     cdef enum:
         SIMDJSON_VERSION_MAJOR
         SIMDJSON_VERSION_MINOR
         SIMDJSON_VERSION_REVISION
 
-    cdef string minify[T](T) except +simdjson_error_handler
+    cdef string minify_element "simdjson::minify"[T](T) \
+        except +simdjson_error_handler
+
+    cdef enum error_code:
+        SUCCESS
+        UTF8_ERROR
+
+    const char *error_message(error_code)
+    bint simd_validate_utf8 "simdjson::validate_utf8"(const char *, size_t) nogil
+    error_code simd_minify "simdjson::minify"(const char *, size_t, char *,
+                                              size_t &) nogil
 
     cdef cppclass Implementation "simdjson::implementation":
         const string &name()
@@ -58,6 +157,17 @@ cdef extern from "simdjson.h" namespace "simdjson::dom::element_type":
 
 
 cdef extern from "simdjson.h" namespace "simdjson::dom":
+    cdef cppclass simd_stream "simdjson::dom::document_stream":
+        cppclass iterator:
+            iterator()
+
+            iterator operator++()
+            bint operator!=(iterator)
+            simd_element operator*() except +simdjson_error_handler
+
+        simd_stream.iterator begin() nogil
+        simd_stream.iterator end()
+
     cdef cppclass simd_array "simdjson::dom::array":
         cppclass iterator:
             iterator()
@@ -117,3 +227,7 @@ cdef extern from "simdjson.h" namespace "simdjson::dom":
         simd_element parse(const char *, size_t, bint) \
             except +simdjson_error_handler
         simd_element load(const char *) except +simdjson_error_handler
+
+        size_t capacity()
+        size_t max_capacity()
+        size_t max_depth()
@@ -1,20 +1,50 @@
 # cython: language_level=3, c_string_type=unicode, c_string_encoding=utf8
 # distutils: language=c++
+import collections
+import functools
+import mmap
+import os
 import pathlib
+import queue
+import sys
+import threading
+import timeit
 
+cimport cython
 from cython.operator cimport preincrement, dereference  # noqa
 from libcpp.memory cimport shared_ptr, make_shared
+from libcpp.vector cimport vector
 from cpython.ref cimport Py_INCREF
-from cpython.list cimport PyList_New, PyList_SET_ITEM
-from cpython.bytes cimport PyBytes_AsStringAndSize
+from cpython.dict cimport PyDict_SetItem
+from cpython.list cimport PyList_Append, PyList_New, PyList_SET_ITEM
+from cpython.object cimport PyObject_RichCompare
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.bytes cimport (
+    PyBytes_AS_STRING,
+    PyBytes_AsStringAndSize,
+    PyBytes_FromStringAndSize
+)
 from cpython.slice cimport PySlice_GetIndicesEx, PySlice_New
 from cpython.mem cimport PyMem_Free
-from cpython.buffer cimport PyBuffer_FillInfo
+from cpython.buffer cimport (
+    PyBuffer_FillInfo,
+    PyBuffer_Release,
+    PyObject_GetBuffer,
+    PyBUF_SIMPLE,
+    PyBUF_WRITABLE
+)
+from libc.string cimport memset
+from libc.math cimport INFINITY, isfinite
 
 from simdjson.csimdjson cimport *  # noqa
 
 MAXSIZE_BYTES = SIMDJSON_MAXSIZE_BYTES
 PADDING = SIMDJSON_PADDING
+cdef enum:
+    # Arrays are only indexed for random access once an element past this
+    # position is requested.
+    MIN_INDEXED_ACCESS = 8
+
 VERSION = (
     f'{SIMDJSON_VERSION_MAJOR}.'
     f'{SIMDJSON_VERSION_MINOR}.'
@@ -28,6 +58,12 @@ cdef bytes str_as_bytes(s):
     return s
 
 
+cdef inline object make_key(Parser p, const char *data, size_t size):
+    if p.c_bytes_keys:
+        return PyBytes_FromStringAndSize(data, size)
+    return unicode_from_utf8(data, size)
+
+
 cdef dict object_to_dict(Parser p, simd_object obj, bint recursive):
     cdef:
         dict result = {}
@@ -42,17 +78,25 @@ cdef dict object_to_dict(Parser p, simd_object obj, bint recursive):
         data = it.key_c_str()
         size = it.key_length()
 
-        result[data[:size]] = pyobj
+        result[make_key(p, data, size)] = pyobj
         preincrement(it)
 
+    if p.c_stats_enabled:
+        p.c_stats.strings_created += obj.size()
+
     return result
 
 
 cdef list array_to_list(Parser p, simd_array arr, bint recursive):
     cdef:
-        list result = PyList_New(arr.size())
+        list result
         size_t i = 0
 
+    if arr.size() >= 0xFFFFFF:
+        # The count on the tape saturates, so it can't size the list.
+        return [element_to_primitive(p, element, recursive) for element in arr]
+
+    result = PyList_New(arr.size())
     for element in arr:
         primitive = element_to_primitive(p, element, recursive)
         Py_INCREF(primitive)
@@ -74,17 +118,25 @@ cdef inline object element_to_primitive(Parser p, simd_element e,
         element_type type_ = e.type()
 
     if type_ == element_type.OBJECT:
+        if p.c_stats_enabled:
+            p.c_stats.objects_created += 1
         if recursive:
             return object_to_dict(p, e.get_object(), recursive)
         return Object.from_element(p, e)
     elif type_ == element_type.ARRAY:
+        if p.c_stats_enabled:
+            p.c_stats.objects_created += 1
         if recursive:
             return array_to_list(p, e.get_array(), recursive)
         return Array.from_element(p, e)
     elif type_ == element_type.STRING:
+        if p.c_stats_enabled:
+            p.c_stats.strings_created += 1
         data = e.get_c_str()
         size = e.get_string_length()
-        return data[:size]
+        if p.c_bytes_strings:
+            return PyBytes_FromStringAndSize(data, size)
+        return unicode_from_utf8(data, size)
     elif type_ == element_type.INT64:
         return e.get_int64()
     elif type_ == element_type.UINT64:
@@ -101,6 +153,478 @@ cdef inline object element_to_primitive(Parser p, simd_element e,
         )
 
 
+cdef class _Partial:
+    """
+    Options for converting only part of a document into Python objects.
+
+    Containers nested deeper than `max_depth` (where the outermost
+    container is at depth 1) are left as proxies. Object keys that are in
+    `exclude` are skipped at every depth, and keys that aren't in `include`
+    are skipped in the outermost objects, those not nested inside another
+    object, without visiting their values.
+    """
+    cdef Py_ssize_t c_max_depth
+    cdef frozenset c_include
+    cdef frozenset c_exclude
+    # The options used for the values of an object, which no longer apply
+    # `include`.
+    cdef _Partial c_nested
+
+    def __init__(self, max_depth=None, **filters):
+        # `include` is a reserved word in Cython, so it can't be named as a
+        # parameter.
+        for name in filters:
+            if name not in ('include', 'exclude'):
+                raise TypeError(f'Unexpected option {name!r}.')
+        included = filters.get('include')
+        excluded = filters.get('exclude')
+
+        if max_depth is None:
+            self.c_max_depth = -1
+        elif max_depth < 1:
+            raise ValueError('max_depth must be at least 1.')
+        else:
+            self.c_max_depth = max_depth
+
+        self.c_include = None if included is None else key_set(included)
+        self.c_exclude = None if excluded is None else key_set(excluded)
+
+        if self.c_include is None:
+            self.c_nested = self
+        else:
+            self.c_nested = _Partial.__new__(_Partial)
+            self.c_nested.c_max_depth = self.c_max_depth
+            self.c_nested.c_exclude = self.c_exclude
+            self.c_nested.c_nested = self.c_nested
+
+    cdef inline bint skip(self, key):
+        if self.c_include is not None and key not in self.c_include:
+            return True
+        return self.c_exclude is not None and key in self.c_exclude
+
+
+cdef frozenset key_set(keys):
+    """Returns `keys` as both str and bytes, so they match no matter which
+    `keys` mode the Parser is using."""
+    cdef set result = set()
+
+    if isinstance(keys, (str, bytes)):
+        raise TypeError('Expected a collection of keys, not a single key.')
+
+    for key in keys:
+        if isinstance(key, bytes):
+            result.add(key)
+            result.add((<bytes>key).decode('utf-8'))
+        else:
+            result.add(key)
+            result.add(str_as_bytes(key))
+    return frozenset(result)
+
+
+cdef Py_ssize_t sub_range(Py_ssize_t size, Py_ssize_t offset, length,
+                          Py_ssize_t *sub_size) except -1:
+    """Check the `offset` and `length` of a range within `size` bytes,
+    returning the offset and storing the length of the range in
+    `sub_size`."""
+    if offset < 0 or offset > size:
+        raise ValueError(
+            f'offset must be between 0 and {size}, not {offset}.'
+        )
+
+    if length is None:
+        sub_size[0] = size - offset
+    elif length < 0 or length > size - offset:
+        raise ValueError(
+            f'length must be between 0 and {size - offset}, not {length}.'
+        )
+    else:
+        sub_size[0] = length
+    return offset
+
+
+cdef object as_recursive(recursive):
+    """Returns the `recursive` argument of the Parser methods as either a
+    bool, a :class:`_Partial` or ``'lazy'``."""
+    if isinstance(recursive, bool):
+        return recursive
+    elif isinstance(recursive, dict):
+        return _Partial(**recursive)
+    elif isinstance(recursive, str) and recursive == 'lazy':
+        return 'lazy'
+    raise ValueError(
+        f'recursive must be a bool, a dict of options or \'lazy\', not'
+        f' {recursive!r}.'
+    )
+
+
+cdef object document_to_primitive(Parser p, simd_element document,
+                                  recursive):
+    """Convert the root `document`, where `recursive` was returned by
+    :func:`as_recursive`."""
+    if type(recursive) is _Partial:
+        return partial_to_primitive(p, document, <_Partial>recursive, 1)
+    elif type(recursive) is str:
+        return lazy_value(p, document)
+    return element_to_primitive(p, document, recursive)
+
+
+cdef object partial_to_primitive(Parser p, simd_element e, _Partial options,
+                                 Py_ssize_t depth):
+    cdef element_type type_ = e.type()
+
+    if type_ != element_type.OBJECT and type_ != element_type.ARRAY:
+        return element_to_primitive(p, e, False)
+    if options.c_max_depth >= 0 and depth > options.c_max_depth:
+        return element_to_primitive(p, e, False)
+
+    if p.c_stats_enabled:
+        p.c_stats.objects_created += 1
+    if type_ == element_type.OBJECT:
+        return partial_object_to_dict(p, e.get_object(), options, depth)
+    return partial_array_to_list(p, e.get_array(), options, depth)
+
+
+cdef dict partial_object_to_dict(Parser p, simd_object obj, _Partial options,
+                                 Py_ssize_t depth):
+    cdef:
+        dict result = {}
+        simd_object.iterator it = obj.begin()
+
+    while it != obj.end():
+        key = make_key(p, it.key_c_str(), it.key_length())
+        if not options.skip(key):
+            result[key] = partial_to_primitive(
+                p,
+                it.value(),
+                options.c_nested,
+                depth + 1
+            )
+        preincrement(it)
+
+    if p.c_stats_enabled:
+        p.c_stats.strings_created += obj.size()
+
+    return result
+
+
+cdef list partial_array_to_list(Parser p, simd_array arr, _Partial options,
+                                Py_ssize_t depth):
+    cdef:
+        list result
+        size_t i = 0
+
+    if arr.size() >= 0xFFFFFF:
+        # The count on the tape saturates, so it can't size the list.
+        return [
+            partial_to_primitive(p, element, options, depth + 1)
+            for element in arr
+        ]
+
+    result = PyList_New(arr.size())
+    for element in arr:
+        primitive = partial_to_primitive(p, element, options, depth + 1)
+        Py_INCREF(primitive)
+        PyList_SET_ITEM(result, i, primitive)
+        i += 1
+
+    return result
+
+
+cdef object lazy_value(Parser p, simd_element e):
+    """Convert `e`, creating a :class:`LazyDict` or :class:`LazyList` for
+    containers."""
+    cdef element_type type_ = e.type()
+
+    if type_ == element_type.OBJECT:
+        if p.c_stats_enabled:
+            p.c_stats.objects_created += 1
+        return LazyDict.from_object(p, e.get_object())
+    elif type_ == element_type.ARRAY:
+        if p.c_stats_enabled:
+            p.c_stats.objects_created += 1
+        return LazyList.from_array(p, e.get_array())
+    return element_to_primitive(p, e, False)
+
+
+cdef object lazy_from_proxy(value):
+    """Returns the :class:`LazyDict` or :class:`LazyList` for an
+    :class:`Object` or :class:`Array` proxy, or None for anything else."""
+    if type(value) is Object:
+        return LazyDict.from_object(
+            (<Object>value).parser,
+            (<Object>value).c_element
+        )
+    elif type(value) is Array:
+        return LazyList.from_array(
+            (<Array>value).parser,
+            (<Array>value).c_element
+        )
+    return None
+
+
+cdef object plain_value(value):
+    """Returns `value`, with a :class:`LazyDict` or :class:`LazyList`
+    converted into a real dict or list."""
+    if type(value) is LazyDict:
+        return lazy_dict_to_dict(<LazyDict>value)
+    elif type(value) is LazyList:
+        return lazy_list_to_list(<LazyList>value)
+    return value
+
+
+cdef dict lazy_dict_to_dict(LazyDict obj):
+    obj.resolve()
+    return {
+        key: plain_value(value)
+        for key, value in dict.items(obj)
+    }
+
+
+cdef list lazy_list_to_list(LazyList arr):
+    return [plain_value(value) for value in list.__iter__(arr)]
+
+
+cdef int materialize_value(value) except -1:
+    if type(value) is LazyDict:
+        (<LazyDict>value).materialize()
+    elif type(value) is LazyList:
+        for child in list.__iter__(value):
+            materialize_value(child)
+    return 0
+
+
+cdef class LazyDict(dict):
+    """
+    A real `dict` returned by ``Parser.parse(..., recursive='lazy')``, whose
+    nested objects and arrays are only converted from the parsed document
+    the first time they're accessed.
+
+    Creating a LazyDict converts all of its keys and its other values, just
+    like a `dict` from ``recursive=True``, so only the containers inside it
+    are deferred. These become a :class:`LazyDict` or :class:`LazyList` when
+    they're first read through any of its methods, including by
+    :func:`json.dumps`. Before any modification, the dict and everything
+    inside it is fully converted.
+
+    .. admonition::
+       :class: warning
+
+       Until every nested container has been accessed, the Parser can't be
+       re-used. Code that reads the underlying dict directly with the C-API,
+       bypassing its methods, sees a container that hasn't been accessed
+       yet as an :class:`Object` or :class:`Array` proxy.
+    """
+    # The number of values that are still Object or Array proxies.
+    cdef Py_ssize_t c_pending
+    cdef bint c_complete
+
+    @staticmethod
+    cdef LazyDict from_object(Parser parser, simd_object src):
+        cdef:
+            LazyDict self = LazyDict.__new__(LazyDict)
+            simd_object.iterator it = src.begin()
+            element_type type_
+
+        while it != src.end():
+            type_ = it.value().type()
+            if (type_ == element_type.OBJECT
+                    or type_ == element_type.ARRAY):
+                self.c_pending += 1
+            PyDict_SetItem(
+                self,
+                make_key(parser, it.key_c_str(), it.key_length()),
+                element_to_primitive(parser, it.value(), False)
+            )
+            preincrement(it)
+
+        if parser.c_stats_enabled:
+            parser.c_stats.strings_created += src.size()
+
+        return self
+
+    cdef object resolve_item(self, key, value):
+        """Returns `value`, found at `key`, replacing it first if it's a
+        container that hasn't been accessed yet."""
+        cdef object lazy
+
+        if not self.c_pending:
+            return value
+
+        lazy = lazy_from_proxy(value)
+        if lazy is None:
+            return value
+
+        PyDict_SetItem(self, key, lazy)
+        self.c_pending -= 1
+        return lazy
+
+    cdef int resolve(self) except -1:
+        """Replace every container that hasn't been accessed yet."""
+        if not self.c_pending:
+            return 0
+        for key, value in list(dict.items(self)):
+            self.resolve_item(key, value)
+        return 0
+
+    cdef int materialize(self) except -1:
+        """Convert this object and everything inside of it."""
+        if self.c_complete:
+            return 0
+        self.resolve()
+        for value in dict.values(self):
+            materialize_value(value)
+        self.c_complete = True
+        return 0
+
+    def as_dict(self):
+        """
+        Convert this object and everything inside of it into a regular
+        python dictionary.
+        """
+        return lazy_dict_to_dict(self)
+
+    def __getitem__(self, key):
+        return self.resolve_item(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Overriding this makes dict(), update() and ** fetch values with
+        # __getitem__ instead of copying the underlying dict.
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self.resolve()
+        if type(other) is LazyDict:
+            (<LazyDict>other).resolve()
+        return dict.__eq__(self, other)
+
+    def __or__(self, other):
+        if not isinstance(self, LazyDict):
+            return NotImplemented
+        (<LazyDict>self).resolve()
+        return dict.__or__(self, other)
+
+    def __repr__(self):
+        self.resolve()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        self.resolve()
+        return dict, (dict.copy(self),)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self):
+        self.resolve()
+        return dict.values(self)
+
+    def items(self):
+        self.resolve()
+        return dict.items(self)
+
+    def copy(self):
+        """Returns a shallow copy of this object as a `dict`."""
+        self.resolve()
+        return dict.copy(self)
+
+    def __setitem__(self, key, value):
+        self.materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.materialize()
+        dict.__delitem__(self, key)
+
+    def __ior__(self, other):
+        self.materialize()
+        dict.update(self, other)
+        return self
+
+    def clear(self):
+        self.materialize()
+        dict.clear(self)
+
+    def pop(self, *args):
+        self.materialize()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.materialize()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self.materialize()
+        dict.update(self, *args, **kwargs)
+
+
+cdef class LazyList(list):
+    """
+    A real `list` returned by ``Parser.parse(..., recursive='lazy')``.
+
+    Many consumers, such as :func:`json.dumps`, read the elements of a
+    `list` directly instead of through its methods, so a LazyList converts
+    everything inside it as soon as it's created. Only the contents of
+    objects inside it are deferred, as a :class:`LazyDict`, which makes an
+    array of arrays as expensive as ``recursive=True``.
+    """
+    @staticmethod
+    cdef LazyList from_array(Parser parser, simd_array src):
+        cdef LazyList self = LazyList.__new__(LazyList)
+
+        for element in src:
+            PyList_Append(self, lazy_value(parser, element))
+
+        return self
+
+    def as_list(self):
+        """
+        Convert this array and everything inside of it into a regular
+        python list.
+        """
+        return lazy_list_to_list(self)
+
+    def __reduce__(self):
+        return list, (list.copy(self),)
+
+
+cdef inline object element_to_int(simd_element e):
+    cdef element_type type_ = e.type()
+
+    if type_ == element_type.INT64:
+        return e.get_int64()
+    elif type_ == element_type.UINT64:
+        return e.get_uint64()
+    raise TypeError('INCORRECT_TYPE: The JSON element is not an integer.')
+
+
+cdef inline double element_to_float(simd_element e) except? -1:
+    # Unlike get_double(), don't silently accept bools.
+    cdef element_type type_ = e.type()
+
+    if type_ == element_type.DOUBLE:
+        return e.get_double()
+    elif type_ == element_type.INT64:
+        return <double>e.get_int64()
+    elif type_ == element_type.UINT64:
+        return <double>e.get_uint64()
+    raise TypeError('INCORRECT_TYPE: The JSON element is not a number.')
+
+
+cdef inline str element_to_str(simd_element e):
+    return unicode_from_utf8(e.get_c_str(), e.get_string_length())
+
+
+cdef inline bytes element_to_bytes(simd_element e):
+    return PyBytes_FromStringAndSize(e.get_c_str(), e.get_string_length())
+
+
 cdef class ArrayBuffer:
     """
     A container for the flattened data of a homogeneous :class:`Array`.
@@ -154,6 +678,65 @@ cdef class ArrayBuffer:
         pass
 
 
+cdef class ArrowColumn:
+    """
+    An Apache Arrow column copied from an :class:`Array`.
+
+    .. admonition::
+        :class: note
+
+        This object owns its memory, and is safe to use even after the Array
+        or Parser are destroyed or reused. It can be exported any number of
+        times.
+
+    .. admonition::
+       :class: warning
+
+       You should never create this class on your own. It is created and
+       returned for you by :func:`Array.to_arrow`.
+    """
+    cdef arrow_column c_column
+
+    @staticmethod
+    cdef inline from_element(simd_array src):
+        cdef:
+            ArrowColumn self = ArrowColumn.__new__(ArrowColumn)
+            tape_ref ref = get_tape_ref(src)
+            string error
+
+        with nogil:
+            self.c_column = build_arrow_column(ref, error)
+
+        if self.c_column.get() == NULL:
+            if error.empty():
+                raise MemoryError()  # pragma: no cover
+            raise TypeError(error)
+
+        return self
+
+    def __len__(self):
+        return arrow_column_length(self.c_column)
+
+    def __arrow_c_schema__(self):
+        """
+        Export the type of this column as an ``arrow_schema`` PyCapsule.
+        """
+        return arrow_schema_capsule(self.c_column)
+
+    def __arrow_c_array__(self, requested_schema=None):
+        """
+        Export this column as a pair of ``arrow_schema`` and ``arrow_array``
+        PyCapsules.
+
+        :param requested_schema: Ignored, the column is always exported with
+                                 its inferred type.
+        """
+        return (
+            arrow_schema_capsule(self.c_column),
+            arrow_array_capsule(self.c_column)
+        )
+
+
 cdef class Array:
     """A proxy object that behaves much like a real `list()`.
 
@@ -165,6 +748,7 @@ cdef class Array:
     cdef readonly Parser parser
     cdef simd_array c_element
     cdef shared_ptr[simd_parser] c_parser
+    cdef vector[simd_element] c_index
 
     @staticmethod
     cdef inline from_element(Parser parser, simd_element src):
@@ -183,18 +767,21 @@ cdef class Array:
         if isinstance(key, slice):
             PySlice_GetIndicesEx(
                 key,
-                self.c_element.size(),
+                self._size(),
                 &start,
                 &stop,
                 &step,
                 &slice_length
             )
 
+            if slice_length:
+                self._build_index()
+
             result = PyList_New(slice_length)
             for dst, src in enumerate(range(start, stop, step)):
                 primitive = element_to_primitive(
                     self.parser,
-                    self.c_element.at(src),
+                    self.c_index[src],
                     True
                 )
                 Py_INCREF(primitive)
@@ -205,25 +792,118 @@ cdef class Array:
                 )
 
             return result
-        elif isinstance(key, int):
-            # Wrap around negative indexes.
-            if key < 0:
-                key += self.c_element.size()
 
-        return element_to_primitive(self.parser, self.c_element.at(key))
+        return element_to_primitive(self.parser, self._at(key))
+
+    cdef inline void _build_index(self):
+        """
+        Record the position of every element in this Array in a single pass,
+        so that random access is O(1) instead of walking the Array from the
+        start every time.
+        """
+        if not self.c_index.empty():
+            return
+
+        self.c_index.reserve(self.c_element.size())
+        for element in self.c_element:
+            self.c_index.push_back(element)
+
+    cdef inline Py_ssize_t _size(self):
+        """
+        The number of elements in this Array.
+
+        The count stored on the tape saturates at 0xFFFFFF, so larger
+        Arrays are counted by building the index.
+        """
+        cdef Py_ssize_t size = self.c_element.size()
+        if size < 0xFFFFFF:
+            return size
+
+        self._build_index()
+        return self.c_index.size()
+
+    cdef inline simd_element _at(self, Py_ssize_t index) except *:
+        cdef Py_ssize_t size = self._size()
+
+        # Wrap around negative indexes.
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError('INDEX_OUT_OF_BOUNDS: Attempted to access an'
+                             ' element of a JSON array that is beyond its'
+                             ' length')
+
+        if self.c_index.empty():
+            # Building the index isn't worth it if we only ever look at
+            # the start of the Array.
+            if index < MIN_INDEXED_ACCESS:
+                return self.c_element.at(index)
+            self._build_index()
+
+        return self.c_index[index]
 
     def __len__(self):
-        return self.c_element.size()
+        return self._size()
+
+    def get_int(self, Py_ssize_t index):
+        """
+        Get the integer at `index`, without the overhead of checking for
+        every possible type.
+
+        :raises TypeError: If the element is not an integer.
+        """
+        return element_to_int(self._at(index))
+
+    def get_float(self, Py_ssize_t index):
+        """
+        Get the number at `index` as a float.
+
+        :raises TypeError: If the element is not a number.
+        """
+        return element_to_float(self._at(index))
+
+    def get_bool(self, Py_ssize_t index):
+        """
+        Get the boolean at `index`.
+
+        :raises TypeError: If the element is not a boolean.
+        """
+        return self._at(index).get_bool()
+
+    def get_str(self, Py_ssize_t index):
+        """
+        Get the string at `index`.
+
+        :raises TypeError: If the element is not a string.
+        """
+        return element_to_str(self._at(index))
+
+    def get_bytes(self, Py_ssize_t index):
+        """
+        Get the string at `index` as raw UTF-8 encoded bytes, skipping
+        decoding.
+
+        :raises TypeError: If the element is not a string.
+        """
+        return element_to_bytes(self._at(index))
 
     def __iter__(self):
-        cdef simd_array.iterator it = self.c_element.begin()
-        while it != self.c_element.end():
-            yield element_to_primitive(
-                self.parser,
-                dereference(it),
-                False
-            )
-            preincrement(it)
+        return ArrayIterator.create(self, 0, False)
+
+    def iter_chunks(self, Py_ssize_t size, *, bint recursive=True):
+        """
+        Returns an iterator over this Array in lists of up to `size`
+        elements. Converting a whole chunk at a time is faster than
+        iterating over one element at a time.
+
+        :param size: The maximum number of elements in each chunk.
+        :param recursive: Recursively turn elements into real python
+                          objects, like slicing an Array does, instead of
+                          pysimdjson proxies. [default: True]
+        """
+        if size < 1:
+            raise ValueError('size must be at least 1.')
+        return ArrayIterator.create(self, size, recursive)
 
     def at_pointer(self, json_pointer):
         """Get the value at the given JSON pointer."""
@@ -234,12 +914,33 @@ cdef class Array:
             )
         )
 
-    def as_list(self):
+    def as_list(self, *, max_depth=None, **filters):
         """
         Convert this Array to a regular python list, recursively
         converting any objects/lists it finds.
+
+        Parts of the Array can be left unconverted, which is much faster
+        when only some of it is needed.
+
+        :param max_depth: Objects and lists nested more than `max_depth`
+                          levels deep, counting this Array as level 1, are
+                          returned as proxies instead. [default: None]
+        :param include: If given, only keep object keys in this collection.
+                        Applies to the outermost objects, those not nested
+                        inside another object. [default: None]
+        :param exclude: Skip object keys in this collection, without visiting
+                        their values. Applies at every depth.
+                        [default: None]
         """
-        return array_to_list(self.parser, self.c_element, True)
+        if max_depth is None and not filters:
+            return array_to_list(self.parser, self.c_element, True)
+
+        return partial_array_to_list(
+            self.parser,
+            self.c_element,
+            _Partial(max_depth, **filters),
+            1
+        )
 
     def as_buffer(self, *, of_type):
         """
@@ -262,44 +963,190 @@ cdef class Array:
         """
         return ArrayBuffer.from_element(self.c_element, of_type)
 
-    @property
-    def mini(self):
+    def filter(self, *predicate, bint indices=False, bint recursive=False):
         """
-        Returns the minified JSON representation of this Array.
+        Returns the elements of this Array that match a :class:`Predicate`.
+        The predicate is evaluated directly on the parsed document, so no
+        Python objects are created for elements that don't match::
 
-        :rtype: bytes
-        """
-        return <bytes>minify(self.c_element)
+            >>> doc = parser.parse(b'[{"level": "error"}, {"level": "info"}]')
+            >>> doc.filter('/level', '==', 'error', recursive=True)
+            [{'level': 'error'}]
 
+        Either pass a :class:`Predicate`, or the `pointer`, `op` and `value`
+        to create one.
 
-cdef class Object:
-    """A proxy object that behaves much like a real `dict()`.
+        :param indices: Return the indexes of matching elements instead of
+                        the elements themselves. [default: False]
+        :param recursive: Recursively turn matching elements into real
+                          python objects instead of pysimdjson proxies.
+                          [default: False]
+        """
+        cdef:
+            Predicate condition
+            vector[size_t] matches
+            tape_ref ref = get_tape_ref(self.c_element)
+            simd_array.iterator it = self.c_element.begin()
+            size_t i, position = 0
+            list result
 
-    Python objects are not created until an element in the Object
-    is accessed. When you only need a subset of an Object, this can be much
-    faster than converting an entire Object (and all of its children) into real
-    Python objects.
-    """
-    cdef readonly Parser parser
-    cdef simd_object c_element
-    cdef shared_ptr[simd_parser] c_parser
+        if len(predicate) == 1 and isinstance(predicate[0], Predicate):
+            condition = predicate[0]
+        elif len(predicate) == 3:
+            condition = Predicate(*predicate)
+        else:
+            raise TypeError(
+                'Expected a Predicate, or a pointer, op and value.'
+            )
+        condition.check()
 
-    @staticmethod
-    cdef inline from_element(Parser parser, simd_element src):
-        cdef Object self = Object.__new__(Object)
-        self.parser = parser
-        self.c_element = src.get_object()
-        self.c_parser = parser.c_parser
-        return self
+        with nogil:
+            matches = filter_array(ref, condition.c_predicate)
 
-    def __getitem__(self, key):
-        return element_to_primitive(
-            self.parser,
-            self.c_element[str_as_bytes(key)]
-        )
+        if indices:
+            return matches
 
-    def get(self, key, default=None):
-        """
+        result = PyList_New(matches.size())
+        for i in range(matches.size()):
+            while position < matches[i]:
+                preincrement(it)
+                position += 1
+
+            value = element_to_primitive(
+                self.parser,
+                dereference(it),
+                recursive
+            )
+            Py_INCREF(value)
+            PyList_SET_ITEM(result, i, value)
+
+        return result
+
+    def to_arrow(self):
+        """
+        **Copies** the contents of this Array into Apache Arrow columnar
+        memory, with one row for each element, without creating any Python
+        objects.
+
+        The returned :class:`ArrowColumn` implements the `Arrow PyCapsule
+        Interface`_, so it can be given directly to pyarrow, polars,
+        duckdb and other Arrow consumers::
+
+            >>> import pyarrow
+            >>> doc = parser.parse(b'[{"a": 1}, {"a": 2.5, "b": ["x"]}]')
+            >>> pyarrow.array(doc.to_arrow())
+            <pyarrow.lib.StructArray object at ...>
+            -- is_valid: all not null
+            -- child 0 type: double
+            ...
+
+        The column type is inferred from the elements. `null` is allowed
+        anywhere, objects become structs whose missing fields are null, and
+        mixed integers and floats become doubles. Any other mix of types
+        raises a :class:`TypeError`.
+
+        .. _Arrow PyCapsule Interface:
+            https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html
+        """
+        return ArrowColumn.from_element(self.c_element)
+
+    def save_tape(self, path):
+        """
+        Save this Array to the file system path `path` in a binary format,
+        which can be loaded again with :func:`Parser.load_tape` without
+        any parsing.
+
+        Saved tapes can only be loaded by a build of pysimdjson using the
+        same major version of simdjson, on a platform with the same byte
+        order.
+
+        :param path: A filesystem path.
+        """
+        write_tape(get_tape_ref(self.c_element), os.fsencode(path))
+
+    def share(self):
+        """
+        Copy this Array into a new block of shared memory, in the same
+        format used by :func:`save_tape`. Any other process can then
+        attach to it by name with :func:`Parser.load_shared`, without
+        parsing or copying it, so memory use stays flat no matter how many
+        processes use the document.
+
+        Returns the :class:`multiprocessing.shared_memory.SharedMemory`
+        holding the document. The caller owns it, and must call its
+        ``close()`` and ``unlink()`` methods once it's no longer needed.
+        """
+        return share_tape(get_tape_ref(self.c_element))
+
+    def digest(self, *, bint ignore_order=False):
+        """
+        Returns a stable 64-bit hash of the content of this Array, computed
+        directly from the parsed document without creating any Python
+        objects.
+
+        Numbers are hashed by value, so ``1`` and ``1.0`` have the same
+        digest. The digest is the same across processes and platforms.
+
+        :param ignore_order: Ignore the order of keys in objects.
+                             [default: False]
+        """
+        return tape_digest(get_tape_ref(self.c_element), ignore_order)
+
+    def __eq__(self, other):
+        # Compared directly on the tape, stopping at the first difference.
+        # Like dicts, the order of keys in objects doesn't matter.
+        if isinstance(other, Array):
+            return tape_equal(
+                get_tape_ref(self.c_element),
+                get_tape_ref((<Array>other).c_element)
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        cdef Py_hash_t h = <Py_hash_t>tape_digest(
+            get_tape_ref(self.c_element),
+            True
+        )
+        return -2 if h == -1 else h
+
+    @property
+    def mini(self):
+        """
+        Returns the minified JSON representation of this Array.
+
+        :rtype: bytes
+        """
+        return <bytes>minify_element(self.c_element)
+
+
+cdef class Object:
+    """A proxy object that behaves much like a real `dict()`.
+
+    Python objects are not created until an element in the Object
+    is accessed. When you only need a subset of an Object, this can be much
+    faster than converting an entire Object (and all of its children) into real
+    Python objects.
+    """
+    cdef readonly Parser parser
+    cdef simd_object c_element
+    cdef shared_ptr[simd_parser] c_parser
+
+    @staticmethod
+    cdef inline from_element(Parser parser, simd_element src):
+        cdef Object self = Object.__new__(Object)
+        self.parser = parser
+        self.c_element = src.get_object()
+        self.c_parser = parser.c_parser
+        return self
+
+    def __getitem__(self, key):
+        return element_to_primitive(
+            self.parser,
+            self.c_element[str_as_bytes(key)]
+        )
+
+    def get(self, key, default=None):
+        """
         Return the value of `key`, or `default` if the key does
         not exist.
         """
@@ -308,6 +1155,53 @@ cdef class Object:
         except KeyError:
             return default
 
+    def get_int(self, key):
+        """
+        Get the integer value of `key`, without the overhead of checking
+        for every possible type.
+
+        :raises KeyError: If the key does not exist.
+        :raises TypeError: If the value is not an integer.
+        """
+        return element_to_int(self.c_element[str_as_bytes(key)])
+
+    def get_float(self, key):
+        """
+        Get the numeric value of `key` as a float.
+
+        :raises KeyError: If the key does not exist.
+        :raises TypeError: If the value is not a number.
+        """
+        return element_to_float(self.c_element[str_as_bytes(key)])
+
+    def get_bool(self, key):
+        """
+        Get the boolean value of `key`.
+
+        :raises KeyError: If the key does not exist.
+        :raises TypeError: If the value is not a boolean.
+        """
+        return self.c_element[str_as_bytes(key)].get_bool()
+
+    def get_str(self, key):
+        """
+        Get the string value of `key`.
+
+        :raises KeyError: If the key does not exist.
+        :raises TypeError: If the value is not a string.
+        """
+        return element_to_str(self.c_element[str_as_bytes(key)])
+
+    def get_bytes(self, key):
+        """
+        Get the string value of `key` as raw UTF-8 encoded bytes, skipping
+        decoding.
+
+        :raises KeyError: If the key does not exist.
+        :raises TypeError: If the value is not a string.
+        """
+        return element_to_bytes(self.c_element[str_as_bytes(key)])
+
     def __len__(self):
         return self.c_element.size()
 
@@ -322,46 +1216,28 @@ cdef class Object:
         """
         Returns an iterator over all keys in this `Object`.
         """
-        cdef:
-            size_t size
-            const char *data
-            simd_object.iterator it = self.c_element.begin()
-
-        while it != self.c_element.end():
-            data = it.key_c_str()
-            size = it.key_length()
-            yield data[:size]
-            preincrement(it)
+        return ObjectIterator.create(self, ITER_KEYS, False)
 
     keys = __iter__
 
-    def values(self):
+    def values(self, *, bint recursive=True):
         """
         Returns an iterator over of all values in this `Object`.
+
+        :param recursive: Recursively turn values into real python objects
+                          instead of pysimdjson proxies. [default: True]
         """
-        cdef simd_object.iterator it = self.c_element.begin()
-        while it != self.c_element.end():
-            yield element_to_primitive(self.parser, it.value(), True)
-            preincrement(it)
+        return ObjectIterator.create(self, ITER_VALUES, recursive)
 
-    def items(self):
+    def items(self, *, bint recursive=True):
         """
         Returns an iterator over all the (key, value) pairs in this
         `Object`.
-        """
-        cdef:
-            size_t size
-            const char *data
-            simd_object.iterator it = self.c_element.begin()
 
-        while it != self.c_element.end():
-            data = it.key_c_str()
-            size = it.key_length()
-            yield (
-                data[:size],
-                element_to_primitive(self.parser, it.value(), True)
-            )
-            preincrement(it)
+        :param recursive: Recursively turn values into real python objects
+                          instead of pysimdjson proxies. [default: True]
+        """
+        return ObjectIterator.create(self, ITER_ITEMS, recursive)
 
     def at_pointer(self, json_pointer):
         """Get the value at the given JSON pointer."""
@@ -372,12 +1248,95 @@ cdef class Object:
             )
         )
 
-    def as_dict(self):
+    def as_dict(self, *, max_depth=None, **filters):
         """
         Convert this `Object` to a regular python dictionary,
         recursively converting any objects or lists it finds.
+
+        Parts of the Object can be left unconverted, which is much faster
+        when only some of it is needed::
+
+            >>> doc = parser.parse(b'{"id": 1, "meta": {"a": 2}, "blob": []}')
+            >>> doc.as_dict(max_depth=1, exclude=['blob'])
+            {'id': 1, 'meta': <csimdjson.Object object at ...>}
+
+        :param max_depth: Objects and lists nested more than `max_depth`
+                          levels deep, counting this Object as level 1, are
+                          returned as proxies instead. [default: None]
+        :param include: If given, only keep keys of this Object that are in
+                        this collection. Nested objects keep all of their
+                        keys. [default: None]
+        :param exclude: Skip keys in this collection, without visiting their
+                        values. Applies at every depth. [default: None]
+        """
+        if max_depth is None and not filters:
+            return object_to_dict(self.parser, self.c_element, True)
+
+        return partial_object_to_dict(
+            self.parser,
+            self.c_element,
+            _Partial(max_depth, **filters),
+            1
+        )
+
+    def save_tape(self, path):
+        """
+        Save this Object to the file system path `path` in a binary format,
+        which can be loaded again with :func:`Parser.load_tape` without
+        any parsing.
+
+        Saved tapes can only be loaded by a build of pysimdjson using the
+        same major version of simdjson, on a platform with the same byte
+        order.
+
+        :param path: A filesystem path.
         """
-        return object_to_dict(self.parser, self.c_element, True)
+        write_tape(get_tape_ref(self.c_element), os.fsencode(path))
+
+    def share(self):
+        """
+        Copy this Object into a new block of shared memory, in the same
+        format used by :func:`save_tape`. Any other process can then
+        attach to it by name with :func:`Parser.load_shared`, without
+        parsing or copying it, so memory use stays flat no matter how many
+        processes use the document.
+
+        Returns the :class:`multiprocessing.shared_memory.SharedMemory`
+        holding the document. The caller owns it, and must call its
+        ``close()`` and ``unlink()`` methods once it's no longer needed.
+        """
+        return share_tape(get_tape_ref(self.c_element))
+
+    def digest(self, *, bint ignore_order=False):
+        """
+        Returns a stable 64-bit hash of the content of this Object, computed
+        directly from the parsed document without creating any Python
+        objects.
+
+        Numbers are hashed by value, so ``1`` and ``1.0`` have the same
+        digest. The digest is the same across processes and platforms.
+
+        :param ignore_order: Ignore the order of keys in objects.
+                             [default: False]
+        """
+        return tape_digest(get_tape_ref(self.c_element), ignore_order)
+
+    def __eq__(self, other):
+        # Compared directly on the tape, stopping at the first difference.
+        # Like dicts, the order of keys in objects doesn't matter.
+        if isinstance(other, Object):
+            return tape_equal(
+                get_tape_ref(self.c_element),
+                get_tape_ref((<Object>other).c_element)
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        cdef Py_hash_t h = <Py_hash_t>tape_digest(
+            get_tape_ref(self.c_element),
+            True
+        )
+        return -2 if h == -1 else h
 
     @property
     def mini(self):
@@ -386,9 +1345,572 @@ cdef class Object:
 
         :rtype: bytes
         """
-        return <bytes>minify(self.c_element)
+        return <bytes>minify_element(self.c_element)
+
+
+cdef class ArrayIterator:
+    """
+    An iterator over the elements of an :class:`Array`, or over chunks of
+    them.
+
+    .. admonition::
+       :class: warning
+
+       You should never create this class on your own. It is created and
+       returned for you by iterating over an Array.
+    """
+    cdef Array array
+    cdef simd_array.iterator c_iterator
+    cdef simd_array.iterator c_end
+    # Only a hint, the count on the tape saturates at 0xFFFFFF elements.
+    cdef Py_ssize_t c_remaining
+    cdef Py_ssize_t c_chunk_size
+    cdef bint c_recursive
+
+    @staticmethod
+    cdef ArrayIterator create(Array array, Py_ssize_t chunk_size,
+                              bint recursive):
+        cdef ArrayIterator self = ArrayIterator.__new__(ArrayIterator)
+        self.array = array
+        self.c_iterator = array.c_element.begin()
+        self.c_end = array.c_element.end()
+        self.c_remaining = array.c_element.size()
+        self.c_chunk_size = chunk_size
+        self.c_recursive = recursive
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            Py_ssize_t count = 0
+            list chunk
+
+        if not (self.c_iterator != self.c_end):
+            raise StopIteration
+
+        if self.c_chunk_size == 0:
+            value = element_to_primitive(
+                self.array.parser,
+                dereference(self.c_iterator),
+                self.c_recursive
+            )
+            preincrement(self.c_iterator)
+            if self.c_remaining > 0:
+                self.c_remaining -= 1
+            return value
+
+        chunk = []
+        while count < self.c_chunk_size and self.c_iterator != self.c_end:
+            chunk.append(
+                element_to_primitive(
+                    self.array.parser,
+                    dereference(self.c_iterator),
+                    self.c_recursive
+                )
+            )
+            preincrement(self.c_iterator)
+            count += 1
+        self.c_remaining = max(self.c_remaining - count, 0)
+        return chunk
+
+    def __length_hint__(self):
+        if self.c_chunk_size == 0:
+            return self.c_remaining
+        return (self.c_remaining + self.c_chunk_size - 1) // self.c_chunk_size
+
+
+cdef dict COMPARISONS = {
+    '==': 0,
+    '!=': 1,
+    '<': 2,
+    '<=': 3,
+    '>': 4,
+    '>=': 5
+}
+
+
+cdef vector[string] pointer_tokens(pointer) except *:
+    """Split the JSON pointer `pointer` into unescaped tokens."""
+    cdef vector[string] tokens
+    cdef bytes raw = str_as_bytes(pointer)
+
+    if not raw:
+        return tokens
+    if raw[:1] != b'/':
+        raise ValueError(
+            'INVALID_JSON_POINTER: A JSON pointer must be empty or start'
+            ' with "/"'
+        )
+
+    for token in raw[1:].split(b'/'):
+        tokens.push_back(token.replace(b'~1', b'/').replace(b'~0', b'~'))
+    return tokens
+
+
+cdef class Predicate:
+    """
+    A condition on the elements of an :class:`Array`, for use with
+    :func:`Array.filter`.
+
+    Compares the value at the JSON pointer `pointer`, relative to each
+    element, with `value`. `op` is one of ``==``, ``!=``, ``<``, ``<=``,
+    ``>`` or ``>=``. Predicates can be combined with ``&`` (and), ``|`` (or)
+    and ``~`` (not)::
+
+        >>> errors = Predicate('/level', '==', 'error')
+        >>> slow = Predicate('/duration', '>', 1.5)
+        >>> doc.filter(errors | slow)
+
+    Values that don't exist or have a different type than `value` never
+    match, except with ``!=``. Numbers are compared by value, so ``1`` is
+    equal to ``1.0``, and strings are ordered by their UTF-8 bytes.
+
+    :param pointer: A JSON pointer, such as ``/user/id``. An empty pointer
+                    compares the element itself.
+    :param op: The comparison to make.
+    :param value: A str, bytes, int, float, bool or None.
+    """
+    cdef tape_predicate c_predicate
+
+    def __init__(self, pointer, op, value):
+        cdef:
+            vector[string] path = pointer_tokens(pointer)
+            int comparison
+
+        try:
+            comparison = COMPARISONS[op]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f'op must be one of {", ".join(COMPARISONS)}, not {op!r}.'
+            ) from None
+
+        if value is None or isinstance(value, bool):
+            if comparison > 1:
+                raise ValueError(
+                    f'{value!r} can only be compared with == and !=.'
+                )
+            if value is None:
+                self.c_predicate = predicate_null(path, comparison)
+            else:
+                self.c_predicate = predicate_bool(path, comparison, value)
+        elif isinstance(value, int):
+            if -0xFFFFFFFFFFFFFFFF <= value <= 0xFFFFFFFFFFFFFFFF:
+                self.c_predicate = predicate_int(
+                    path,
+                    comparison,
+                    value < 0,
+                    abs(value)
+                )
+            else:
+                self.c_predicate = predicate_float(path, comparison, value)
+        elif isinstance(value, float):
+            if value != value:
+                # NaN is unordered, so no comparison with it makes sense.
+                raise ValueError('Can not compare with NaN.')
+            self.c_predicate = predicate_float(path, comparison, value)
+        elif isinstance(value, (str, bytes)):
+            self.c_predicate = predicate_string(
+                path,
+                comparison,
+                str_as_bytes(value)
+            )
+        else:
+            raise TypeError(
+                f'Can not compare with a value of type {type(value)!r}.'
+            )
+
+    cdef int check(self) except -1:
+        """Make sure this Predicate was created by calling it, and not
+        with ``Predicate.__new__``."""
+        if self.c_predicate:
+            return 0
+        raise ValueError('Predicate has not been initialized.')
+
+    @staticmethod
+    cdef Predicate combine(int kind, Predicate a, Predicate b):
+        cdef:
+            Predicate self = Predicate.__new__(Predicate)
+            tape_predicate none
+
+        a.check()
+        if b is not None:
+            b.check()
+
+        self.c_predicate = predicate_combine(
+            kind,
+            a.c_predicate,
+            b.c_predicate if b is not None else none
+        )
+        return self
+
+    def __and__(self, other):
+        if not isinstance(self, Predicate) or not isinstance(other, Predicate):
+            return NotImplemented
+        return Predicate.combine(0, self, other)
+
+    def __or__(self, other):
+        if not isinstance(self, Predicate) or not isinstance(other, Predicate):
+            return NotImplemented
+        return Predicate.combine(1, self, other)
+
+    def __invert__(self):
+        return Predicate.combine(2, self, None)
+
+
+cdef dict SCHEMA_TYPES = {
+    'null': 1,
+    'boolean': 2,
+    'integer': 4,
+    'number': 4 | 8,
+    'string': 16,
+    'array': 32,
+    'object': 64
+}
+
+cdef dict SCHEMA_BOUNDS = {
+    'minimum': 0,
+    'exclusiveMinimum': 1,
+    'maximum': 2,
+    'exclusiveMaximum': 3
+}
+
+cdef dict SCHEMA_LIMITS = {
+    'minLength': 0,
+    'maxLength': 1,
+    'minItems': 2,
+    'maxItems': 3,
+    'minProperties': 4,
+    'maxProperties': 5
+}
+
+# Keywords that never affect validation.
+cdef frozenset SCHEMA_ANNOTATIONS = frozenset((
+    '$schema',
+    '$id',
+    '$comment',
+    'title',
+    'description',
+    'default',
+    'examples',
+    'format',
+    'deprecated',
+    'readOnly',
+    'writeOnly'
+))
+
+
+cdef tape_number as_tape_number(value, str keyword, str location) except *:
+    cdef double number
+
+    if isinstance(value, int):
+        if -0xFFFFFFFFFFFFFFFF <= value <= 0xFFFFFFFFFFFFFFFF:
+            return number_from_int(value < 0, abs(value))
+
+    # NaN compares false against everything and infinities can't appear in
+    # a JSON document, so either would silently change what's accepted.
+    try:
+        number = value
+    except OverflowError:
+        number = INFINITY
+    if not isfinite(number):
+        raise ValueError(
+            f'{keyword} must be a finite number at {location}.'
+        )
+    return number_from_double(number)
+
+
+cdef str escape_token(str token):
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+cdef schema_node compile_schema(schema, str location) except *:
+    """Compile the JSON Schema `schema`, found at `location` within the
+    root schema."""
+    cdef schema_node node = schema_new()
+
+    if schema is True:
+        return node
+    elif schema is False:
+        schema_reject(node)
+        return node
+    elif not isinstance(schema, dict):
+        raise TypeError(
+            f'Expected a schema at {location}, not'
+            f' {type(schema).__name__}.'
+        )
+
+    if 'enum' in schema and 'const' in schema:
+        raise ValueError(f'enum and const can not be combined at {location}.')
+
+    for keyword, value in schema.items():
+        if keyword in SCHEMA_ANNOTATIONS:
+            continue
+        elif keyword == 'type':
+            for name in ((value,) if isinstance(value, str) else value):
+                if name not in SCHEMA_TYPES:
+                    raise ValueError(f'Unknown type {name!r} at {location}.')
+                schema_add_type(node, SCHEMA_TYPES[name])
+        elif keyword == 'enum' or keyword == 'const':
+            schema_set_enum(node)
+            for literal in (value if keyword == 'enum' else (value,)):
+                if literal is None:
+                    schema_add_null(node)
+                elif isinstance(literal, bool):
+                    schema_add_bool(node, literal)
+                elif isinstance(literal, (int, float)):
+                    schema_add_number(
+                        node,
+                        as_tape_number(literal, keyword, location)
+                    )
+                elif isinstance(literal, str):
+                    schema_add_string(node, str_as_bytes(literal))
+                else:
+                    raise ValueError(
+                        f'Only null, booleans, numbers and strings are'
+                        f' supported by {keyword} at {location}.'
+                    )
+        elif keyword in SCHEMA_BOUNDS:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f'{keyword} must be a number at {location}.')
+            schema_set_bound(
+                node,
+                SCHEMA_BOUNDS[keyword],
+                as_tape_number(value, keyword, location),
+                str_as_bytes(repr(value))
+            )
+        elif keyword in SCHEMA_LIMITS:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(
+                    f'{keyword} must be an integer at {location}.'
+                )
+            if value < 0:
+                raise ValueError(
+                    f'{keyword} must not be negative at {location}.'
+                )
+            schema_set_limit(node, SCHEMA_LIMITS[keyword], value)
+        elif keyword == 'required':
+            if not isinstance(value, (list, tuple)) or not all(
+                    isinstance(name, str) for name in value):
+                raise TypeError(
+                    f'required must be an array of strings at {location}.'
+                )
+            for name in value:
+                schema_add_required(node, str_as_bytes(name))
+        elif keyword == 'properties':
+            for name, child in value.items():
+                schema_add_property(
+                    node,
+                    str_as_bytes(name),
+                    compile_schema(
+                        child,
+                        f'{location}/properties/{escape_token(name)}'
+                    )
+                )
+        elif keyword == 'additionalProperties':
+            schema_set_additional(
+                node,
+                compile_schema(value, f'{location}/additionalProperties')
+            )
+        elif keyword == 'items':
+            if isinstance(value, list):
+                raise ValueError(
+                    f'The array form of items is not supported at'
+                    f' {location}.'
+                )
+            schema_set_items(
+                node,
+                compile_schema(value, f'{location}/items')
+            )
+        else:
+            raise ValueError(
+                f'Unsupported JSON Schema keyword {keyword!r} at'
+                f' {location}.'
+            )
+
+    return node
+
+
+cdef class Schema:
+    """
+    A JSON Schema, compiled for validating parsed documents without creating
+    any Python objects::
+
+        >>> schema = simdjson.Schema({
+        ...     'type': 'object',
+        ...     'required': ['id'],
+        ...     'properties': {'id': {'type': 'integer', 'minimum': 1}}
+        ... })
+        >>> schema.validate(parser.parse(b'{"id": "1"}'))
+        ('/id', "expected 'integer', got 'string'")
+
+    Supports the ``type``, ``enum``, ``const``, ``minimum``, ``maximum``,
+    ``exclusiveMinimum``, ``exclusiveMaximum``, ``minLength``,
+    ``maxLength``, ``minItems``, ``maxItems``, ``minProperties``,
+    ``maxProperties``, ``required``, ``properties``,
+    ``additionalProperties`` and ``items`` keywords, and annotations such
+    as ``title`` and ``description``. Any other keyword raises a
+    `ValueError` instead of being ignored, since the schema could
+    otherwise accept documents it was meant to reject.
+
+    :param schema: The schema, as a dict or bool.
+    """
+    cdef schema_node c_schema
+
+    def __init__(self, schema):
+        self.c_schema = compile_schema(schema, '#')
+
+    cdef int check(self) except -1:
+        """Make sure this Schema was created by calling it, and not
+        with ``Schema.__new__``."""
+        if self.c_schema:
+            return 0
+        raise ValueError('Schema has not been initialized.')
+
+    def validate(self, doc):
+        """
+        Validate the :class:`Object` or :class:`Array` `doc`.
+
+        Returns None if it's valid, or a tuple of ``(pointer, message)`` for
+        the first invalid value found, where `pointer` is the JSON pointer
+        of the value relative to `doc`.
+        """
+        cdef:
+            tape_ref ref
+            string pointer
+            string message
+            bint valid
+
+        self.check()
+        if isinstance(doc, Object):
+            ref = get_tape_ref((<Object>doc).c_element)
+        elif isinstance(doc, Array):
+            ref = get_tape_ref((<Array>doc).c_element)
+        else:
+            raise TypeError(
+                f'Expected an Object or Array, not {type(doc).__name__}.'
+            )
+
+        with nogil:
+            valid = schema_validate(self.c_schema, ref, pointer, message)
+
+        if valid:
+            return None
+        return pointer, message
+
+
+cdef enum iteration_mode:
+    ITER_KEYS
+    ITER_VALUES
+    ITER_ITEMS
+
+
+cdef class ObjectIterator:
+    """
+    An iterator over the keys, values or items of an :class:`Object`.
+
+    .. admonition::
+       :class: warning
+
+       You should never create this class on your own. It is created and
+       returned for you by iterating over an Object, or by its ``keys()``,
+       ``values()`` and ``items()`` methods.
+    """
+    cdef Object obj
+    cdef simd_object.iterator c_iterator
+    cdef simd_object.iterator c_end
+    # Only a hint, the count on the tape saturates at 0xFFFFFF fields.
+    cdef Py_ssize_t c_remaining
+    cdef iteration_mode c_mode
+    cdef bint c_recursive
+
+    @staticmethod
+    cdef ObjectIterator create(Object obj, iteration_mode mode,
+                               bint recursive):
+        cdef ObjectIterator self = ObjectIterator.__new__(ObjectIterator)
+        self.obj = obj
+        self.c_iterator = obj.c_element.begin()
+        self.c_end = obj.c_element.end()
+        self.c_remaining = obj.c_element.size()
+        self.c_mode = mode
+        self.c_recursive = recursive
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef Parser parser = self.obj.parser
+
+        if not (self.c_iterator != self.c_end):
+            raise StopIteration
+
+        if self.c_mode == ITER_KEYS:
+            result = make_key(
+                parser,
+                self.c_iterator.key_c_str(),
+                self.c_iterator.key_length()
+            )
+        elif self.c_mode == ITER_VALUES:
+            result = element_to_primitive(
+                parser,
+                self.c_iterator.value(),
+                self.c_recursive
+            )
+        else:
+            result = (
+                make_key(
+                    parser,
+                    self.c_iterator.key_c_str(),
+                    self.c_iterator.key_length()
+                ),
+                element_to_primitive(
+                    parser,
+                    self.c_iterator.value(),
+                    self.c_recursive
+                )
+            )
+
+        preincrement(self.c_iterator)
+        if self.c_remaining > 0:
+            self.c_remaining -= 1
+        return result
+
+    def __length_hint__(self):
+        return self.c_remaining
+
+
+cdef bint string_mode(mode) except -1:
+    """True if strings should be returned as bytes for `mode`."""
+    if mode == 'str':
+        return False
+    elif mode == 'bytes':
+        return True
+    raise ValueError("String mode must be one of {'str', 'bytes'}.")
+
+
+cdef struct parse_stats:
+    size_t documents
+    size_t bytes_parsed
+    size_t tape_slots
+    uint64_t parse_ns
+    uint64_t materialize_ns
+    size_t objects_created
+    size_t strings_created
+    size_t reallocations
+
+
+cdef void call_stats_hook(hook, stats) noexcept:
+    """Call a Parser's `stats_hook`. Anything it raises is reported to
+    :func:`sys.unraisablehook` instead, so a broken hook can't lose the
+    document that was just parsed."""
+    hook(stats)
 
 
+# The Parser's simdjson parser may be borrowing a tape from c_tape_source,
+# so the garbage collector mustn't clear it before __dealloc__ can release it.
+@cython.no_gc_clear
 cdef class Parser:
     """
     A `Parser` instance is used to load and/or parse a JSON document.
@@ -398,26 +1920,114 @@ cdef class Parser:
 
     :param max_capacity: The maximum size the internal buffer can
                          grow to. [default: SIMDJSON_MAXSIZE_BYTES]
+    :param initial_capacity: Preallocate the internal buffers for documents
+                             of up to this many bytes. This is also the
+                             size the Parser returns to when it is shrunk.
+                             [default: 0]
+    :param max_depth: The maximum nesting depth of documents.
+                      [default: 1024]
+    :param shrink_after: If set, automatically :func:`shrink` the Parser
+                         after this many consecutive documents have been
+                         parsed that would fit in a quarter of its current
+                         capacity. This stops a single large document from
+                         permanently inflating a long-lived Parser.
+                         [default: 0 (disabled)]
+    :param implementation: The name of the Implementation this Parser
+                           should use, see :py:attr:`implementation`.
+                           [default: the active Implementation]
+    :param strings: Either ``'str'``, or ``'bytes'`` to return string values
+                    as raw UTF-8 encoded bytes, skipping decoding entirely.
+                    Useful when strings are only hashed or forwarded.
+                    [default: 'str']
+    :param keys: As `strings`, but for the keys of objects.
+                 [default: 'str']
+    :param stats: Collect parsing statistics, see :py:attr:`stats`.
+                  [default: False]
+    :param stats_hook: A callable which will be given the current
+                       :py:attr:`stats` every `stats_interval` documents,
+                       such as to export them to a metrics system.
+                       Exceptions it raises are reported to
+                       :func:`sys.unraisablehook` instead of being raised.
+    :param stats_interval: How often, in documents, `stats_hook` is called.
+                           [default: 1000]
     """
     cdef shared_ptr[simd_parser] c_parser
-
-    def __cinit__(self, size_t max_capacity=SIMDJSON_MAXSIZE_BYTES):
+    cdef const Implementation * c_implementation
+    cdef bint c_stats_enabled
+    cdef parse_stats c_stats
+    cdef object stats_hook
+    cdef size_t stats_interval
+    cdef bint c_bytes_strings
+    cdef bint c_bytes_keys
+    cdef readonly size_t initial_capacity
+    cdef readonly size_t shrink_after
+    cdef size_t small_documents
+    cdef size_t small_documents_peak
+    cdef object c_tape_source
+    cdef Py_buffer c_tape_view
+    cdef bint c_tape_attached
+
+    def __cinit__(self, size_t max_capacity=SIMDJSON_MAXSIZE_BYTES, *,
+                  size_t initial_capacity=0,
+                  size_t max_depth=DEFAULT_MAX_DEPTH,
+                  size_t shrink_after=0,
+                  strings='str', keys='str',
+                  implementation=None, bint stats=False, stats_hook=None,
+                  size_t stats_interval=1000):
         self.c_parser = make_shared[simd_parser](max_capacity)
+        self.initial_capacity = initial_capacity
+        self.shrink_after = shrink_after
+        self.small_documents = 0
+        self.small_documents_peak = 0
+        self.c_bytes_strings = string_mode(strings)
+        self.c_bytes_keys = string_mode(keys)
+        self.c_implementation = NULL
+        self.c_stats_enabled = stats or stats_hook is not None
+        memset(&self.c_stats, 0, sizeof(parse_stats))
+        self.stats_hook = stats_hook
+        self.stats_interval = stats_interval or 1
+
+        if implementation is not None:
+            self.implementation = implementation
+
+        if initial_capacity or max_depth != DEFAULT_MAX_DEPTH:
+            allocate_parser(
+                dereference(self.c_parser),
+                initial_capacity,
+                max_depth
+            )
 
     def __dealloc__(self):
+        self._release_tape()
         self.c_parser.reset()
 
-    def parse(self, src not None, bint recursive=False):
+    cdef _release_tape(self):
+        """Stop using a tape loaded by :func:`load_tape`."""
+        if not self.c_tape_attached:
+            return
+
+        # simdjson must never free a tape it doesn't own, so this happens
+        # even if the source has already been dropped.
+        release_tape(dereference(self.c_parser))
+        self.c_tape_attached = False
+        PyBuffer_Release(&self.c_tape_view)
+        if self.c_tape_source is not None:
+            self.c_tape_source.close()
+            self.c_tape_source = None
+
+    def parse(self, src not None, recursive=False, *, Py_ssize_t offset=0,
+              length=None):
         """Parse the given JSON document.
 
         The source document may be a `str`, `bytes`, `bytearray`, or any other
-        object that implements the buffer protocol.
+        object that implements the buffer protocol, such as a `memoryview` or
+        an `mmap`, and is read directly without converting it to `bytes`
+        first.
 
-        .. admonition:: Performance
-            :class: tip
-
-            While you can pass quite a few things to this method to be parsed,
-            simple ``bytes`` will almost always be the fastest.
+        simdjson needs :data:`PADDING` readable bytes after the end of the
+        document. When `length` leaves at least that many bytes of `src`
+        after it, the document is parsed in place. Otherwise, it's copied
+        into the Parser's own padded buffer.
 
         If any :class:`~Object` or :class:`~Array` proxies still pointing to
         a previously-parsed document exist when this method is called, a
@@ -426,7 +2036,17 @@ cdef class Parser:
         :param src: The document to parse.
         :param recursive: Recursively turn the document into real
                           python objects instead of pysimdjson proxies.
-                          [default: False]
+                          May also be a dict of the `max_depth`, `include`
+                          and `exclude` options taken by
+                          :func:`Object.as_dict`, to only convert part of
+                          the document, or ``'lazy'`` to return a
+                          :class:`LazyDict` or :class:`LazyList` that is
+                          converted as it's accessed. [default: False]
+        :param offset: Only parse the bytes of `src` starting at this
+                       offset. For a `str`, this is an offset into its
+                       UTF-8 encoding. [default: 0]
+        :param length: Only parse this many bytes of `src`, starting at
+                       `offset`. [default: the rest of `src`]
         """
         # This may be very non-intuitive on PyPy, where cleanup of references
         # may not occur until much later than expected by a user. We may need
@@ -438,61 +2058,111 @@ cdef class Parser:
                 ' parser.'
             )
 
+        self._release_tape()
+        recursive = as_recursive(recursive)
+
         cdef:
-            const unsigned char[::1] data
-            const char * str_data = NULL
-            char * bytes_data = NULL
-            Py_ssize_t str_size = 0
+            Py_buffer view
+            const char *data
+            char *bytes_data = NULL
+            Py_ssize_t size = 0, start, total
 
         if isinstance(src, bytes):
-            # Handling bytes is drastically faster than using the buffer API.
-            PyBytes_AsStringAndSize(src, &bytes_data, &str_size)
-            return element_to_primitive(
-                self,
-                dereference(self.c_parser).parse(
-                    bytes_data,
-                    str_size,
-                    True
-                ),
-                recursive
-            )
+            # Handling bytes is faster than even the buffer API.
+            PyBytes_AsStringAndSize(src, &bytes_data, &size)
+            data = bytes_data
         elif isinstance(src, str):
             # str can't be handled using the buffer API, oddly, even if you
             # know the encoding.
-            str_data = PyUnicode_AsUTF8AndSize(src, &str_size)
-            return element_to_primitive(
-                self,
-                dereference(self.c_parser).parse(
-                    str_data,
-                    str_size,
-                    True
-                ),
-                recursive
-            )
+            data = PyUnicode_AsUTF8AndSize(src, &size)
         else:
-            # Handle any type that provides the buffer API (bytes, bytearray,
-            # memoryview, etc). This is significantly slower than the
-            # type-specific APIs, but gives much greater compatibility.
-            data = src
-
-            if data.size == 0:
-                # If we were given a completely empty buffer, trying to access
-                # a stride in the next step will cause a (potentially
-                # confusing) IndexError. This isn't a very good error message,
-                # but it's identical to the one simdjson would have raised.
-                raise ValueError('EMPTY: no JSON found')
-
-            return element_to_primitive(
+            # Any other type that provides the buffer API (bytearray,
+            # memoryview, mmap, etc). The document is fully parsed before
+            # returning, so the buffer only needs to be held until then.
+            PyObject_GetBuffer(src, &view, PyBUF_SIMPLE)
+            try:
+                start = sub_range(view.len, offset, length, &size)
+                return self._parse(
+                    <const char *>view.buf + start,
+                    size,
+                    view.len - start - size,
+                    recursive
+                )
+            finally:
+                PyBuffer_Release(&view)
+
+        total = size
+        start = 0
+        if offset or length is not None:
+            start = sub_range(total, offset, length, &size)
+        return self._parse(data + start, size, total - start - size, recursive)
+
+    cdef inline object _parse(self, const char *data, size_t size,
+                              size_t spare, object recursive):
+        """Parse the `size` bytes at `data`, which are followed by `spare`
+        more bytes that are safe to read."""
+        cdef:
+            uint64_t start
+            size_t capacity
+            simd_element document
+            # Only copy the document if simdjson can't safely read past its
+            # end.
+            bint copy = spare < SIMDJSON_PADDING
+
+        if self.shrink_after:
+            self._track_size(size)
+
+        if not self.c_stats_enabled:
+            return document_to_primitive(
                 self,
-                dereference(self.c_parser).parse(
-                    <const char*>&data[0],
-                    data.shape[0],
-                    True
-                ),
+                dereference(self.c_parser).parse(data, size, copy),
                 recursive
             )
 
-    def load(self, path, bint recursive=False):
+        capacity = dereference(self.c_parser).capacity()
+        start = monotonic_ns()
+        document = dereference(self.c_parser).parse(data, size, copy)
+        self.c_stats.parse_ns += monotonic_ns() - start
+        self.c_stats.bytes_parsed += size
+        return self._materialize(document, capacity, recursive)
+
+    cdef _track_size(self, size_t size):
+        """Apply the automatic shrink policy before parsing a document of
+        `size` bytes."""
+        cdef size_t capacity = dereference(self.c_parser).capacity()
+
+        if size * 4 > capacity or capacity <= self.initial_capacity:
+            self.small_documents = 0
+            self.small_documents_peak = 0
+            return
+
+        self.small_documents += 1
+        self.small_documents_peak = max(self.small_documents_peak, size)
+
+        if self.small_documents > self.shrink_after:
+            self.shrink(max(self.initial_capacity, self.small_documents_peak))
+
+    cdef object _materialize(self, simd_element document, size_t capacity,
+                             object recursive):
+        """Convert the root `document`, recording statistics."""
+        cdef uint64_t start
+
+        if dereference(self.c_parser).capacity() != capacity:
+            self.c_stats.reallocations += 1
+        self.c_stats.documents += 1
+        self.c_stats.tape_slots += tape_length(dereference(self.c_parser))
+
+        start = monotonic_ns()
+        result = document_to_primitive(self, document, recursive)
+        self.c_stats.materialize_ns += monotonic_ns() - start
+
+        if (self.stats_hook is not None
+                and self.c_stats.documents % self.stats_interval == 0):
+            call_stats_hook(self.stats_hook, self.stats)
+
+        return result
+
+    def load(self, path, recursive=False):
         """Load a JSON document from the file system path `path`.
 
         If any :class:`~Object` or :class:`~Array` proxies still pointing to
@@ -501,7 +2171,9 @@ cdef class Parser:
 
         :param path: A filesystem path.
         :param recursive: Recursively turn the document into real
-                          python objects instead of pysimdjson proxies.
+                          python objects instead of pysimdjson proxies, or
+                          one of the other options taken by
+                          :func:`parse`.
         """
         if self.c_parser.use_count() > 1:
             raise RuntimeError(
@@ -510,13 +2182,235 @@ cdef class Parser:
                 ' parser.'
             )
 
+        self._release_tape()
+        recursive = as_recursive(recursive)
+
         if isinstance(path, unicode):
             path = (<unicode>path).encode('utf-8')
         elif isinstance(path, pathlib.Path):
             path = str(path).encode('utf-8')
 
-        cdef simd_element document = dereference(self.c_parser).load(path)
-        return element_to_primitive(self, document, recursive)
+        cdef:
+            simd_element document
+            size_t capacity
+            uint64_t start
+
+        if self.shrink_after:
+            self._track_size(os.stat(path).st_size)
+
+        if not self.c_stats_enabled:
+            document = dereference(self.c_parser).load(path)
+            return document_to_primitive(self, document, recursive)
+
+        capacity = dereference(self.c_parser).capacity()
+        start = monotonic_ns()
+        document = dereference(self.c_parser).load(path)
+        self.c_stats.parse_ns += monotonic_ns() - start
+        self.c_stats.bytes_parsed += os.stat(path).st_size
+        return self._materialize(document, capacity, recursive)
+
+    def load_tape(self, path, recursive=False):
+        """Load a document saved with :func:`Object.save_tape` or
+        :func:`Array.save_tape` from the file system path `path`.
+
+        The file is mapped into memory and used as-is, without parsing or
+        copying it, so loading is nearly instant regardless of the size of
+        the document. The file is released the next time this Parser is
+        used.
+
+        If any :class:`~Object` or :class:`~Array` proxies still pointing to
+        a previously-parsed document exist when this method is called, a
+        `RuntimeError` may be raised.
+
+        :param path: A filesystem path.
+        :param recursive: Recursively turn the document into real
+                          python objects instead of pysimdjson proxies, or
+                          one of the other options taken by
+                          :func:`parse`.
+        """
+        if self.c_parser.use_count() > 1:
+            raise RuntimeError(
+                'Tried to re-use a parser while simdjson.Object and/or'
+                ' simdjson.Array objects still exist referencing the old'
+                ' parser.'
+            )
+
+        self._release_tape()
+        recursive = as_recursive(recursive)
+
+        with open(path, 'rb') as src:
+            source = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return self._attach_tape(source, source, recursive)
+
+    def load_shared(self, name, recursive=False):
+        """Attach to a document shared by another process with
+        :func:`Object.share` or :func:`Array.share`, using the name of its
+        shared memory block.
+
+        Like :func:`load_tape`, the document is used in place without
+        parsing or copying it. The shared memory is released the next time
+        this Parser is used, but is never destroyed by it, nor by the
+        resource tracker of :mod:`multiprocessing` when this process exits.
+
+        If any :class:`~Object` or :class:`~Array` proxies still pointing to
+        a previously-parsed document exist when this method is called, a
+        `RuntimeError` may be raised.
+
+        :param name: The ``name`` of the shared memory block.
+        :param recursive: Recursively turn the document into real
+                          python objects instead of pysimdjson proxies, or
+                          one of the other options taken by
+                          :func:`parse`.
+        """
+        if self.c_parser.use_count() > 1:
+            raise RuntimeError(
+                'Tried to re-use a parser while simdjson.Object and/or'
+                ' simdjson.Array objects still exist referencing the old'
+                ' parser.'
+            )
+
+        self._release_tape()
+        recursive = as_recursive(recursive)
+
+        source, buffer = open_shared_memory(name)
+        return self._attach_tape(source, buffer, recursive)
+
+    cdef _attach_tape(self, source, buffer, recursive):
+        """Use the saved tape in `buffer` as this Parser's document.
+        `source` is closed when the tape is released, and `recursive` was
+        returned by :func:`as_recursive`."""
+        cdef simd_element document
+
+        PyObject_GetBuffer(buffer, &self.c_tape_view, PyBUF_SIMPLE)
+        try:
+            document = attach_tape(
+                dereference(self.c_parser),
+                <const uint8_t *>self.c_tape_view.buf,
+                self.c_tape_view.len
+            )
+        except:
+            PyBuffer_Release(&self.c_tape_view)
+            source.close()
+            raise
+
+        self.c_tape_source = source
+        self.c_tape_attached = True
+
+        # Nothing can refer to the tape once it's been fully converted.
+        if recursive is True or (
+                type(recursive) is _Partial
+                and (<_Partial>recursive).c_max_depth < 0):
+            try:
+                return document_to_primitive(self, document, recursive)
+            finally:
+                self._release_tape()
+
+        return document_to_primitive(self, document, recursive)
+
+    @property
+    def stats(self):
+        """
+        Parsing statistics as a dict, or None if this Parser was not created
+        with `stats=True`.
+
+        ``documents``, ``bytes_parsed``, ``tape_slots``
+            Totals for all documents parsed so far.
+        ``parse_ns``
+            Time spent by simdjson building the document.
+        ``materialize_ns``
+            Time spent creating the Python objects returned by
+            :func:`parse` or :func:`load`. Objects created later by
+            accessing an :class:`Object` or :class:`Array` are counted in
+            ``objects_created`` and ``strings_created``, but not timed.
+        ``objects_created``, ``strings_created``
+            The number of containers (dicts, lists and proxies) and strings
+            (including keys) created.
+        ``capacity``
+            The current capacity of the internal buffers, in bytes.
+        ``reallocations``
+            The number of times the internal buffers have been resized.
+        """
+        if not self.c_stats_enabled:
+            return None
+
+        stats = dict(self.c_stats)
+        stats['capacity'] = dereference(self.c_parser).capacity()
+        return stats
+
+    def reset_stats(self):
+        """Reset all :py:attr:`stats` counters to zero."""
+        memset(&self.c_stats, 0, sizeof(parse_stats))
+
+    def shrink(self, to=None):
+        """
+        Release the internal buffers of this Parser, reallocating them for
+        documents of up to `to` bytes.
+
+        A Parser only ever grows its buffers to fit the largest document it
+        has seen. Use this to give back memory after parsing an unusually
+        large document.
+
+        If any :class:`~Object` or :class:`~Array` proxies still pointing to
+        a previously-parsed document exist when this method is called, a
+        ``RuntimeError`` will be raised.
+
+        :param to: The new capacity in bytes.
+                   [default: :py:attr:`initial_capacity`]
+        """
+        if self.c_parser.use_count() > 1:
+            raise RuntimeError(
+                'Tried to shrink a parser while simdjson.Object and/or'
+                ' simdjson.Array objects still exist referencing the old'
+                ' parser.'
+            )
+
+        self._release_tape()
+
+        cdef:
+            size_t capacity = self.initial_capacity if to is None else to
+            size_t max_depth = dereference(self.c_parser).max_depth()
+
+        # The simdjson parser keeps a private copy of the largest document it
+        # has seen, so the only way to release everything is to start over.
+        self.c_parser = make_shared[simd_parser](
+            dereference(self.c_parser).max_capacity()
+        )
+        if self.c_implementation != NULL:
+            set_parser_implementation(
+                dereference(self.c_parser),
+                self.c_implementation
+            )
+        allocate_parser(dereference(self.c_parser), capacity, max_depth)
+
+        self.small_documents = 0
+        self.small_documents_peak = 0
+        if self.c_stats_enabled:
+            self.c_stats.reallocations += 1
+
+    @property
+    def strings(self):
+        """The type used for string values, either ``'str'`` or
+        ``'bytes'``."""
+        return 'bytes' if self.c_bytes_strings else 'str'
+
+    @property
+    def keys(self):
+        """The type used for object keys, either ``'str'`` or ``'bytes'``."""
+        return 'bytes' if self.c_bytes_keys else 'str'
+
+    @property
+    def capacity(self):
+        """
+        The size in bytes of the largest document this Parser can currently
+        handle without growing its internal buffers.
+        """
+        return dereference(self.c_parser).capacity()
+
+    @property
+    def max_depth(self):
+        """The maximum nesting depth of documents this Parser can handle."""
+        return dereference(self.c_parser).max_depth()
 
     def get_implementations(self, supported_by_runtime=True):
         """
@@ -537,32 +2431,789 @@ cdef class Parser:
     @property
     def implementation(self):
         """
-        The active parser Implementation as (name, description). Can be
-        any value from :py:attr:`implementations`. The best Implementation
-        for your current platform will be picked by default.
-
-        Can be set to the name of any valid Implementation to globally
-        change underlying Parser Implementation, such as to disable AVX-512
-        if it is causing down-clocking.
+        The parser Implementation used by this Parser as (name,
+        description). Can be any value from :py:attr:`implementations`. The
+        best Implementation for your current platform will be picked by
+        default.
+
+        Can be set to the name of any valid Implementation to change the
+        underlying Implementation of *this* Parser only, such as to disable
+        AVX-512 if it is causing down-clocking. Other parsers are unaffected.
+        Use :func:`autotune` to change the default for new parsers.
         """
-        cdef const Implementation * impl = (
-            <const Implementation *>get_active_implementation()
-        )
+        cdef const Implementation * impl = self.c_implementation
+        if impl == NULL:
+            impl = <const Implementation *>get_active_implementation()
         return impl.name(), impl.description()
 
     @implementation.setter
     def implementation(self, name):
-        for impl in get_available_implementations():
-            if impl.name() != str_as_bytes(name):
-                continue
+        cdef const Implementation * impl = find_implementation(name)
+        set_parser_implementation(dereference(self.c_parser), impl)
+        self.c_implementation = impl
+
 
-            if not impl.supported_by_runtime_system():
-                raise RuntimeError(
-                    'Attempted to set a runtime Implementation that is not'
-                    'supported on the current host.'
+cdef object share_tape(tape_ref ref):
+    # Imported here, since it's slow to import and rarely needed.
+    from multiprocessing import shared_memory
+
+    cdef Py_buffer view
+
+    shm = shared_memory.SharedMemory(create=True, size=saved_tape_size(ref))
+    try:
+        PyObject_GetBuffer(shm.buf, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+        try:
+            with nogil:
+                copy_saved_tape(ref, <uint8_t *>view.buf)
+        finally:
+            PyBuffer_Release(&view)
+    except:
+        shm.close()
+        shm.unlink()
+        raise
+
+    return shm
+
+
+cdef tuple open_shared_memory(name):
+    """Open the shared memory block `name`, returning the object to close
+    once done with it and its buffer."""
+    from multiprocessing import shared_memory
+
+    # A tracked block is destroyed when this process exits, even though it
+    # was created by another.
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name, track=False)
+        return shm, shm.buf
+
+    # Before Python 3.13, SharedMemory always tracks blocks on POSIX, so map
+    # the block ourselves with the module SharedMemory itself uses, which
+    # only exists on POSIX. Windows has no tracking to avoid.
+    try:
+        import _posixshmem
+    except ImportError:
+        shm = shared_memory.SharedMemory(name)
+        return shm, shm.buf
+
+    if not name.startswith('/'):
+        name = '/' + name
+
+    fd = _posixshmem.shm_open(name, os.O_RDONLY, mode=0o600)
+    try:
+        source = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    return source, source
+
+
+cdef const Implementation * find_implementation(name) except NULL:
+    """Find the runtime-supported Implementation called `name`."""
+    for impl in get_available_implementations():
+        if impl.name() != str_as_bytes(name):
+            continue
+
+        if not impl.supported_by_runtime_system():
+            raise RuntimeError(
+                'Attempted to set a runtime Implementation that is not'
+                'supported on the current host.'
+            )
+
+        return impl
+
+    raise ValueError('Unknown Implementation')
+
+
+def autotune(sample_docs, *, int repeat=5, bint apply=True):
+    """
+    Benchmark every Implementation supported by the current host against
+    `sample_docs` and return the name of the fastest.
+
+    Which Implementation wins is not always obvious, for example AVX-512
+    can cause enough down-clocking on some hosts that `haswell` beats
+    `icelake`. Samples should be representative of your real workload.
+
+    :param sample_docs: An iterable of documents, in any form accepted by
+                        :func:`Parser.parse`.
+    :param repeat: The number of times each document is parsed by each
+                   Implementation. The best run is kept. [default: 5]
+    :param apply: If True, make the winner the default Implementation for
+                  all Parsers created afterwards. Existing Parsers keep
+                  the Implementation they already use. [default: True]
+    """
+    cdef Parser parser
+
+    sample_docs = list(sample_docs)
+    if not sample_docs:
+        raise ValueError('autotune requires at least one sample document.')
+
+    best_name, best_time = None, None
+    for impl in get_available_implementations():
+        if not impl.supported_by_runtime_system():
+            continue
+
+        parser = Parser()
+        set_parser_implementation(dereference(parser.c_parser), impl)
+        parser.c_implementation = impl
+
+        elapsed = 0
+        for doc in sample_docs:
+            # Prime the parser once so buffer allocation isn't measured.
+            parser.parse(doc)
+            elapsed += min(
+                timeit.repeat(
+                    functools.partial(parser.parse, doc),
+                    number=1,
+                    repeat=repeat
                 )
+            )
 
-            set_active_implementation(impl)
-            return
+        if best_time is None or elapsed < best_time:
+            best_name, best_time = impl.name(), elapsed
+
+    if apply:
+        set_active_implementation(find_implementation(best_name))
+
+    return best_name
+
+
+cdef object copy_json(object obj):
+    """
+    Copy the containers of a recursively converted document. Everything else
+    in a document is immutable and can be shared.
+    """
+    cdef:
+        list result
+        Py_ssize_t i
+
+    if type(obj) is dict:
+        return {k: copy_json(v) for k, v in (<dict>obj).items()}
+    elif type(obj) is list:
+        result = PyList_New(len(<list>obj))
+        for i, v in enumerate(<list>obj):
+            v = copy_json(v)
+            Py_INCREF(v)
+            PyList_SET_ITEM(result, i, v)
+        return result
+    return obj
+
+
+cdef inline size_t source_size(key) except? 0:
+    """The size of a `str` or `bytes` document in bytes, which for a `str`
+    is the length of its UTF-8 encoding."""
+    cdef Py_ssize_t size
+
+    if isinstance(key, str):
+        PyUnicode_AsUTF8AndSize(key, &size)
+        return size
+    return len(key)
+
+
+cdef class CachedParser:
+    """
+    A least-recently-used cache in front of a :class:`Parser`, for workloads
+    where many documents are byte-for-byte identical, such as configuration
+    or repeated webhook payloads.
+
+    Documents are always recursively converted into Python objects. The
+    cache is keyed by the content of the document itself, so two documents
+    can never be confused even if their hashes collide.
+
+    :param max_entries: The maximum number of documents to cache.
+                        [default: 1024]
+    :param max_bytes: The maximum total size of the cached documents, in
+                      bytes, as measured by the size of their source.
+                      Documents larger than this are never cached.
+                      [default: 64MiB]
+    :param copy: If True, every call returns a fresh copy of the cached
+                 result that can be safely modified. If False, the cached
+                 result is returned as-is and *must not* be modified.
+                 [default: True]
+
+    Any other keyword arguments are passed to the underlying
+    :class:`Parser`.
+    """
+    cdef Parser parser
+    cdef object entries
+    cdef readonly size_t max_entries
+    cdef readonly size_t max_bytes
+    cdef readonly bint copy
+    cdef size_t size_bytes
+    cdef size_t hits
+    cdef size_t misses
+    cdef size_t evictions
+
+    def __cinit__(self, *, size_t max_entries=1024,
+                  size_t max_bytes=64 * 1024 * 1024, bint copy=True,
+                  **kwargs):
+        self.parser = Parser(**kwargs)
+        self.entries = collections.OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse(self, src not None):
+        """
+        Parse the JSON document `src`, returning a cached result if an
+        identical document has been parsed before.
+
+        The source document may be a `str`, `bytes`, or any other object
+        that implements the buffer protocol.
+        """
+        cdef size_t size
+
+        if isinstance(src, (bytes, str)):
+            key = src
+        else:
+            key = bytes(memoryview(src))
+
+        try:
+            result = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return copy_json(result) if self.copy else result
+
+        self.misses += 1
+        result = self.parser.parse(key, True)
+
+        size = source_size(key)
+        if size <= self.max_bytes and self.max_entries:
+            while (self.entries
+                    and (len(self.entries) >= self.max_entries
+                         or self.size_bytes + size > self.max_bytes)):
+                evicted, _ = self.entries.popitem(last=False)
+                self.size_bytes -= source_size(evicted)
+                self.evictions += 1
+
+            self.entries[key] = result
+            self.size_bytes += size
+
+            if self.copy:
+                return copy_json(result)
+
+        return result
+
+    def clear(self):
+        """Remove all entries from the cache. Statistics are kept."""
+        self.entries.clear()
+        self.size_bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def stats(self):
+        """
+        Cache statistics as a dict of ``hits``, ``misses``, ``hit_rate``,
+        ``evictions``, ``entries`` and ``bytes``.
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.size_bytes
+        }
+
+
+cdef class _Source:
+    """
+    Holds a pointer to the contents of a document, so it can be used
+    without the GIL.
+    """
+    cdef object src
+    cdef Py_buffer view
+    cdef bint has_view
+    cdef const char *data
+    cdef Py_ssize_t size
+
+    def __cinit__(self, src not None):
+        cdef char *bytes_data = NULL
+
+        self.src = src
+        self.has_view = False
+        if isinstance(src, bytes):
+            PyBytes_AsStringAndSize(src, &bytes_data, &self.size)
+            self.data = bytes_data
+        elif isinstance(src, str):
+            try:
+                self.data = PyUnicode_AsUTF8AndSize(src, &self.size)
+            except UnicodeEncodeError:
+                # Lone surrogates can't be encoded as UTF-8. Keep them as
+                # invalid bytes, so they're reported like any other invalid
+                # UTF-8 instead of raising.
+                self.src = (<str>src).encode('utf-8', 'surrogatepass')
+                PyBytes_AsStringAndSize(self.src, &bytes_data, &self.size)
+                self.data = bytes_data
+        else:
+            PyObject_GetBuffer(src, &self.view, PyBUF_SIMPLE)
+            self.has_view = True
+            self.data = <const char *>self.view.buf
+            self.size = self.view.len
+
+    def __dealloc__(self):
+        if self.has_view:
+            PyBuffer_Release(&self.view)
+
+
+cdef object validation_result(_Source source, error_code error):
+    if error == SUCCESS:
+        return None
+
+    offset = None
+    if error == UTF8_ERROR:
+        offset = invalid_utf8_offset(source.data, source.size)
+    return error_message(error), offset
+
+
+def validate(src):
+    """
+    Check that `src` is a valid JSON document, without creating any Python
+    objects or raising an exception if it isn't. The GIL is released while
+    validating.
+
+    The source document may be a `str`, `bytes`, or any other object that
+    implements the buffer protocol.
+
+    Each thread keeps a parser for validating, which is thrown away after any
+    document larger than 1MB so its buffers don't stay allocated.
+
+    Returns None if the document is valid. Otherwise, returns a tuple of
+    ``(error, offset)``, where `error` is the message :func:`Parser.parse`
+    would have raised, and `offset` is the position of the first invalid
+    byte if it's known, or None.
+    """
+    cdef:
+        _Source source = _Source(src)
+        error_code error
+
+    with nogil:
+        error = validate_json(source.data, source.size)
+
+    return validation_result(source, error)
+
+
+def _validate_capacity():
+    """The capacity, in bytes, :func:`validate` is holding on to for the
+    current thread."""
+    return validate_json_capacity()
+
+
+def validate_many(sources):
+    """
+    Like :func:`validate`, but for a list of documents, returning a list of
+    results. The GIL is released once for the whole batch.
+    """
+    cdef:
+        list prepared = [_Source(src) for src in sources]
+        vector[const char *] data
+        vector[size_t] sizes
+        vector[error_code] errors
+        size_t i
+        _Source source
+
+    data.reserve(len(prepared))
+    sizes.reserve(len(prepared))
+    for source in prepared:
+        data.push_back(source.data)
+        sizes.push_back(source.size)
+    errors.resize(len(prepared))
+
+    with nogil:
+        for i in range(errors.size()):
+            errors[i] = validate_json(data[i], sizes[i])
+
+    return [
+        validation_result(source, errors[i])
+        for i, source in enumerate(prepared)
+    ]
+
+
+def validate_utf8(src):
+    """
+    Check that `src` is valid UTF-8, without parsing it as JSON. The GIL is
+    released while validating.
+
+    Returns None if it is valid, or the offset of the first invalid byte.
+    """
+    cdef:
+        _Source source = _Source(src)
+        bint valid
+
+    with nogil:
+        valid = simd_validate_utf8(source.data, source.size)
+
+    if valid:
+        return None
+    return invalid_utf8_offset(source.data, source.size)
+
+
+def validate_utf8_many(sources):
+    """
+    Like :func:`validate_utf8`, but for a list of buffers, returning a list
+    of results. The GIL is released once for the whole batch.
+    """
+    cdef:
+        list prepared = [_Source(src) for src in sources]
+        vector[const char *] data
+        vector[size_t] sizes
+        vector[char] valid
+        size_t i
+        _Source source
+
+    data.reserve(len(prepared))
+    sizes.reserve(len(prepared))
+    for source in prepared:
+        data.push_back(source.data)
+        sizes.push_back(source.size)
+    valid.resize(len(prepared))
+
+    with nogil:
+        for i in range(valid.size()):
+            valid[i] = simd_validate_utf8(data[i], sizes[i])
+
+    return [
+        None if valid[i] else invalid_utf8_offset(source.data, source.size)
+        for i, source in enumerate(prepared)
+    ]
+
+
+def minify(src, out=None):
+    """
+    Minify the JSON document `src` by stripping all insignificant
+    whitespace, without parsing it. This is much faster than
+    ``parser.parse(src).mini``, but the document isn't validated beyond
+    simple errors such as an unterminated string. The GIL is released while
+    minifying.
+
+    The source document may be a `str`, `bytes`, or any other object that
+    implements the buffer protocol.
+
+    :param out: An optional writable buffer, at least as long as `src`, to
+                write the minified document into. If given, the number of
+                bytes written is returned instead of a new `bytes` object.
+    """
+    cdef:
+        _Source source = _Source(src)
+        Py_buffer view
+        size_t written = 0
+        error_code error
+        bytes result
+        char *dst
+
+    if out is None:
+        result = PyBytes_FromStringAndSize(NULL, source.size)
+        dst = PyBytes_AS_STRING(result)
+        with nogil:
+            error = simd_minify(source.data, source.size, dst, written)
+
+        if error != SUCCESS:
+            raise ValueError(error_message(error))
+        if written == <size_t>source.size:
+            return result
+        return result[:written]
+
+    PyObject_GetBuffer(out, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+    try:
+        if view.len < source.size:
+            raise ValueError(
+                f'The output buffer is too small ({view.len} bytes), it must'
+                f' be at least as long as the input ({source.size} bytes).'
+            )
+
+        with nogil:
+            error = simd_minify(
+                source.data,
+                source.size,
+                <char *>view.buf,
+                written
+            )
+    finally:
+        PyBuffer_Release(&view)
+
+    if error != SUCCESS:
+        raise ValueError(error_message(error))
+    return written
+
+
+cdef object open_compressed(path, compression):
+    """Open the file at `path` for reading, decompressing it with
+    `compression`."""
+    if compression == 'auto':
+        with open(path, 'rb') as src:
+            magic = src.read(4)
+        if magic[:2] == b'\x1f\x8b':
+            compression = 'gzip'
+        elif magic == b'\x28\xb5\x2f\xfd':
+            compression = 'zstd'
+        else:
+            compression = None
+
+    if compression is None:
+        return open(path, 'rb')
+    elif compression == 'gzip':
+        import gzip
+        return gzip.open(path, 'rb')
+    elif compression == 'zstd':
+        try:
+            # Part of the standard library since Python 3.14.
+            from compression import zstd
+        except ImportError:
+            pass
+        else:
+            return zstd.open(path, 'rb')
+
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                'Reading zstd compressed files requires Python 3.14+ or the'
+                ' zstandard package.'
+            ) from None
+        return zstandard.ZstdDecompressor().stream_reader(
+            open(path, 'rb'),
+            read_across_frames=True
+        )
+
+    raise ValueError(
+        f'compression must be one of "gzip", "zstd", "auto" or None, not'
+        f' {compression!r}.'
+    )
+
+
+def _read_chunks(source, size_t chunk_size, size_t max_line_length, chunks,
+                 stop):
+    """
+    Read `source` on a background thread, putting padded buffers of
+    complete lines into the queue `chunks` as ``(buffer, length)`` tuples,
+    followed by None or the exception that stopped it.
+
+    Lines that span chunks are buffered until they're complete, raising a
+    ValueError if one is longer than `max_line_length`.
+
+    zlib and zstd release the GIL while decompressing, so this overlaps
+    with parsing on the consuming thread.
+    """
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def padded(tail, chunk, size_t end):
+        cdef size_t length = len(tail) + end
+        buffer = bytearray(length + SIMDJSON_PADDING)
+        buffer[:len(tail)] = tail
+        buffer[len(tail):length] = memoryview(chunk)[:end]
+        return buffer, length
+
+    def check_line(size_t length):
+        if length > max_line_length:
+            raise ValueError(
+                f'Found a line longer than max_line_length'
+                f' ({max_line_length} bytes).'
+            )
+
+    tail = bytearray()
+    try:
+        with source:
+            while not stop.is_set():
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+
+                # Documents can span chunks, so only hand over complete
+                # lines and carry the rest into the next chunk.
+                end = chunk.rfind(b'\n') + 1
+                if not end:
+                    check_line(len(tail) + len(chunk))
+                    tail += chunk
+                    continue
+
+                if tail:
+                    check_line(len(tail) + chunk.find(b'\n'))
+                if not put(padded(tail, chunk, end)):
+                    return
+                tail = bytearray(memoryview(chunk)[end:])
+
+            if tail.strip() and not put(padded(tail, b'', 0)):
+                return
+    except BaseException as e:
+        put(e)
+        return
+
+    put(None)
+
+
+cdef class DocumentStream:
+    """
+    An iterator over the documents in a file of newline-delimited JSON.
+
+    The file is read and decompressed in chunks on a background thread,
+    while the previous chunk is parsed, so memory use is bounded by the
+    chunk size no matter how large the file is.
+
+    .. admonition::
+       :class: warning
+
+       You should never create this class on your own. It is created and
+       returned for you by :func:`load_many`.
+    """
+    cdef Parser parser
+    cdef object chunks
+    cdef object stop
+    cdef object buffer
+    cdef simd_stream c_stream
+    cdef simd_stream.iterator c_iterator
+    cdef bint c_active
+    cdef bint c_started
+
+    def __cinit__(self):
+        self.c_active = False
+        self.c_started = False
+
+    def __dealloc__(self):
+        if self.stop is not None:
+            self.stop.set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef simd_element document
+
+        if self.chunks is None:
+            raise StopIteration
+
+        try:
+            while True:
+                if self.c_active:
+                    # Advancing parses the next document over the current
+                    # one, so only do it once it has been converted.
+                    if self.c_started:
+                        preincrement(self.c_iterator)
+                    self.c_started = True
+
+                    if self.c_iterator != self.c_stream.end():
+                        document = dereference(self.c_iterator)
+                        return element_to_primitive(
+                            self.parser,
+                            document,
+                            True
+                        )
+
+                    self.c_active = False
+                    self.buffer = None
+
+                item = self.chunks.get()
+                if item is None:
+                    self.close()
+                    raise StopIteration
+                elif isinstance(item, BaseException):
+                    raise item
+
+                self._start(item[0], item[1])
+        except BaseException:
+            self.close()
+            raise
+
+    cdef _start(self, buffer, size_t length):
+        """Start parsing the padded `buffer`."""
+        cdef:
+            error_code error
+            const char *data = PyByteArray_AS_STRING(buffer)
+
+        self.buffer = buffer
+        with nogil:
+            error = start_document_stream(
+                dereference(self.parser.c_parser),
+                data,
+                length,
+                self.c_stream
+            )
+            if error == SUCCESS:
+                self.c_iterator = self.c_stream.begin()
+
+        if error != SUCCESS:
+            raise ValueError(error_message(error))
+
+        self.c_active = True
+        self.c_started = False
+
+    def close(self):
+        """Stop reading the file. Called automatically once every document
+        has been read."""
+        if self.stop is not None:
+            self.stop.set()
+        self.chunks = None
+        self.stop = None
+        self.buffer = None
+        self.c_active = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_many(path, compression='auto', *, size_t chunk_size=1024 * 1024,
+              size_t max_line_length=64 * 1024 * 1024, **kwargs):
+    """
+    Iterate over the documents in a file of newline-delimited JSON, which
+    may be compressed. Documents are always recursively converted into
+    Python objects::
+
+        >>> for record in simdjson.load_many('logs.ndjson.gz'):
+        ...     print(record['level'])
+
+    The file is read and decompressed on a background thread, overlapping
+    with parsing, and never held in memory all at once.
+
+    :param path: A filesystem path.
+    :param compression: One of ``'gzip'``, ``'zstd'``, None for an
+                        uncompressed file, or ``'auto'`` to detect it from
+                        the start of the file. zstd requires Python 3.14+ or
+                        the `zstandard` package. [default: 'auto']
+    :param chunk_size: The number of decompressed bytes to parse at a
+                       time. [default: 1MiB]
+    :param max_line_length: The longest line, in bytes, that may span
+                            chunks. Reading a longer one raises a
+                            ValueError instead of buffering it without
+                            limit. [default: 64MiB]
+
+    Any other keyword arguments are passed to the underlying
+    :class:`Parser`.
+    """
+    cdef DocumentStream self = DocumentStream.__new__(DocumentStream)
+
+    if chunk_size == 0:
+        raise ValueError('chunk_size must be at least 1.')
+
+    # Created first, so invalid arguments can't leave the file open.
+    self.parser = Parser(**kwargs)
+
+    source = open_compressed(path, compression)
+    # Two chunks can be waiting while a third is being parsed.
+    self.chunks = queue.Queue(maxsize=2)
+    self.stop = threading.Event()
+
+    threading.Thread(
+        target=_read_chunks,
+        args=(source, chunk_size, max_line_length, self.chunks, self.stop),
+        name='simdjson.load_many',
+        daemon=True
+    ).start()
 
-        raise ValueError('Unknown Implementation')
+    return self
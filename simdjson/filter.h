@@ -0,0 +1,280 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <cstring>
+#include <memory>
+#include <string>
+#include <string_view>
+#include <vector>
+#include "simdjson.h"
+#include "tape.h"
+
+#ifndef _PY_SIMDJSON_FILTER
+#define _PY_SIMDJSON_FILTER
+    // Predicates over the elements of an array, evaluated directly on the
+    // tape without creating any Python objects.
+    //
+    // This header must only ever be included by csimdjson.
+    namespace tape_filter {
+        using simdjson::internal::tape_type;
+
+        enum op { EQ, NE, LT, LE, GT, GE };
+
+        enum class node_kind { compare, all, any, negate };
+        enum class operand_kind { null, boolean, number, string };
+
+        struct node {
+            node_kind kind;
+
+            // For comparisons, the already unescaped JSON pointer tokens,
+            // relative to each element.
+            std::vector<std::string> path;
+            op comparison;
+            operand_kind operand;
+            bool boolean;
+            tape_number number;
+            std::string string;
+
+            std::vector<std::shared_ptr<const node>> children;
+        };
+
+        struct source {
+            const uint64_t *tape;
+            const uint8_t *strings;
+        };
+
+        // The array index named by a JSON pointer token, or -1 if it isn't
+        // one.
+        inline int64_t pointer_index(const std::string &token) {
+            if (token.empty() || token.size() > 18) return -1;
+            if (token.size() > 1 && token[0] == '0') return -1;
+            int64_t index = 0;
+            for (char ch : token) {
+                if (ch < '0' || ch > '9') return -1;
+                index = index * 10 + (ch - '0');
+            }
+            return index;
+        }
+
+        // Follow `path` from the element at `i`, returning false if it
+        // doesn't exist.
+        inline bool resolve(const std::vector<std::string> &path, source src,
+                size_t i, size_t &found) {
+            for (const std::string &token : path) {
+                auto type = tape_type(src.tape[i] >> 56);
+                size_t end = uint32_t(src.tape[i]) - 1;
+
+                if (type == tape_type::START_OBJECT) {
+                    size_t j = i + 1;
+                    for (; j < end; j = next_index(src.tape, j + 1)) {
+                        if (tape_string(src.tape, src.strings, j) == token) {
+                            break;
+                        }
+                    }
+                    if (j >= end) return false;
+                    i = j + 1;
+                } else if (type == tape_type::START_ARRAY) {
+                    int64_t index = pointer_index(token);
+                    if (index < 0) return false;
+                    size_t j = i + 1;
+                    for (; j < end && index; j = next_index(src.tape, j)) {
+                        index--;
+                    }
+                    if (j >= end) return false;
+                    i = j;
+                } else {
+                    return false;
+                }
+            }
+            found = i;
+            return true;
+        }
+
+        inline bool ordered(op comparison, int result) {
+            switch (comparison) {
+                case EQ: return result == 0;
+                case NE: return result != 0;
+                case LT: return result < 0;
+                case LE: return result <= 0;
+                case GT: return result > 0;
+                case GE: return result >= 0;
+            }
+            return false;
+        }
+
+        // Compare the value at `i` with the operand of `n`. Values of a
+        // different type never match, except with NE.
+        inline bool compare(const node &n, source src, size_t i) {
+            auto type = tape_type(src.tape[i] >> 56);
+            bool equal;
+
+            switch (n.operand) {
+                case operand_kind::null:
+                    equal = type == tape_type::NULL_VALUE;
+                    break;
+                case operand_kind::boolean:
+                    equal = n.boolean
+                        ? type == tape_type::TRUE_VALUE
+                        : type == tape_type::FALSE_VALUE;
+                    break;
+                case operand_kind::number:
+                    if (!is_number(src.tape, i)) {
+                        equal = false;
+                        break;
+                    }
+                    return ordered(
+                        n.comparison,
+                        compare_numbers(get_number(src.tape, i), n.number)
+                    );
+                case operand_kind::string: {
+                    if (type != tape_type::STRING) {
+                        equal = false;
+                        break;
+                    }
+                    std::string_view value = tape_string(
+                        src.tape,
+                        src.strings,
+                        i
+                    );
+                    int result = value.compare(n.string);
+                    return ordered(
+                        n.comparison,
+                        result < 0 ? -1 : (result > 0 ? 1 : 0)
+                    );
+                }
+                default:
+                    equal = false;
+            }
+
+            if (n.comparison == EQ) return equal;
+            if (n.comparison == NE) return !equal;
+            return false;
+        }
+
+        inline bool evaluate(const node &n, source src, size_t i) {
+            switch (n.kind) {
+                case node_kind::all:
+                    for (const auto &child : n.children) {
+                        if (!evaluate(*child, src, i)) return false;
+                    }
+                    return true;
+                case node_kind::any:
+                    for (const auto &child : n.children) {
+                        if (evaluate(*child, src, i)) return true;
+                    }
+                    return false;
+                case node_kind::negate:
+                    return !evaluate(*n.children[0], src, i);
+                case node_kind::compare: {
+                    size_t found;
+                    if (!resolve(n.path, src, i, found)) {
+                        // A missing value is never equal to anything.
+                        return n.comparison == NE;
+                    }
+                    return compare(n, src, found);
+                }
+            }
+            return false;
+        }
+
+        inline std::shared_ptr<node> make_comparison(
+                const std::vector<std::string> &path, int comparison,
+                operand_kind operand) {
+            auto n = std::make_shared<node>();
+            n->kind = node_kind::compare;
+            n->path = path;
+            n->comparison = op(comparison);
+            n->operand = operand;
+            n->boolean = false;
+            n->number = tape_number{0, false, 0, 0.0};
+            return n;
+        }
+    }
+
+    typedef std::shared_ptr<const tape_filter::node> tape_predicate;
+
+    inline tape_predicate predicate_null(const std::vector<std::string> &path,
+            int comparison) {
+        using namespace tape_filter;
+        return make_comparison(path, comparison, operand_kind::null);
+    }
+
+    inline tape_predicate predicate_bool(const std::vector<std::string> &path,
+            int comparison, bool value) {
+        using namespace tape_filter;
+        auto n = make_comparison(path, comparison, operand_kind::boolean);
+        n->boolean = value;
+        return n;
+    }
+
+    inline tape_predicate predicate_int(const std::vector<std::string> &path,
+            int comparison, bool negative, uint64_t magnitude) {
+        using namespace tape_filter;
+        auto n = make_comparison(path, comparison, operand_kind::number);
+        n->number = number_from_int(negative, magnitude);
+        return n;
+    }
+
+    inline tape_predicate predicate_float(
+            const std::vector<std::string> &path, int comparison,
+            double value) {
+        using namespace tape_filter;
+        auto n = make_comparison(path, comparison, operand_kind::number);
+        n->number = number_from_double(value);
+        return n;
+    }
+
+    inline tape_predicate predicate_string(
+            const std::vector<std::string> &path, int comparison,
+            const std::string &value) {
+        using namespace tape_filter;
+        auto n = make_comparison(path, comparison, operand_kind::string);
+        n->string = value;
+        return n;
+    }
+
+    // Combine predicates with and (`kind` 0), or (1), or negate a single
+    // predicate (2).
+    inline tape_predicate predicate_combine(int kind, const tape_predicate &a,
+            const tape_predicate &b) {
+        using namespace tape_filter;
+        auto n = std::make_shared<node>();
+        n->kind = kind == 0
+            ? node_kind::all
+            : (kind == 1 ? node_kind::any : node_kind::negate);
+
+        for (const tape_predicate &p : {a, b}) {
+            if (!p) continue;
+            // Flatten chains of the same combinator.
+            if (p->kind == n->kind && n->kind != node_kind::negate) {
+                n->children.insert(
+                    n->children.end(),
+                    p->children.begin(),
+                    p->children.end()
+                );
+            } else {
+                n->children.push_back(p);
+            }
+        }
+        return n;
+    }
+
+    // The positions of the elements of the array at `ref` that match
+    // `predicate`. Doesn't require the GIL.
+    inline std::vector<size_t> filter_array(
+            const simdjson::internal::tape_ref &ref,
+            const tape_predicate &predicate) {
+        tape_filter::source src{ref.doc->tape.get(), ref.doc->string_buf.get()};
+        size_t i = ref.json_index;
+        size_t end = uint32_t(src.tape[i]) - 1;
+
+        std::vector<size_t> matches;
+        size_t position = 0;
+        for (size_t j = i + 1; j < end; j = next_index(src.tape, j)) {
+            if (tape_filter::evaluate(*predicate, src, j)) {
+                matches.push_back(position);
+            }
+            position++;
+        }
+        return matches;
+    }
+#endif
@@ -0,0 +1,472 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <map>
+#include <memory>
+#include <string>
+#include <string_view>
+#include <vector>
+#include "simdjson.h"
+#include "tape.h"
+
+#ifndef _PY_SIMDJSON_SCHEMA
+#define _PY_SIMDJSON_SCHEMA
+    // A compiled subset of JSON Schema, validated directly on the tape
+    // without creating any Python objects.
+    //
+    // This header must only ever be included by csimdjson.
+    namespace tape_schema {
+        using simdjson::internal::tape_type;
+
+        enum type_bit : uint32_t {
+            NULL_TYPE = 1,
+            BOOLEAN = 2,
+            INTEGER = 4,
+            // Numbers that aren't whole. The "number" type is both.
+            FRACTION = 8,
+            STRING = 16,
+            ARRAY = 32,
+            OBJECT = 64
+        };
+
+        enum bound_kind {
+            MINIMUM,
+            EXCLUSIVE_MINIMUM,
+            MAXIMUM,
+            EXCLUSIVE_MAXIMUM,
+            BOUND_COUNT
+        };
+
+        enum limit_kind {
+            MIN_LENGTH,
+            MAX_LENGTH,
+            MIN_ITEMS,
+            MAX_ITEMS,
+            MIN_PROPERTIES,
+            MAX_PROPERTIES,
+            LIMIT_COUNT
+        };
+
+        enum class literal_kind { null, boolean, number, string };
+
+        struct literal {
+            literal_kind kind;
+            bool boolean;
+            tape_number number;
+            std::string string;
+        };
+
+        struct bound {
+            bool set;
+            tape_number number;
+            // The bound as written in the schema, for error messages.
+            std::string text;
+        };
+
+        struct node {
+            // A `false` schema, which nothing is valid against.
+            bool reject = false;
+            // A bitmask of type_bit, or 0 to allow any type.
+            uint32_t types = 0;
+            bool has_enumeration = false;
+            std::vector<literal> enumeration;
+            bound bounds[BOUND_COUNT] = {};
+            // -1 if not set.
+            int64_t limits[LIMIT_COUNT] = {-1, -1, -1, -1, -1, -1};
+            std::vector<std::string> required;
+            std::map<std::string, std::shared_ptr<node>> properties;
+            std::shared_ptr<node> additional;
+            std::shared_ptr<node> items;
+        };
+
+        struct source {
+            const uint64_t *tape;
+            const uint8_t *strings;
+        };
+
+        struct failure {
+            std::string pointer;
+            std::string message;
+        };
+
+        inline uint32_t type_of(source src, size_t i) {
+            switch (tape_type(src.tape[i] >> 56)) {
+                case tape_type::NULL_VALUE: return NULL_TYPE;
+                case tape_type::TRUE_VALUE:
+                case tape_type::FALSE_VALUE: return BOOLEAN;
+                case tape_type::INT64:
+                case tape_type::UINT64: return INTEGER;
+                case tape_type::DOUBLE:
+                    // 1.0 is an integer as far as JSON Schema is concerned.
+                    return get_number(src.tape, i).kind ? FRACTION : INTEGER;
+                case tape_type::STRING: return STRING;
+                case tape_type::START_ARRAY: return ARRAY;
+                case tape_type::START_OBJECT: return OBJECT;
+                default: return 0;
+            }
+        }
+
+        inline const char *type_name(uint32_t type) {
+            switch (type) {
+                case NULL_TYPE: return "null";
+                case BOOLEAN: return "boolean";
+                case INTEGER: return "integer";
+                case FRACTION: return "number";
+                case STRING: return "string";
+                case ARRAY: return "array";
+                default: return "object";
+            }
+        }
+
+        inline std::string expected_types(uint32_t types) {
+            std::string result;
+            if ((types & (INTEGER | FRACTION)) == (INTEGER | FRACTION)) {
+                types &= ~INTEGER;
+            }
+            for (uint32_t bit = NULL_TYPE; bit <= OBJECT; bit <<= 1) {
+                if (!(types & bit)) continue;
+                if (!result.empty()) result += " or ";
+                result += "'";
+                result += type_name(bit);
+                result += "'";
+            }
+            return result;
+        }
+
+        // The number of code points in a UTF-8 string, which is how JSON
+        // Schema measures length.
+        inline int64_t code_points(std::string_view value) {
+            int64_t count = 0;
+            for (unsigned char ch : value) {
+                count += (ch & 0xC0) != 0x80;
+            }
+            return count;
+        }
+
+        inline bool equal(const literal &l, source src, size_t i) {
+            auto type = tape_type(src.tape[i] >> 56);
+            switch (l.kind) {
+                case literal_kind::null:
+                    return type == tape_type::NULL_VALUE;
+                case literal_kind::boolean:
+                    return l.boolean
+                        ? type == tape_type::TRUE_VALUE
+                        : type == tape_type::FALSE_VALUE;
+                case literal_kind::number:
+                    return is_number(src.tape, i) && compare_numbers(
+                        get_number(src.tape, i),
+                        l.number
+                    ) == 0;
+                case literal_kind::string:
+                    return type == tape_type::STRING
+                        && tape_string(src.tape, src.strings, i) == l.string;
+            }
+            return false;
+        }
+
+        inline void append_token(std::string &pointer,
+                std::string_view token) {
+            pointer += '/';
+            for (char ch : token) {
+                if (ch == '~') pointer += "~0";
+                else if (ch == '/') pointer += "~1";
+                else pointer += ch;
+            }
+        }
+
+        inline bool fail(failure &f, std::string message) {
+            f.message = std::move(message);
+            return false;
+        }
+
+        inline bool check_limit(const node &n, limit_kind minimum,
+                int64_t count, const char *what, failure &f) {
+            int64_t low = n.limits[minimum], high = n.limits[minimum + 1];
+            if (low >= 0 && count < low) {
+                return fail(
+                    f,
+                    std::string("fewer than the minimum of ")
+                        + std::to_string(low) + " " + what
+                );
+            }
+            if (high >= 0 && count > high) {
+                return fail(
+                    f,
+                    std::string("more than the maximum of ")
+                        + std::to_string(high) + " " + what
+                );
+            }
+            return true;
+        }
+
+        inline bool check_bounds(const node &n, const tape_number &value,
+                failure &f) {
+            static const char *messages[BOUND_COUNT] = {
+                "less than the minimum of ",
+                "less than or equal to the exclusive minimum of ",
+                "greater than the maximum of ",
+                "greater than or equal to the exclusive maximum of "
+            };
+            for (int kind = 0; kind < BOUND_COUNT; kind++) {
+                const bound &b = n.bounds[kind];
+                if (!b.set) continue;
+                int result = compare_numbers(value, b.number);
+                bool valid = kind == MINIMUM ? result >= 0
+                    : kind == EXCLUSIVE_MINIMUM ? result > 0
+                    : kind == MAXIMUM ? result <= 0
+                    : result < 0;
+                if (!valid) return fail(f, messages[kind] + b.text);
+            }
+            return true;
+        }
+
+        // Validate the element at `i` against `n`, recording the JSON
+        // pointer of the first failure in `f`.
+        inline bool check(const node &n, source src, size_t i, failure &f) {
+            if (n.reject) {
+                return fail(f, "not allowed by a false schema");
+            }
+
+            uint32_t type = type_of(src, i);
+            if (n.types && !(n.types & type)) {
+                return fail(
+                    f,
+                    "expected " + expected_types(n.types) + ", got '"
+                        + type_name(type) + "'"
+                );
+            }
+
+            if (n.has_enumeration) {
+                bool found = false;
+                for (const literal &l : n.enumeration) {
+                    if (equal(l, src, i)) {
+                        found = true;
+                        break;
+                    }
+                }
+                if (!found) return fail(f, "not one of the allowed values");
+            }
+
+            switch (type) {
+                case INTEGER:
+                case FRACTION:
+                    return check_bounds(n, get_number(src.tape, i), f);
+                case STRING: {
+                    int64_t low = n.limits[MIN_LENGTH];
+                    int64_t high = n.limits[MAX_LENGTH];
+                    if (low < 0 && high < 0) return true;
+                    int64_t length = code_points(
+                        tape_string(src.tape, src.strings, i)
+                    );
+                    if (low >= 0 && length < low) {
+                        return fail(
+                            f,
+                            "shorter than the minimum length of "
+                                + std::to_string(low)
+                        );
+                    }
+                    if (high >= 0 && length > high) {
+                        return fail(
+                            f,
+                            "longer than the maximum length of "
+                                + std::to_string(high)
+                        );
+                    }
+                    return true;
+                }
+                case ARRAY: {
+                    size_t end = uint32_t(src.tape[i]) - 1;
+                    int64_t count = 0;
+                    for (size_t j = i + 1; j < end;
+                            j = next_index(src.tape, j)) {
+                        if (n.items) {
+                            size_t length = f.pointer.size();
+                            append_token(f.pointer, std::to_string(count));
+                            if (!check(*n.items, src, j, f)) return false;
+                            f.pointer.resize(length);
+                        }
+                        count++;
+                    }
+                    return check_limit(n, MIN_ITEMS, count, "items", f);
+                }
+                case OBJECT: {
+                    size_t end = uint32_t(src.tape[i]) - 1;
+                    int64_t count = 0;
+                    // Which of the first 64 required properties were seen.
+                    uint64_t seen = 0;
+                    size_t required = n.required.size();
+                    // Looking up properties needs a std::string before
+                    // C++14, so every key is copied into the same buffer.
+                    std::string key_copy;
+                    for (size_t j = i + 1; j < end;
+                            j = next_index(src.tape, j + 1)) {
+                        std::string_view key = tape_string(
+                            src.tape,
+                            src.strings,
+                            j
+                        );
+                        count++;
+
+                        for (size_t k = 0; k < required && k < 64; k++) {
+                            if (n.required[k] == key) seen |= 1ULL << k;
+                        }
+
+                        const node *child = nullptr;
+                        key_copy.assign(key.data(), key.size());
+                        auto property = n.properties.find(key_copy);
+                        if (property != n.properties.end()) {
+                            child = property->second.get();
+                        } else if (n.additional) {
+                            child = n.additional.get();
+                        }
+                        if (!child) continue;
+
+                        size_t length = f.pointer.size();
+                        append_token(f.pointer, key);
+                        if (child->reject && child == n.additional.get()) {
+                            return fail(
+                                f,
+                                "additional properties are not allowed"
+                            );
+                        }
+                        if (!check(*child, src, j + 1, f)) return false;
+                        f.pointer.resize(length);
+                    }
+
+                    uint64_t all = required >= 64
+                        ? ~0ULL
+                        : (1ULL << required) - 1;
+                    if (seen != all || required > 64) {
+                        // Find which one is missing only once we know one
+                        // is, keeping the common case to a single pass.
+                        for (const std::string &name : n.required) {
+                            bool present = false;
+                            for (size_t j = i + 1; j < end;
+                                    j = next_index(src.tape, j + 1)) {
+                                if (tape_string(src.tape, src.strings, j)
+                                        == name) {
+                                    present = true;
+                                    break;
+                                }
+                            }
+                            if (!present) {
+                                return fail(
+                                    f,
+                                    "missing the required property '"
+                                        + name + "'"
+                                );
+                            }
+                        }
+                    }
+                    return check_limit(
+                        n,
+                        MIN_PROPERTIES,
+                        count,
+                        "properties",
+                        f
+                    );
+                }
+                default:
+                    return true;
+            }
+        }
+    }
+
+    typedef std::shared_ptr<tape_schema::node> schema_node;
+
+    inline schema_node schema_new() {
+        return std::make_shared<tape_schema::node>();
+    }
+
+    inline void schema_reject(const schema_node &n) {
+        n->reject = true;
+    }
+
+    inline void schema_add_type(const schema_node &n, uint32_t bits) {
+        n->types |= bits;
+    }
+
+    inline void schema_add_null(const schema_node &n) {
+        using namespace tape_schema;
+        n->has_enumeration = true;
+        n->enumeration.push_back(
+            literal{literal_kind::null, false, tape_number{}, ""}
+        );
+    }
+
+    inline void schema_add_bool(const schema_node &n, bool value) {
+        using namespace tape_schema;
+        n->has_enumeration = true;
+        n->enumeration.push_back(
+            literal{literal_kind::boolean, value, tape_number{}, ""}
+        );
+    }
+
+    inline void schema_add_number(const schema_node &n,
+            const tape_number &value) {
+        using namespace tape_schema;
+        n->has_enumeration = true;
+        n->enumeration.push_back(
+            literal{literal_kind::number, false, value, ""}
+        );
+    }
+
+    inline void schema_add_string(const schema_node &n,
+            const std::string &value) {
+        using namespace tape_schema;
+        n->has_enumeration = true;
+        n->enumeration.push_back(
+            literal{literal_kind::string, false, tape_number{}, value}
+        );
+    }
+
+    // An enum that nothing matches, such as an empty one.
+    inline void schema_set_enum(const schema_node &n) {
+        n->has_enumeration = true;
+    }
+
+    inline void schema_set_bound(const schema_node &n, int kind,
+            const tape_number &value, const std::string &text) {
+        n->bounds[kind] = tape_schema::bound{true, value, text};
+    }
+
+    inline void schema_set_limit(const schema_node &n, int kind,
+            int64_t value) {
+        n->limits[kind] = value;
+    }
+
+    inline void schema_add_required(const schema_node &n,
+            const std::string &name) {
+        n->required.push_back(name);
+    }
+
+    inline void schema_add_property(const schema_node &n,
+            const std::string &name, const schema_node &child) {
+        n->properties[name] = child;
+    }
+
+    inline void schema_set_additional(const schema_node &n,
+            const schema_node &child) {
+        n->additional = child;
+    }
+
+    inline void schema_set_items(const schema_node &n,
+            const schema_node &child) {
+        n->items = child;
+    }
+
+    // Validate the element at `ref` against `n`. On failure, `pointer` and
+    // `message` describe the first invalid value. Doesn't require the GIL.
+    inline bool schema_validate(const schema_node &n,
+            const simdjson::internal::tape_ref &ref, std::string &pointer,
+            std::string &message) {
+        tape_schema::source src{
+            ref.doc->tape.get(),
+            ref.doc->string_buf.get()
+        };
+        tape_schema::failure f;
+        if (tape_schema::check(*n, src, ref.json_index, f)) return true;
+        pointer = std::move(f.pointer);
+        message = std::move(f.message);
+        return false;
+    }
+#endif
@@ -0,0 +1,691 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <algorithm>
+#include <cmath>
+#include <cstdio>
+#include <cstring>
+#include <string_view>
+#include <utility>
+#include <vector>
+#include "simdjson.h"
+
+#ifndef _PY_SIMDJSON_TAPE
+#define _PY_SIMDJSON_TAPE
+    // Helpers for working directly with the simdjson DOM tape.
+    //
+    // simdjson keeps the position of an element on the tape private. An
+    // explicit template instantiation is exempt from access checking, which
+    // lets us name the private `tape` member of element, array and object
+    // without relying on their memory layout.
+    //
+    // This header must only ever be included by csimdjson.
+    namespace tape_access {
+        using simdjson::internal::tape_ref;
+
+        template<typename Tag, typename Tag::type Member>
+        struct steal {
+            friend typename Tag::type get(Tag) { return Member; }
+        };
+
+        struct element_tag {
+            typedef tape_ref simdjson::dom::element::*type;
+            friend type get(element_tag);
+        };
+        struct array_tag {
+            typedef tape_ref simdjson::dom::array::*type;
+            friend type get(array_tag);
+        };
+        struct object_tag {
+            typedef tape_ref simdjson::dom::object::*type;
+            friend type get(object_tag);
+        };
+
+        template struct steal<element_tag, &simdjson::dom::element::tape>;
+        template struct steal<array_tag, &simdjson::dom::array::tape>;
+        template struct steal<object_tag, &simdjson::dom::object::tape>;
+    }
+
+    inline const simdjson::internal::tape_ref &
+    get_tape_ref(const simdjson::dom::element &value) {
+        return value.*get(tape_access::element_tag());
+    }
+
+    inline const simdjson::internal::tape_ref &
+    get_tape_ref(const simdjson::dom::array &value) {
+        return value.*get(tape_access::array_tag());
+    }
+
+    inline const simdjson::internal::tape_ref &
+    get_tape_ref(const simdjson::dom::object &value) {
+        return value.*get(tape_access::object_tag());
+    }
+
+    // The index of the element following the one at `i`.
+    inline size_t next_index(const uint64_t *tape, size_t i) {
+        using simdjson::internal::tape_type;
+        switch (tape_type(tape[i] >> 56)) {
+            case tape_type::START_ARRAY:
+            case tape_type::START_OBJECT:
+                return uint32_t(tape[i]);
+            case tape_type::INT64:
+            case tape_type::UINT64:
+            case tape_type::DOUBLE:
+                return i + 2;
+            default:
+                return i + 1;
+        }
+    }
+
+    inline std::string_view tape_string(const uint64_t *tape,
+            const uint8_t *strings, size_t i) {
+        size_t offset = tape[i] & simdjson::internal::JSON_VALUE_MASK;
+        uint32_t length;
+        std::memcpy(&length, strings + offset, sizeof(length));
+        return std::string_view(
+            reinterpret_cast<const char *>(strings + offset + sizeof(length)),
+            length
+        );
+    }
+
+    // Numbers are compared by value regardless of how they're stored, the
+    // same way Python compares the int and float objects they become.
+    // `kind` is 0 for integers, 1 for floats that aren't whole numbers.
+    struct tape_number {
+        int kind;
+        bool negative;
+        uint64_t magnitude;
+        double value;
+    };
+
+    inline tape_number number_from_int(bool negative, uint64_t magnitude) {
+        return tape_number{0, negative, magnitude, 0.0};
+    }
+
+    // Whole numbers are stored as integers, so that 1.0 is equal to 1.
+    inline tape_number number_from_double(double d) {
+        double whole = std::trunc(d);
+        // 2**64, exactly representable.
+        if (whole == d && std::fabs(d) < 18446744073709551616.0) {
+            return tape_number{0, d < 0, uint64_t(std::fabs(d)), 0.0};
+        }
+        return tape_number{1, false, 0, d};
+    }
+
+    inline bool is_number(const uint64_t *tape, size_t i) {
+        using simdjson::internal::tape_type;
+        auto type = tape_type(tape[i] >> 56);
+        return type == tape_type::INT64 || type == tape_type::UINT64
+            || type == tape_type::DOUBLE;
+    }
+
+    inline tape_number get_number(const uint64_t *tape, size_t i) {
+        using simdjson::internal::tape_type;
+        tape_number n{0, false, 0, 0.0};
+        switch (tape_type(tape[i] >> 56)) {
+            case tape_type::INT64: {
+                int64_t v;
+                std::memcpy(&v, &tape[i + 1], sizeof(v));
+                n.negative = v < 0;
+                n.magnitude = n.negative ? 0 - uint64_t(v) : uint64_t(v);
+                break;
+            }
+            case tape_type::UINT64:
+                n.magnitude = tape[i + 1];
+                break;
+            default: {
+                double d;
+                std::memcpy(&d, &tape[i + 1], sizeof(d));
+                n = number_from_double(d);
+                break;
+            }
+        }
+        return n;
+    }
+
+    // -1, 0 or 1, the same way Python compares the int and float objects
+    // the numbers would become.
+    inline int compare_numbers(const tape_number &a, const tape_number &b) {
+        if (a.kind == 0 && b.kind == 0) {
+            if (a.negative != b.negative) return a.negative ? -1 : 1;
+            if (a.magnitude == b.magnitude) return 0;
+            bool less = a.magnitude < b.magnitude;
+            return (less != a.negative) ? -1 : 1;
+        }
+
+        auto as_double = [](const tape_number &n) {
+            if (n.kind) return n.value;
+            double d = double(n.magnitude);
+            return n.negative ? -d : d;
+        };
+        double x = as_double(a), y = as_double(b);
+        return x < y ? -1 : (x > y ? 1 : 0);
+    }
+
+    namespace tape_hash {
+        // The MurmurHash3 finalizer.
+        inline uint64_t mix(uint64_t h) {
+            h ^= h >> 33;
+            h *= 0xff51afd7ed558ccdULL;
+            h ^= h >> 33;
+            h *= 0xc4ceb9fe1a85ec53ULL;
+            h ^= h >> 33;
+            return h;
+        }
+
+        inline uint64_t combine(uint64_t h, uint64_t value) {
+            return mix(h ^ (value + 0x9e3779b97f4a7c15ULL + (h << 6) + (h >> 2)));
+        }
+
+        // Hash bytes, reading 8 at a time in little-endian order so the
+        // result is the same on every platform.
+        inline uint64_t bytes(uint64_t h, std::string_view s) {
+            const uint8_t *data = reinterpret_cast<const uint8_t *>(s.data());
+            size_t i = 0;
+            h = combine(h, s.size());
+            for (; i + 8 <= s.size(); i += 8) {
+                uint64_t word = 0;
+                for (int b = 7; b >= 0; b--) word = (word << 8) | data[i + b];
+                h = combine(h, word);
+            }
+            uint64_t tail = 0;
+            for (size_t b = s.size(); b > i; b--) tail = (tail << 8) | data[b - 1];
+            return combine(h, tail);
+        }
+
+        inline uint64_t value(const uint64_t *tape, const uint8_t *strings,
+                size_t i, bool unordered) {
+            using simdjson::internal::tape_type;
+            auto type = tape_type(tape[i] >> 56);
+            uint64_t h = mix(uint64_t(type == tape_type::UINT64
+                || type == tape_type::DOUBLE ? tape_type::INT64 : type));
+
+            switch (type) {
+                case tape_type::STRING:
+                    return bytes(h, tape_string(tape, strings, i));
+                case tape_type::INT64:
+                case tape_type::UINT64:
+                case tape_type::DOUBLE: {
+                    tape_number n = get_number(tape, i);
+                    if (n.kind) {
+                        uint64_t bits;
+                        std::memcpy(&bits, &n.value, sizeof(bits));
+                        return combine(combine(h, 1), bits);
+                    }
+                    return combine(combine(h, n.negative), n.magnitude);
+                }
+                case tape_type::START_ARRAY: {
+                    size_t end = uint32_t(tape[i]) - 1;
+                    for (size_t j = i + 1; j < end; j = next_index(tape, j)) {
+                        h = combine(h, value(tape, strings, j, unordered));
+                    }
+                    return h;
+                }
+                case tape_type::START_OBJECT: {
+                    size_t end = uint32_t(tape[i]) - 1;
+                    // When ignoring order, the hash of each pair is summed,
+                    // which is commutative.
+                    uint64_t pairs = 0;
+                    for (size_t j = i + 1; j < end; ) {
+                        uint64_t pair = combine(
+                            value(tape, strings, j, unordered),
+                            value(tape, strings, j + 1, unordered)
+                        );
+                        if (unordered) {
+                            pairs += mix(pair);
+                        } else {
+                            h = combine(h, pair);
+                        }
+                        j = next_index(tape, j + 1);
+                    }
+                    return unordered ? combine(h, pairs) : h;
+                }
+                default:
+                    return h;
+            }
+        }
+    }
+
+    // A stable 64-bit hash of the content of the element at `ref`.
+    // Optionally, the order of keys in objects is ignored.
+    inline uint64_t tape_digest(const simdjson::internal::tape_ref &ref,
+            bool unordered) {
+        return tape_hash::value(
+            ref.doc->tape.get(),
+            ref.doc->string_buf.get(),
+            ref.json_index,
+            unordered
+        );
+    }
+
+    inline bool tape_equal(const uint64_t *ta, const uint8_t *sa, size_t i,
+            const uint64_t *tb, const uint8_t *sb, size_t j);
+
+    // Compare the remaining members of two objects, starting at `i` and
+    // `j`, regardless of their order. Both sides are sorted by key once, so
+    // this is O(n log n) rather than searching for every key.
+    inline bool tape_equal_members(const uint64_t *ta, const uint8_t *sa,
+            size_t i, size_t end_a, const uint64_t *tb, const uint8_t *sb,
+            size_t j, size_t end_b) {
+        typedef std::vector<std::pair<std::string_view, size_t>> members;
+
+        auto collect = [](const uint64_t *tape, const uint8_t *strings,
+                size_t k, size_t end) {
+            members result;
+            for (; k < end; k = next_index(tape, k + 1)) {
+                result.emplace_back(tape_string(tape, strings, k), k + 1);
+            }
+            // Members with the same key keep their order, since their
+            // values are compared in pairs.
+            std::sort(result.begin(), result.end());
+            return result;
+        };
+
+        members a = collect(ta, sa, i, end_a);
+        members b = collect(tb, sb, j, end_b);
+        if (a.size() != b.size()) return false;
+
+        for (size_t k = 0; k < a.size(); k++) {
+            if (a[k].first != b[k].first) return false;
+            if (!tape_equal(ta, sa, a[k].second, tb, sb, b[k].second))
+                return false;
+        }
+        return true;
+    }
+
+    // Compare two elements directly on their tapes, stopping at the first
+    // difference.
+    inline bool tape_equal(const uint64_t *ta, const uint8_t *sa, size_t i,
+            const uint64_t *tb, const uint8_t *sb, size_t j) {
+        using simdjson::internal::tape_type;
+        auto type = tape_type(ta[i] >> 56);
+
+        if (is_number(ta, i) && is_number(tb, j)) {
+            tape_number a = get_number(ta, i), b = get_number(tb, j);
+            if (a.kind != b.kind) return false;
+            if (a.kind) return a.value == b.value;
+            return a.magnitude == b.magnitude
+                && (a.negative == b.negative || a.magnitude == 0);
+        }
+        if (type != tape_type(tb[j] >> 56)) return false;
+
+        switch (type) {
+            case tape_type::STRING:
+                return tape_string(ta, sa, i) == tape_string(tb, sb, j);
+            case tape_type::START_ARRAY: {
+                size_t end_a = uint32_t(ta[i]) - 1;
+                size_t end_b = uint32_t(tb[j]) - 1;
+                i++;
+                j++;
+                for (; i < end_a && j < end_b;
+                        i = next_index(ta, i), j = next_index(tb, j)) {
+                    if (!tape_equal(ta, sa, i, tb, sb, j)) return false;
+                }
+                return i == end_a && j == end_b;
+            }
+            case tape_type::START_OBJECT: {
+                size_t end_a = uint32_t(ta[i]) - 1;
+                size_t end_b = uint32_t(tb[j]) - 1;
+                i++;
+                j++;
+                // Objects almost always have their keys in the same order, so
+                // walk both together for as long as that's true.
+                for (; i < end_a && j < end_b;
+                        i = next_index(ta, i + 1), j = next_index(tb, j + 1)) {
+                    if (tape_string(ta, sa, i) != tape_string(tb, sb, j)) {
+                        return tape_equal_members(
+                            ta, sa, i, end_a, tb, sb, j, end_b
+                        );
+                    }
+                    if (!tape_equal(ta, sa, i + 1, tb, sb, j + 1)) return false;
+                }
+                return i == end_a && j == end_b;
+            }
+            default:
+                return true;
+        }
+    }
+
+    inline bool tape_equal(const simdjson::internal::tape_ref &a,
+            const simdjson::internal::tape_ref &b) {
+        return tape_equal(
+            a.doc->tape.get(), a.doc->string_buf.get(), a.json_index,
+            b.doc->tape.get(), b.doc->string_buf.get(), b.json_index
+        );
+    }
+
+    // Saved tapes start with this header, followed by the tape itself and
+    // then the string buffer. The header is padded to 64 bytes to keep the
+    // tape aligned when the file is mapped into memory.
+    const char TAPE_MAGIC[8] = {'S', 'I', 'M', 'D', 'T', 'A', 'P', 'E'};
+    const uint32_t TAPE_VERSION = 1;
+    const uint32_t TAPE_BYTE_ORDER = 0x01020304;
+
+    struct tape_header {
+        char magic[8];
+        uint32_t version;
+        uint32_t byte_order;
+        uint32_t simdjson_major;
+        uint32_t reserved;
+        uint64_t tape_length;
+        uint64_t strings_length;
+        char padding[24];
+    };
+    static_assert(sizeof(tape_header) == 64, "tape_header must be 64 bytes");
+
+    // Where the subtree at `ref` lives in its document. Strings are written
+    // to the string buffer in document order, so the strings of any subtree
+    // are contiguous.
+    struct tape_extent {
+        size_t start;
+        size_t end;
+        size_t strings_start;
+        size_t strings_end;
+
+        // The length of the rebased tape, including its two root entries.
+        size_t tape_length() const { return end - start + 2; }
+        size_t strings_length() const { return strings_end - strings_start; }
+        size_t saved_size() const {
+            return sizeof(tape_header) + tape_length() * sizeof(uint64_t)
+                + strings_length();
+        }
+    };
+
+    inline tape_extent measure_tape(const simdjson::internal::tape_ref &ref) {
+        using namespace simdjson::internal;
+        const uint64_t *src = ref.doc->tape.get();
+        const uint8_t *src_strings = ref.doc->string_buf.get();
+        tape_extent extent{ref.json_index, ref.after_element(), SIZE_MAX, 0};
+
+        for (size_t i = extent.start; i < extent.end; i++) {
+            auto type = tape_type(src[i] >> 56);
+            if (type == tape_type::STRING) {
+                size_t offset = src[i] & JSON_VALUE_MASK;
+                uint32_t length;
+                std::memcpy(&length, src_strings + offset, sizeof(length));
+                extent.strings_start = std::min(extent.strings_start, offset);
+                extent.strings_end = std::max(
+                    extent.strings_end,
+                    offset + sizeof(length) + length + 1
+                );
+            } else if (type == tape_type::INT64 ||
+                       type == tape_type::UINT64 ||
+                       type == tape_type::DOUBLE) {
+                i++;
+            }
+        }
+        if (extent.strings_start == SIZE_MAX) {
+            extent.strings_start = extent.strings_end = 0;
+        }
+        return extent;
+    }
+
+    // Rebase the subtree at `ref` so that it becomes the root of a new tape
+    // in `tape`, with its strings copied to `strings`. Both must be large
+    // enough for `extent`.
+    inline void copy_tape(const simdjson::internal::tape_ref &ref,
+            const tape_extent &extent, uint64_t *tape, uint8_t *strings) {
+        using namespace simdjson::internal;
+        const uint64_t *src = ref.doc->tape.get();
+        const uint8_t *src_strings = ref.doc->string_buf.get();
+        const size_t start = extent.start;
+        const size_t end = extent.end;
+
+        const size_t length = end - start;
+        tape[0] = (uint64_t(tape_type::ROOT) << 56) | (length + 1);
+        tape[length + 1] = uint64_t(tape_type::ROOT) << 56;
+
+        for (size_t i = start; i < end; i++) {
+            uint64_t value = src[i];
+            auto type = tape_type(value >> 56);
+            switch (type) {
+                case tape_type::START_ARRAY:
+                case tape_type::START_OBJECT:
+                case tape_type::END_ARRAY:
+                case tape_type::END_OBJECT:
+                    // The low 32 bits are the index of the matching brace,
+                    // the rest (for openings) is the element count.
+                    value = (value & ~uint64_t(0xFFFFFFFF))
+                        | (uint32_t(value) - start + 1);
+                    break;
+                case tape_type::STRING:
+                    value = (uint64_t(type) << 56)
+                        | ((value & JSON_VALUE_MASK) - extent.strings_start);
+                    break;
+                case tape_type::INT64:
+                case tape_type::UINT64:
+                case tape_type::DOUBLE:
+                    // The number itself is in the next slot, copied as-is.
+                    tape[i - start + 1] = value;
+                    i++;
+                    value = src[i];
+                    break;
+                default:
+                    break;
+            }
+            tape[i - start + 1] = value;
+        }
+
+        if (extent.strings_length()) {
+            std::memcpy(
+                strings,
+                src_strings + extent.strings_start,
+                extent.strings_length()
+            );
+        }
+    }
+
+    inline tape_header make_header(const tape_extent &extent) {
+        tape_header header{};
+        std::memcpy(header.magic, TAPE_MAGIC, sizeof(header.magic));
+        header.version = TAPE_VERSION;
+        header.byte_order = TAPE_BYTE_ORDER;
+        header.simdjson_major = simdjson::SIMDJSON_VERSION_MAJOR;
+        header.tape_length = extent.tape_length();
+        header.strings_length = extent.strings_length();
+        return header;
+    }
+
+    // Save the subtree at `ref` to `path` as a standalone document.
+    inline void write_tape(const simdjson::internal::tape_ref &ref,
+            const char *path) {
+        tape_extent extent = measure_tape(ref);
+        std::vector<uint64_t> tape(extent.tape_length());
+        std::vector<uint8_t> strings(extent.strings_length());
+        copy_tape(ref, extent, tape.data(), strings.data());
+        tape_header header = make_header(extent);
+
+        std::FILE *fp = std::fopen(path, "wb");
+        if (!fp) {
+            throw simdjson::simdjson_error(simdjson::IO_ERROR);
+        }
+        bool ok = (
+            std::fwrite(&header, sizeof(header), 1, fp) == 1
+            && std::fwrite(tape.data(), sizeof(uint64_t), tape.size(), fp)
+                == tape.size()
+            && std::fwrite(strings.data(), 1, strings.size(), fp)
+                == strings.size()
+        );
+        ok = (std::fclose(fp) == 0) && ok;
+        if (!ok) {
+            throw simdjson::simdjson_error(simdjson::IO_ERROR);
+        }
+    }
+
+    // The number of bytes needed by copy_saved_tape().
+    inline size_t saved_tape_size(const simdjson::internal::tape_ref &ref) {
+        return measure_tape(ref).saved_size();
+    }
+
+    // Save the subtree at `ref` in the same format as write_tape(), but to
+    // memory at `dst`, which must be aligned to 8 bytes.
+    inline void copy_saved_tape(const simdjson::internal::tape_ref &ref,
+            uint8_t *dst) {
+        tape_extent extent = measure_tape(ref);
+        tape_header header = make_header(extent);
+        std::memcpy(dst, &header, sizeof(header));
+        uint64_t *tape = reinterpret_cast<uint64_t *>(dst + sizeof(header));
+        copy_tape(
+            ref,
+            extent,
+            tape,
+            reinterpret_cast<uint8_t *>(tape + extent.tape_length())
+        );
+    }
+
+    // Check that `tape` is well formed, so that a corrupt or malicious file
+    // can never lead to reads outside of the tape or string buffer, or to
+    // a document that doesn't have the structure simdjson relies on.
+    inline bool validate_tape(const uint64_t *tape, size_t tape_length,
+            const uint8_t *strings, size_t strings_length) {
+        using namespace simdjson::internal;
+
+        // A container that hasn't been closed yet.
+        struct scope {
+            size_t start;
+            size_t end;
+            bool object;
+            // The number of slots (values, keys included) inside it.
+            size_t children;
+        };
+
+        if (tape_length < 3) return false;
+
+        const size_t last = tape_length - 1;
+        if (tape[0] != ((uint64_t(tape_type::ROOT) << 56) | last)) return false;
+        if (tape[last] != (uint64_t(tape_type::ROOT) << 56)) return false;
+
+        std::vector<scope> scopes;
+        size_t roots = 0;
+
+        for (size_t i = 1; i < last; i++) {
+            auto type = tape_type(tape[i] >> 56);
+
+            if (!scopes.empty() && i == scopes.back().end) {
+                const scope &closing = scopes.back();
+                if (type != (closing.object
+                        ? tape_type::END_OBJECT
+                        : tape_type::END_ARRAY)) return false;
+                if ((tape[i] & JSON_VALUE_MASK) != closing.start) return false;
+
+                // Objects alternate keys and values, and count fields.
+                size_t count = closing.children;
+                if (closing.object) {
+                    if (count % 2) return false;
+                    count /= 2;
+                }
+                // The count saturates, meaning "at least this many".
+                size_t saved = (tape[closing.start] >> 32) & JSON_COUNT_MASK;
+                if (saved != std::min<size_t>(count, JSON_COUNT_MASK))
+                    return false;
+
+                scopes.pop_back();
+                continue;
+            }
+
+            // Anything else is a value inside the innermost scope, or the
+            // single value of the document itself.
+            size_t limit = last;
+            if (scopes.empty()) {
+                if (roots++) return false;
+            } else {
+                scope &parent = scopes.back();
+                // Every other slot of an object is a key.
+                if (parent.object && parent.children % 2 == 0
+                        && type != tape_type::STRING) return false;
+                parent.children++;
+                limit = parent.end;
+            }
+
+            switch (type) {
+                case tape_type::START_ARRAY:
+                case tape_type::START_OBJECT: {
+                    size_t after = uint32_t(tape[i]);
+                    if (after <= i + 1 || after > limit) return false;
+                    scopes.push_back({
+                        i,
+                        after - 1,
+                        type == tape_type::START_OBJECT,
+                        0
+                    });
+                    break;
+                }
+                case tape_type::STRING: {
+                    size_t offset = tape[i] & JSON_VALUE_MASK;
+                    uint32_t length;
+                    if (offset + sizeof(length) > strings_length) return false;
+                    std::memcpy(&length, strings + offset, sizeof(length));
+                    if (offset + sizeof(length) + length + 1 > strings_length)
+                        return false;
+                    break;
+                }
+                case tape_type::INT64:
+                case tape_type::UINT64:
+                case tape_type::DOUBLE:
+                    if (++i >= limit) return false;
+                    break;
+                case tape_type::TRUE_VALUE:
+                case tape_type::FALSE_VALUE:
+                case tape_type::NULL_VALUE:
+                    break;
+                default:
+                    // Including an END that doesn't close the innermost
+                    // scope.
+                    return false;
+            }
+        }
+        return scopes.empty() && roots == 1;
+    }
+
+    // Point `parser`'s document at a saved tape in `data`, without copying
+    // it. The caller must keep `data` alive and call release_tape() before
+    // the parser is used again or destroyed.
+    inline simdjson::dom::element attach_tape(simdjson::dom::parser &parser,
+            const uint8_t *data, size_t size) {
+        tape_header header;
+        if (size < sizeof(header)) {
+            throw simdjson::simdjson_error(simdjson::TAPE_ERROR);
+        }
+        std::memcpy(&header, data, sizeof(header));
+
+        if (std::memcmp(header.magic, TAPE_MAGIC, sizeof(header.magic))
+                || header.version != TAPE_VERSION
+                || header.byte_order != TAPE_BYTE_ORDER
+                || header.simdjson_major != simdjson::SIMDJSON_VERSION_MAJOR
+                || header.tape_length > (size - sizeof(header)) / 8
+                || header.strings_length > size
+                // Shared memory may be rounded up to a whole page, so only
+                // trailing bytes are allowed.
+                || sizeof(header) + header.tape_length * 8
+                    + header.strings_length > size) {
+            throw simdjson::simdjson_error(simdjson::TAPE_ERROR);
+        }
+
+        uint64_t *tape = reinterpret_cast<uint64_t *>(
+            const_cast<uint8_t *>(data) + sizeof(header)
+        );
+        uint8_t *strings = reinterpret_cast<uint8_t *>(
+            tape + header.tape_length
+        );
+        if (reinterpret_cast<uintptr_t>(tape) % alignof(uint64_t)
+                || !validate_tape(tape, header.tape_length, strings,
+                header.strings_length)) {
+            throw simdjson::simdjson_error(simdjson::TAPE_ERROR);
+        }
+
+        // Free the parser's own document buffers before borrowing ours.
+        // Allocating 0 bytes can't fail.
+        simdjson::error_code error = parser.doc.allocate(0);
+        (void)error;
+        parser.doc.tape.reset(tape);
+        parser.doc.string_buf.reset(strings);
+        return parser.doc.root();
+    }
+
+    // Undo attach_tape(), leaving the parser with an empty document.
+    inline void release_tape(simdjson::dom::parser &parser) {
+        (void)parser.doc.tape.release();
+        (void)parser.doc.string_buf.release();
+        simdjson::error_code error = parser.doc.allocate(0);
+        (void)error;
+    }
+#endif
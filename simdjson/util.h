@@ -1,5 +1,9 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <memory>
 #include "simdjson.h"
 
 #ifndef _PY_SIMDJSON_ERRORS
@@ -49,4 +53,152 @@
         simdjson::get_active_implementation() = t;
         return;
     }
+
+    // Bind a single parser to a specific implementation, without touching
+    // the process-wide active implementation. Any existing capacity is
+    // carried over to the new implementation.
+    inline void set_parser_implementation(simdjson::dom::parser &parser,
+            const simdjson::implementation *t) {
+        simdjson::error_code error = t->create_dom_parser_implementation(
+            parser.capacity(),
+            parser.max_depth(),
+            parser.implementation
+        );
+        if (error) {
+            throw simdjson::simdjson_error(error);
+        }
+    }
+
+    // (Re)allocate both the parser and its document for documents of up to
+    // `capacity` bytes and `max_depth` nesting. Unlike dom::parser::allocate
+    // this also sizes the document and can shrink.
+    inline void allocate_parser(simdjson::dom::parser &parser,
+            size_t capacity, size_t max_depth) {
+        simdjson::error_code error = simdjson::SUCCESS;
+        if (capacity > parser.max_capacity()) {
+            error = simdjson::CAPACITY;
+        }
+        if (!error) error = parser.allocate(capacity, max_depth);
+        if (!error) error = parser.doc.allocate(capacity);
+        if (error) {
+            throw simdjson::simdjson_error(error);
+        }
+    }
+
+    // True if `data` contains only 7-bit ASCII, checked 8 bytes at a time.
+    inline bool is_ascii(const char *data, size_t size) {
+        uint64_t seen = 0;
+        size_t i = 0;
+        for (; i + 8 <= size; i += 8) {
+            uint64_t word;
+            std::memcpy(&word, data + i, 8);
+            seen |= word;
+        }
+        for (; i < size; i++) {
+            seen |= (uint8_t)data[i];
+        }
+        return !(seen & 0x8080808080808080ULL);
+    }
+
+    // Create a str from a UTF-8 string that simdjson has already validated.
+    // ASCII strings, by far the most common case for keys, are copied
+    // directly into a new compact str, skipping the generic decoder.
+    inline PyObject * unicode_from_utf8(const char *data, size_t size) {
+        if (is_ascii(data, size)) {
+            PyObject *result = PyUnicode_New(size, 127);
+            if (!result) return NULL;
+            std::memcpy(PyUnicode_DATA(result), data, size);
+            return result;
+        }
+        return PyUnicode_DecodeUTF8(data, size, NULL);
+    }
+
+    // The offset of the first byte of `data` that isn't part of a valid UTF-8
+    // sequence, or `size` if it's all valid. This is a slow scalar check,
+    // only used to find an error once simdjson has told us there is one.
+    inline size_t invalid_utf8_offset(const char *data, size_t size) {
+        const uint8_t *s = reinterpret_cast<const uint8_t *>(data);
+        size_t i = 0;
+        while (i < size) {
+            uint8_t c = s[i];
+            size_t length;
+            uint32_t min;
+            if (c < 0x80) { i++; continue; }
+            else if ((c & 0xE0) == 0xC0) { length = 2; min = 0x80; }
+            else if ((c & 0xF0) == 0xE0) { length = 3; min = 0x800; }
+            else if ((c & 0xF8) == 0xF0) { length = 4; min = 0x10000; }
+            else return i;
+
+            if (i + length > size) return i;
+            uint32_t code_point = c & (0x7F >> length);
+            for (size_t j = 1; j < length; j++) {
+                if ((s[i + j] & 0xC0) != 0x80) return i;
+                code_point = (code_point << 6) | (s[i + j] & 0x3F);
+            }
+            if (code_point < min || code_point > 0x10FFFF
+                    || (code_point >= 0xD800 && code_point <= 0xDFFF)) {
+                return i;
+            }
+            i += length;
+        }
+        return size;
+    }
+
+    // The largest document validate_json() keeps buffers for between
+    // documents, per thread.
+    const size_t VALIDATE_RETAINED_CAPACITY = 1024 * 1024;
+
+    inline std::unique_ptr<simdjson::dom::parser> &validate_parser() {
+        thread_local std::unique_ptr<simdjson::dom::parser> parser;
+        return parser;
+    }
+
+    // Fully validate a JSON document without creating any Python objects,
+    // using a parser private to the calling thread. Safe to call without
+    // holding the GIL.
+    inline simdjson::error_code validate_json(const char *data, size_t size) {
+        std::unique_ptr<simdjson::dom::parser> &parser = validate_parser();
+        if (!parser) parser.reset(new simdjson::dom::parser());
+        simdjson::error_code error = parser->parse(data, size, true).error();
+
+        // Don't hold on to the memory needed by the largest document ever
+        // validated for the lifetime of the thread. Reallocating only
+        // resizes the structural buffers, while the tape, string buffer and
+        // copy of the input are kept, so the parser has to be replaced.
+        if (parser->capacity() > VALIDATE_RETAINED_CAPACITY) {
+            parser.reset();
+        }
+        return error;
+    }
+
+    // The capacity of the calling thread's validate_json() parser and its
+    // document, whichever is larger.
+    inline size_t validate_json_capacity() {
+        const std::unique_ptr<simdjson::dom::parser> &parser =
+            validate_parser();
+        if (!parser) return 0;
+        return std::max(parser->capacity(), parser->doc.capacity());
+    }
+
+    // The number of 64-bit slots used on the tape by the document most
+    // recently parsed by `parser`. The root element points past the end of
+    // the tape.
+    inline size_t tape_length(const simdjson::dom::parser &parser) {
+        if (!parser.doc.tape) return 0;
+        return (parser.doc.tape[0] & simdjson::internal::JSON_VALUE_MASK) + 1;
+    }
+
+    // Start streaming the documents in the padded buffer `data` as a single
+    // batch. Doesn't require the GIL.
+    inline simdjson::error_code start_document_stream(
+            simdjson::dom::parser &parser, const char *data, size_t size,
+            simdjson::dom::document_stream &stream) {
+        return parser.parse_many(data, size, size).get(stream);
+    }
+
+    inline uint64_t monotonic_ns() {
+        return std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now().time_since_epoch()
+        ).count();
+    }
 #endif
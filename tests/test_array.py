@@ -50,6 +50,19 @@ def test_array_uplift(parser):
     assert isinstance(doc.as_list(), list)
 
 
+def test_array_partial_uplift(parser):
+    """Ensure we can turn only part of an Array into a python list."""
+    doc = parser.parse(b'[1, [2, [3]], {"a": 4, "b": 5}]')
+
+    result = doc.as_list(max_depth=2)
+    assert result[0] == 1
+    assert result[1][0] == 2
+    assert isinstance(result[1][1], simdjson.Array)
+    assert result[2] == {'a': 4, 'b': 5}
+
+    assert doc.as_list(exclude=['b']) == [1, [2, [3]], {'a': 4}]
+
+
 def test_array_mini(parser):
     """Test JSON minifier."""
     doc = parser.parse(b'[ 0, 1, 2,    3, 4, 5]')
@@ -97,3 +110,112 @@ def test_array_pointer(parser):
     """Ensure we can access an array element by pointer."""
     doc = parser.parse(b'[0, 1, 2, 3, 4, 5]')
     assert doc.at_pointer('/1') == 1
+
+
+def test_array_typed_getters(parser):
+    """Ensure the typed getters return the right types, and raise
+    TypeError when the element is of a different type."""
+    doc = parser.parse(b'[1, 2.5, "three", true, null]')
+
+    assert doc.get_int(0) == 1
+    assert doc.get_float(1) == 2.5
+    assert doc.get_str(2) == 'three'
+    assert doc.get_bytes(-3) == b'three'
+    assert doc.get_bool(3) is True
+
+    with pytest.raises(TypeError):
+        doc.get_int(1)
+
+    with pytest.raises(TypeError):
+        doc.get_str(4)
+
+    with pytest.raises(IndexError):
+        doc.get_int(5)
+
+    with pytest.raises(IndexError):
+        doc.get_int(-6)
+
+
+def test_array_random_access(parser):
+    """Ensure indexing and slicing a large Array gives the same results as
+    a list, once the Array has been indexed."""
+    expected = list(range(1000))
+    doc = parser.parse(str(expected))
+
+    assert doc[3] == 3
+    assert doc[500] == 500
+    assert doc[-1] == 999
+    assert doc[-1000] == 0
+    assert doc[10:20] == expected[10:20]
+    assert doc[::-7] == expected[::-7]
+    assert doc[5:5] == []
+
+    with pytest.raises(IndexError):
+        doc[1000]
+
+    with pytest.raises(IndexError):
+        doc[-1001]
+
+    with pytest.raises(TypeError):
+        doc['1']
+
+
+def test_array_iteration(parser):
+    """Ensure iterating over an Array returns proxies for children."""
+    doc = parser.parse(b'[1, "a", [2], {"b": 3}]')
+
+    it = iter(doc)
+    assert iter(it) is it
+    assert it.__length_hint__() == 4
+    values = list(it)
+    assert values[:2] == [1, 'a']
+    assert isinstance(values[2], simdjson.Array)
+    assert isinstance(values[3], simdjson.Object)
+    assert it.__length_hint__() == 0
+
+    with pytest.raises(StopIteration):
+        next(it)
+
+    assert list(simdjson.Parser().parse(b'[]')) == []
+
+
+def test_array_iter_chunks(parser):
+    """Ensure an Array can be iterated over in chunks."""
+    expected = list(range(10))
+    doc = parser.parse(str(expected))
+
+    assert list(doc.iter_chunks(4)) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert list(doc.iter_chunks(10)) == [expected]
+    assert list(doc.iter_chunks(100)) == [expected]
+    assert doc.iter_chunks(3).__length_hint__() == 4
+
+    doc = simdjson.Parser().parse(b'[[1], {"a": 2}]')
+    assert list(doc.iter_chunks(2)) == [[[1], {'a': 2}]]
+    chunk, = doc.iter_chunks(2, recursive=False)
+    assert isinstance(chunk[0], simdjson.Array)
+    assert isinstance(chunk[1], simdjson.Object)
+
+    with pytest.raises(ValueError):
+        doc.iter_chunks(0)
+
+
+@pytest.mark.slow
+def test_array_saturated_size(parser):
+    """Ensure Arrays with more elements than the tape can count (0xFFFFFF)
+    can still be iterated over, indexed and sliced completely."""
+    size = 0xFFFFFF + 10
+    doc = parser.parse(b'[' + b'null,' * (size - 1) + b'null]')
+
+    assert sum(1 for _ in doc) == size
+    assert sum(len(chunk) for chunk in doc.iter_chunks(4096)) == size
+
+    assert len(doc) == size
+    assert doc[size - 1] is None
+    assert doc[-size] is None
+    assert doc[-1:] == [None]
+    assert len(doc[0xFFFFFF:]) == 10
+    with pytest.raises(IndexError):
+        doc[size]
+
+    assert len(doc.as_list()) == size
+    assert len(doc.as_list(max_depth=1)) == size
@@ -0,0 +1,76 @@
+"""Tests for exporting arrays to Apache Arrow."""
+import json
+
+import pytest
+
+
+def test_to_arrow_capsules(parser):
+    """Ensure the PyCapsule Interface is implemented without pyarrow."""
+    doc = parser.parse(b'[1, 2, null]')
+    column = doc.to_arrow()
+    assert len(column) == 3
+
+    schema, array = column.__arrow_c_array__()
+    assert type(schema).__name__ == 'PyCapsule'
+    assert type(array).__name__ == 'PyCapsule'
+    assert type(column.__arrow_c_schema__()).__name__ == 'PyCapsule'
+
+
+def test_to_arrow_mixed(parser):
+    """Ensure incompatible types are reported with a JSON pointer."""
+    doc = parser.parse(b'[{"a": [1, 2]}, {"a": [3, "x"]}]')
+    with pytest.raises(TypeError, match=r'/1/a/1'):
+        doc.to_arrow()
+
+
+@pytest.mark.parametrize('document, arrow_type', [
+    (b'[1, 2, null, 3]', 'int64'),
+    (b'[1, 2.5, null]', 'double'),
+    (b'[18446744073709551615]', 'uint64'),
+    ('["a", null, "ü", ""]'.encode(), 'string'),
+    (b'[true, false, null, true, true, false, false, false, true]', 'bool'),
+    (b'[null, null]', 'null'),
+    (b'[]', 'null'),
+    (b'[[1, 2], [], null, [3]]', 'list<item: int64>'),
+    (b'[{"a": 1, "b": "x"}, null, {"b": "y", "a": 2}]',
+     'struct<a: int64, b: string>'),
+    (b'[{"a": 1, "a": 2}]', 'struct<a: int64>'),
+])
+def test_to_arrow_types(parser, document, arrow_type):
+    """Ensure each type is inferred and exported correctly."""
+    pyarrow = pytest.importorskip('pyarrow')
+
+    array = pyarrow.array(parser.parse(document).to_arrow())
+    array.validate(full=True)
+    assert str(array.type) == arrow_type
+    assert array.to_pylist() == json.loads(document)
+
+
+def test_to_arrow_nested(parser):
+    """Ensure missing struct fields become nulls at every depth."""
+    pyarrow = pytest.importorskip('pyarrow')
+
+    doc = parser.parse(
+        b'[{"a": [{"x": 1}, {"y": "z"}]}, {"a": null}, {"b": true}]'
+    )
+    array = pyarrow.array(doc.to_arrow())
+    array.validate(full=True)
+    assert array.to_pylist() == [
+        {'a': [{'x': 1, 'y': None}, {'x': None, 'y': 'z'}], 'b': None},
+        {'a': None, 'b': None},
+        {'a': None, 'b': True}
+    ]
+
+
+def test_to_arrow_lifetime(parser):
+    """Ensure the column outlives its document and parser."""
+    pyarrow = pytest.importorskip('pyarrow')
+
+    column = parser.parse(b'[{"a": 1}, {"a": 2}]').to_arrow()
+    parser.parse(b'[3]')
+    del parser
+
+    batch = pyarrow.RecordBatch.from_struct_array(pyarrow.array(column))
+    assert batch.to_pylist() == [{'a': 1}, {'a': 2}]
+    # Each export is independent.
+    assert pyarrow.array(column).to_pylist() == [{'a': 1}, {'a': 2}]
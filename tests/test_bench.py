@@ -0,0 +1,36 @@
+"""Tests for the simdjson.bench benchmark suite."""
+import json
+import os.path
+
+from simdjson import bench
+
+
+def test_bench_json_output(jsonexamples, tmp_path):
+    """Ensure the benchmark suite runs and emits machine-readable
+    results."""
+    out = tmp_path / 'results.json'
+    bench.main([
+        os.path.join(jsonexamples, 'small', 'demo.json'),
+        os.path.join(jsonexamples, 'invalid.json'),
+        '--repeat', '1',
+        '--number', '1',
+        '--json', str(out)
+    ])
+
+    results = json.loads(out.read_text())
+    # invalid.json should have been skipped.
+    assert len(results['documents']) == 1
+
+    operations = results['documents'][0]['operations']
+    for name in ('parse', 'parse_str', 'parse_bytearray', 'parse_memoryview',
+                 'parse_mmap', 'parse_padded', 'parse_recursive', 'loads',
+                 'json.loads', 'mini', 'at_pointer'):
+        assert operations[name]['seconds'] > 0
+        assert operations[name]['gb_per_second'] > 0
+
+    # Parsing into Python objects allocates, parsing into a proxy barely
+    # does.
+    assert operations['json.loads']['allocations'] > 1
+    assert operations['parse']['allocations'] < (
+        operations['json.loads']['allocations']
+    )
@@ -0,0 +1,73 @@
+"""Tests for the simdjson.CachedParser parse cache."""
+import simdjson
+
+
+def test_cache_hits():
+    """Ensure identical documents are only parsed once, and results are
+    copies unless disabled."""
+    cache = simdjson.CachedParser()
+
+    first = cache.parse(b'{"a": [1, 2, {"b": "c"}]}')
+    assert first == {'a': [1, 2, {'b': 'c'}]}
+
+    # Mutating the result doesn't affect the cache.
+    first['a'][2]['b'] = 'd'
+    second = cache.parse(bytearray(b'{"a": [1, 2, {"b": "c"}]}'))
+    assert second == {'a': [1, 2, {'b': 'c'}]}
+    assert second is not first
+
+    assert cache.stats == {
+        'hits': 1,
+        'misses': 1,
+        'hit_rate': 0.5,
+        'evictions': 0,
+        'entries': 1,
+        'bytes': 25
+    }
+
+    cache = simdjson.CachedParser(copy=False)
+    assert cache.parse('[1]') is cache.parse('[1]')
+
+
+def test_cache_eviction():
+    """Ensure the least recently used documents are evicted once either
+    limit is reached."""
+    cache = simdjson.CachedParser(max_entries=2)
+    cache.parse(b'[1]')
+    cache.parse(b'[2]')
+    cache.parse(b'[1]')
+    cache.parse(b'[3]')
+    assert len(cache) == 2
+    assert cache.stats['evictions'] == 1
+
+    # [2] was the least recently used, so it should be a miss.
+    cache.parse(b'[2]')
+    assert cache.stats['misses'] == 4
+
+    cache = simdjson.CachedParser(max_bytes=10)
+    cache.parse(b'[1, 2, 3]')
+    cache.parse(b'[4]')
+    assert cache.stats['bytes'] == 3
+    assert cache.stats['evictions'] == 1
+
+    # Too big to ever be cached.
+    assert cache.parse(b'[1, 2, 3, 4, 5]') == [1, 2, 3, 4, 5]
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats['bytes'] == 0
+
+    # str documents are measured by their UTF-8 encoded size.
+    cache = simdjson.CachedParser(max_bytes=12)
+    cache.parse('["\u00e9\u00e9"]')
+    assert cache.stats['bytes'] == 8
+    cache.parse('["\u00e9\u00e9\u00e9"]')
+    assert cache.stats['bytes'] == 10
+    assert cache.stats['evictions'] == 1
+
+
+def test_cache_parser_options():
+    """Ensure extra arguments are given to the underlying Parser."""
+    cache = simdjson.CachedParser(strings='bytes')
+    assert cache.parse(b'["a"]') == [b'a']
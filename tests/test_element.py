@@ -31,3 +31,49 @@ def test_uplift(doc):
     assert doc['string'] == 'test'
     assert doc['bool'] is True
     assert doc['null_value'] is None
+
+
+def test_equality_and_digest():
+    """Ensure proxies can be compared and hashed directly from the tape."""
+    import simdjson
+
+    a = simdjson.Parser().parse(
+        b'{"a": [1, 2.0, "x", true, null], "b": {"c": -1, "d": "e"}}'
+    )
+    b = simdjson.Parser().parse(
+        b'{"b": {"d": "e", "c": -1.0}, "a": [1.0, 2, "x", true, null]}'
+    )
+    c = simdjson.Parser().parse(
+        b'{"a": [1, 2.0, "x", true, null], "b": {"c": -1, "d": "f"}}'
+    )
+
+    assert a == b
+    assert not a != b
+    assert a != c
+    assert a['a'] == b['a']
+    assert a['a'] != c['b']
+
+    # Key order only matters when asked for.
+    assert a.digest() != b.digest()
+    assert a.digest(ignore_order=True) == b.digest(ignore_order=True)
+    assert a.digest(ignore_order=True) != c.digest(ignore_order=True)
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+
+    # Large objects with reordered keys, differing only in their last value.
+    keys = range(20000)
+    forward = simdjson.Parser().parse(
+        '{%s}' % ','.join(f'"{k}": {k}' for k in keys)
+    )
+    backward = simdjson.Parser().parse(
+        '{%s}' % ','.join(f'"{k}": {k}' for k in reversed(keys))
+    )
+    changed = simdjson.Parser().parse(
+        '{%s}' % ','.join(f'"{k}": {k or 1}' for k in reversed(keys))
+    )
+    assert forward == backward
+    assert forward != changed
+
+    # The digest must be stable across processes and platforms.
+    assert simdjson.Parser().parse(b'{"a": [1, "b"]}').digest() == \
+        1207388584989387585
@@ -0,0 +1,105 @@
+"""Tests for filtering arrays with native predicates."""
+import pytest
+
+import simdjson
+from simdjson import Predicate
+
+
+DOCUMENT = b'''[
+    {"id": 1, "level": "error", "duration": 2.5, "tags": ["a", "b"]},
+    {"id": 2, "level": "info", "duration": 0.5},
+    {"id": 3, "level": "error", "duration": 1, "user": null},
+    {"id": -4, "level": "warning", "ok": true},
+    5,
+    {"a/b": 1, "c~d": 2}
+]'''
+
+
+@pytest.fixture
+def doc(parser):
+    return parser.parse(DOCUMENT)
+
+
+@pytest.mark.parametrize('pointer, op, value, expected', [
+    ('/level', '==', 'error', [0, 2]),
+    ('/level', '!=', 'error', [1, 3, 4, 5]),
+    ('/level', '>=', 'info', [1, 3]),
+    ('/id', '<', 0, [3]),
+    ('/id', '>', 1, [1, 2]),
+    ('/duration', '>', 1, [0]),
+    ('/duration', '==', 1.0, [2]),
+    ('/duration', '<=', 1, [1, 2]),
+    ('/user', '==', None, [2]),
+    ('/ok', '==', True, [3]),
+    ('/ok', '==', False, []),
+    ('/tags/1', '==', 'b', [0]),
+    ('/tags/2', '==', 'b', []),
+    ('', '==', 5, [4]),
+    ('/a~1b', '==', 1, [5]),
+    ('/c~0d', '==', 2, [5]),
+    ('/id', '>', -2 ** 70, [0, 1, 2, 3]),
+    ('/level', '==', b'info', [1]),
+])
+def test_filter_comparisons(doc, pointer, op, value, expected):
+    """Ensure each kind of comparison selects the expected elements."""
+    assert doc.filter(pointer, op, value, indices=True) == expected
+
+
+def test_filter_combined(doc):
+    """Ensure predicates can be combined with &, | and ~."""
+    errors = Predicate('/level', '==', 'error')
+    slow = Predicate('/duration', '>', 1)
+
+    assert doc.filter(errors & slow, indices=True) == [0]
+    assert doc.filter(errors | slow, indices=True) == [0, 2]
+    assert doc.filter(~errors, indices=True) == [1, 3, 4, 5]
+    assert doc.filter(
+        errors & ~slow & Predicate('/id', '==', 3),
+        indices=True
+    ) == [2]
+
+    with pytest.raises(TypeError):
+        errors & True
+
+
+def test_filter_values(doc):
+    """Ensure matching elements are returned as proxies or python objects."""
+    matches = doc.filter('/level', '==', 'error')
+    assert [type(m) for m in matches] == [simdjson.Object, simdjson.Object]
+    assert [m['id'] for m in matches] == [1, 3]
+
+    assert doc.filter('/id', '==', 2, recursive=True) == [
+        {'id': 2, 'level': 'info', 'duration': 0.5}
+    ]
+    assert doc.filter('', '==', 5) == [5]
+    assert doc.filter('/missing', '==', 1) == []
+
+
+def test_filter_errors(doc):
+    """Ensure invalid predicates are rejected."""
+    with pytest.raises(ValueError):
+        Predicate('level', '==', 'error')
+
+    with pytest.raises(ValueError):
+        Predicate('/level', '=~', 'error')
+
+    with pytest.raises(ValueError):
+        Predicate('/user', '<', None)
+
+    with pytest.raises(TypeError):
+        Predicate('/tags', '==', ['a', 'b'])
+
+    with pytest.raises(TypeError):
+        doc.filter('/level')
+
+    with pytest.raises(ValueError):
+        Predicate('/duration', '<', float('nan'))
+
+    # Never initialized, instead of crashing.
+    empty = Predicate.__new__(Predicate)
+    with pytest.raises(ValueError):
+        doc.filter(empty)
+    with pytest.raises(ValueError):
+        Predicate('/level', '==', 'error') | empty
+    with pytest.raises(ValueError):
+        ~empty
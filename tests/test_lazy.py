@@ -0,0 +1,133 @@
+"""Tests for lazily converted dicts and lists."""
+import copy
+import json
+import pickle
+
+import pytest
+
+import simdjson
+
+
+DOCUMENT = b'{"a": [1, {"b": "x"}, [2, 3]], "c": {"d": null}, "e": 1.5}'
+EXPECTED = {'a': [1, {'b': 'x'}, [2, 3]], 'c': {'d': None}, 'e': 1.5}
+
+
+def test_lazy_types(parser):
+    """Ensure lazy containers are real dicts and lists."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    assert isinstance(doc, dict)
+    assert isinstance(doc, simdjson.LazyDict)
+    assert isinstance(doc['a'], list)
+    assert isinstance(doc['a'], simdjson.LazyList)
+    assert isinstance(doc['a'][1], simdjson.LazyDict)
+    assert isinstance(doc['a'][2], simdjson.LazyList)
+    assert doc['e'] == 1.5
+
+    del doc
+    assert parser.parse(b'[1, 2]', recursive='lazy') == [1, 2]
+    assert parser.parse(b'"x"', recursive='lazy') == 'x'
+
+
+def test_lazy_access():
+    """Ensure nested objects are only converted when they're accessed."""
+    parser = simdjson.Parser(stats=True)
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    assert parser.stats['objects_created'] == 3
+
+    # Keys and other values are available from the start, even to code
+    # reading the underlying dict directly.
+    assert len(doc) == 3
+    assert list(doc.keys()) == ['a', 'c', 'e']
+    assert dict.__getitem__(doc, 'e') == 1.5
+    assert isinstance(dict.__getitem__(doc, 'c'), simdjson.Object)
+    assert 'c' in doc
+    assert doc.get('missing') is None
+
+    assert doc['c'] == {'d': None}
+    assert isinstance(dict.__getitem__(doc, 'c'), simdjson.LazyDict)
+    assert isinstance(dict.__getitem__(doc, 'a'), simdjson.Array)
+
+    # Arrays convert everything inside them as soon as they're created.
+    assert doc['a'][2] == [2, 3]
+    assert parser.stats['objects_created'] == 5
+    assert doc == EXPECTED
+    assert repr(doc) == repr(EXPECTED)
+
+
+def test_lazy_json(parser):
+    """Ensure lazy containers serialize like the dicts and lists they
+    are."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    assert json.loads(json.dumps(doc)) == EXPECTED
+    del doc
+
+    doc = parser.parse(b'[[{"a": [[1]]}], {"b": {}}]', recursive='lazy')
+    assert json.dumps(doc) == '[[{"a": [[1]]}], {"b": {}}]'
+
+
+def test_lazy_as_dict(parser):
+    """Ensure lazy containers can be turned into plain dicts and lists."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    result = doc.as_dict()
+    assert type(result) is dict
+    assert type(result['a']) is list
+    assert type(result['a'][1]) is dict
+    assert result == EXPECTED
+    assert dict(doc) == EXPECTED
+    assert {**doc} == EXPECTED
+
+    del doc, result
+    doc = parser.parse(b'[{"a": [1]}]', recursive='lazy')
+    assert doc.as_list() == [{'a': [1]}]
+    assert type(doc.as_list()[0]) is dict
+
+
+def test_lazy_parser_reuse(parser):
+    """Ensure the Parser can only be re-used once everything has been
+    accessed or released."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    with pytest.raises(RuntimeError):
+        parser.parse(b'[]')
+
+    assert doc == EXPECTED
+    parser.parse(b'[]')
+
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    del doc
+    parser.parse(b'[]')
+
+
+def test_lazy_mutation(parser):
+    """Ensure containers are fully converted before being modified."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+    doc['f'] = True
+    assert isinstance(dict.__getitem__(doc, 'c'), simdjson.LazyDict)
+    parser.parse(b'[]')
+
+    doc |= {'g': 1}
+    del doc['e']
+    assert doc.pop('g') == 1
+    assert doc == {'a': EXPECTED['a'], 'c': EXPECTED['c'], 'f': True}
+    assert doc | {'h': None} == {**doc.as_dict(), 'h': None}
+    assert {'h': None} | doc == {'h': None, **doc.as_dict()}
+
+    values = parser.parse(b'[3, [1], 2]', recursive='lazy')
+    values.append(0)
+    del values[1]
+    values.sort()
+    assert values == [0, 2, 3]
+    assert values + [4] == [0, 2, 3, 4]
+
+
+def test_lazy_copy(parser):
+    """Ensure copies and pickles are plain containers."""
+    doc = parser.parse(DOCUMENT, recursive='lazy')
+
+    loaded = pickle.loads(pickle.dumps(doc))
+    assert type(loaded) is dict
+    assert type(loaded['a']) is list
+    assert loaded == EXPECTED
+
+    assert copy.deepcopy(doc) == EXPECTED
+    assert type(doc.copy()) is dict
+    assert type(doc['a'].copy()) is list
@@ -0,0 +1,131 @@
+"""Tests for streaming documents from compressed files."""
+import gc
+import gzip
+import json
+import threading
+import time
+import warnings
+
+import pytest
+
+import simdjson
+
+
+RECORDS = [{'id': i, 'message': 'x' * (i % 40)} for i in range(2000)]
+CONTENT = b''.join(json.dumps(r).encode('utf-8') + b'\n' for r in RECORDS)
+
+
+@pytest.fixture
+def plain(tmp_path):
+    path = tmp_path / 'records.ndjson'
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def compressed(tmp_path):
+    path = tmp_path / 'records.ndjson.gz'
+    path.write_bytes(gzip.compress(CONTENT))
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 100, 1024 * 1024])
+def test_load_many_gzip(compressed, chunk_size):
+    """Ensure documents spanning chunks are parsed correctly."""
+    assert list(simdjson.load_many(
+        compressed,
+        chunk_size=chunk_size
+    )) == RECORDS
+    assert list(simdjson.load_many(compressed, 'gzip')) == RECORDS
+
+
+def test_load_many_plain(plain):
+    """Ensure uncompressed files are detected."""
+    assert list(simdjson.load_many(plain)) == RECORDS
+    assert list(simdjson.load_many(str(plain), None)) == RECORDS
+
+
+def test_load_many_zstd(tmp_path):
+    """Ensure zstd compressed files can be read."""
+    zstandard = pytest.importorskip('zstandard')
+
+    path = tmp_path / 'records.ndjson.zst'
+    path.write_bytes(zstandard.ZstdCompressor().compress(CONTENT))
+    assert list(simdjson.load_many(path)) == RECORDS
+
+
+def test_load_many_edges(tmp_path):
+    """Ensure concatenated gzip members, blank lines and a missing final
+    newline are all handled."""
+    path = tmp_path / 'edges.gz'
+    path.write_bytes(
+        gzip.compress(b'{"a": 1}\n\n{"a"') + gzip.compress(b': 2}\n[3]')
+    )
+    assert list(simdjson.load_many(path)) == [{'a': 1}, {'a': 2}, [3]]
+    assert list(simdjson.load_many(path, keys='bytes'))[0] == {b'a': 1}
+
+
+def test_load_many_errors(tmp_path, plain):
+    """Ensure errors are raised from the consuming thread."""
+    path = tmp_path / 'invalid.ndjson'
+    path.write_bytes(b'{"a": 1}\n{"a": }\n')
+
+    stream = simdjson.load_many(path)
+    assert next(stream) == {'a': 1}
+    with pytest.raises(ValueError):
+        next(stream)
+    assert list(stream) == []
+
+    with pytest.raises(gzip.BadGzipFile):
+        list(simdjson.load_many(plain, 'gzip'))
+
+    with pytest.raises(ValueError):
+        simdjson.load_many(plain, 'lz4')
+
+    with pytest.raises(FileNotFoundError):
+        simdjson.load_many(tmp_path / 'missing.gz')
+
+    # The file isn't opened if the Parser can't be created.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        with pytest.raises(OverflowError):
+            simdjson.load_many(plain, max_depth=-1)
+        gc.collect()
+    assert not [w for w in caught if w.category is ResourceWarning]
+
+
+def test_load_many_max_line_length(tmp_path):
+    """Ensure lines spanning chunks are only buffered up to the maximum
+    line length."""
+    path = tmp_path / 'long.ndjson'
+    path.write_bytes(b'[1]\n"' + b'x' * 1000 + b'"\n[2]\n')
+
+    assert len(list(simdjson.load_many(path, chunk_size=10))) == 3
+    assert len(list(simdjson.load_many(
+        path,
+        chunk_size=10,
+        max_line_length=1002
+    ))) == 3
+
+    stream = simdjson.load_many(path, chunk_size=10, max_line_length=500)
+    assert next(stream) == [1]
+    with pytest.raises(ValueError, match='max_line_length'):
+        next(stream)
+
+
+def test_load_many_close(compressed):
+    """Ensure the background thread stops when iteration is abandoned."""
+    with simdjson.load_many(compressed, chunk_size=100) as stream:
+        assert next(stream) == RECORDS[0]
+
+    stream = simdjson.load_many(compressed, chunk_size=100)
+    next(stream)
+    del stream
+
+    for _ in range(50):
+        if not any(t.name == 'simdjson.load_many'
+                   for t in threading.enumerate()):
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail('The background thread is still running.')
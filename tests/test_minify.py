@@ -0,0 +1,48 @@
+"""Tests for minifying documents without parsing them."""
+import json
+import os
+
+import pytest
+
+import simdjson
+
+
+def test_minify(parser):
+    """Ensure whitespace is stripped and the result matches .mini."""
+    doc = b'{\n  "a" : [ 1, 2 ,3 ],\n  "b": "x  y"\n}'
+    assert simdjson.minify(doc) == b'{"a":[1,2,3],"b":"x  y"}'
+    assert simdjson.minify(doc) == parser.parse(doc).mini
+    assert simdjson.minify('[ "ü" ]') == '["ü"]'.encode()
+    assert simdjson.minify(memoryview(b'[]')) == b'[]'
+    assert simdjson.minify(b'') == b''
+
+
+def test_minify_out():
+    """Ensure we can minify into a caller-provided buffer."""
+    doc = b'[ 1, 2, 3 ]'
+    out = bytearray(len(doc))
+    written = simdjson.minify(doc, out)
+    assert written == 7
+    assert out[:written] == b'[1,2,3]'
+
+    with pytest.raises(ValueError):
+        simdjson.minify(doc, bytearray(3))
+
+    with pytest.raises((TypeError, BufferError)):
+        simdjson.minify(doc, b' ' * len(doc))
+
+
+def test_minify_errors():
+    """Ensure unterminated strings are reported."""
+    with pytest.raises(ValueError):
+        simdjson.minify(b'["abc]')
+
+
+def test_minify_example(parser, jsonexamples):
+    """Ensure a large pretty-printed document minifies correctly."""
+    with open(os.path.join(jsonexamples, 'mesh.pretty.json'), 'rb') as src:
+        content = src.read()
+    minified = simdjson.minify(content)
+    assert len(minified) < len(content)
+    # .mini re-serializes numbers, so compare the documents instead.
+    assert parser.parse(minified, True) == json.loads(content)
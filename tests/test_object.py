@@ -48,6 +48,27 @@ def test_object_abc_mapping(parser):
     assert doc.get('z', True) is True
 
 
+def test_object_iteration_proxies(parser):
+    """Ensure values() and items() can return proxies instead of converting
+    every value."""
+    doc = parser.parse(b'{"a": "b", "c": [0, 1, 2], "x": {"f": "z"}}')
+
+    values = list(doc.values(recursive=False))
+    assert values[0] == 'b'
+    assert isinstance(values[1], simdjson.Array)
+    assert isinstance(values[2], simdjson.Object)
+
+    items = list(doc.items(recursive=False))
+    assert [key for key, _ in items] == ['a', 'c', 'x']
+    assert isinstance(items[2][1], simdjson.Object)
+
+    it = doc.items()
+    assert iter(it) is it
+    assert it.__length_hint__() == 3
+    next(it)
+    assert it.__length_hint__() == 2
+
+
 def test_object_uplift(parser):
     """Ensure we can turn our Object into a python dict."""
     doc = parser.parse(b'{"a": "b", "c": [0, 1, 2], "x": {"f": "z"}}')
@@ -61,6 +82,37 @@ def test_object_uplift(parser):
     assert isinstance(doc.as_dict(), dict)
 
 
+def test_object_partial_uplift(parser):
+    """Ensure we can turn only part of an Object into a python dict."""
+    doc = parser.parse(
+        b'{"id": 1, "meta": {"a": [2], "blob": 3}, "blob": [4]}'
+    )
+
+    result = doc.as_dict(max_depth=1)
+    assert result['id'] == 1
+    assert isinstance(result['meta'], simdjson.Object)
+    assert isinstance(result['blob'], simdjson.Array)
+
+    result = doc.as_dict(max_depth=2)
+    assert isinstance(result['meta']['a'], simdjson.Array)
+
+    assert doc.as_dict(exclude=['blob']) == {'id': 1, 'meta': {'a': [2]}}
+    assert doc.as_dict(include=['id', 'meta']) == {
+        'id': 1,
+        'meta': {'a': [2], 'blob': 3}
+    }
+    assert doc.as_dict(include=[b'id']) == {'id': 1}
+
+    with pytest.raises(ValueError):
+        doc.as_dict(max_depth=0)
+
+    with pytest.raises(TypeError):
+        doc.as_dict(exclude='blob')
+
+    with pytest.raises(TypeError):
+        doc.as_dict(bogus=True)
+
+
 def test_object_mini(parser):
     """Test JSON minifier."""
     doc = parser.parse(b'{"a" : "z" }')
@@ -71,3 +123,40 @@ def test_object_pointer(parser):
     """Ensure we can access an object element by pointer."""
     doc = parser.parse(b'{"a" : "z" }')
     assert doc.at_pointer('/a') == 'z'
+
+
+def test_object_typed_getters(doc):
+    """Ensure the typed getters return the right types, and raise
+    TypeError when the value is of a different type."""
+    assert doc.get_int('int64') == -1
+    assert doc.get_int('uint64') == 18446744073709551615
+    assert doc.get_float('double') == 1.1
+    assert doc.get_float('int64') == -1.0
+    assert isinstance(doc.get_float('int64'), float)
+    assert doc.get_bool('bool') is True
+    assert doc.get_str('string') == 'test'
+    assert doc.get_bytes('string') == b'test'
+    assert doc.get_bytes(b'string') == b'test'
+
+    with pytest.raises(KeyError):
+        doc.get_int('no_such_key')
+
+    for getter, key in ((doc.get_int, 'double'),
+                        (doc.get_int, 'string'),
+                        (doc.get_float, 'bool'),
+                        (doc.get_bool, 'null_value'),
+                        (doc.get_str, 'array'),
+                        (doc.get_bytes, 'int64')):
+        with pytest.raises(TypeError):
+            getter(key)
+
+
+@pytest.mark.slow
+def test_object_saturated_size(parser):
+    """Ensure Objects with more fields than the tape can count (0xFFFFFF)
+    are still iterated over completely."""
+    size = 0xFFFFFF + 10
+    doc = parser.parse(b'{' + b'"":0,' * (size - 1) + b'"":0}')
+
+    assert sum(1 for _ in doc) == size
+    assert sum(1 for _ in doc.items()) == size
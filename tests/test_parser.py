@@ -1,6 +1,8 @@
 import io
+import mmap
 import pathlib
 import os.path
+import sys
 
 import pytest
 
@@ -47,6 +49,54 @@ def test_parse_empty_buffer(parser):
     assert str(bytes_exc.value) == str(buffer_exc.value)
 
 
+@pytest.mark.parametrize('wrap', [
+    bytes,
+    bytearray,
+    memoryview,
+    lambda b: b.decode('utf-8')
+])
+def test_parse_buffers(parser, wrap):
+    """Ensure every kind of input can be parsed, in whole or in part."""
+    content = wrap(b'[1, 2] {"hello": "world"} [3]')
+
+    assert parser.parse(content[:6], True) == [1, 2]
+    assert parser.parse(content, True, offset=7, length=18) == {
+        'hello': 'world'
+    }
+    assert parser.parse(content, True, offset=26) == [3]
+
+    # Enough bytes follow the document to parse it without copying it, and
+    # they must be ignored.
+    padded = wrap(b'["a", 1]' + b'"]}' * simdjson.PADDING)
+    for _ in range(2):
+        assert parser.parse(padded, True, length=8) == ['a', 1]
+        assert parser.parse(padded, True, offset=1, length=3) == 'a'
+
+    with pytest.raises(ValueError):
+        parser.parse(content, offset=7, length=100)
+
+    with pytest.raises(ValueError):
+        parser.parse(content, offset=-1)
+
+    with pytest.raises(ValueError):
+        parser.parse(content, offset=100)
+
+
+def test_parse_mmap(parser, tmp_path):
+    """Ensure memory-mapped files can be parsed in place and closed
+    afterwards."""
+    path = tmp_path / 'document.json'
+    path.write_bytes(b'{"a": [1, 2, 3]}')
+
+    with open(path, 'rb') as src:
+        mapped = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+
+    assert parser.parse(mapped, True) == {'a': [1, 2, 3]}
+    assert parser.parse(mapped, True, offset=6, length=9) == [1, 2, 3]
+    # The buffer must have been released.
+    mapped.close()
+
+
 def test_unicode_decode_error(parser, jsonexamples):
     """Ensure the parser raises encoding issues."""
     # Not all implementations are equal. When using the byte-by-byte fallback
@@ -80,3 +130,213 @@ def test_implementation():
 
     implementations = [imp[0] for imp in parser.get_implementations()]
     assert 'fallback' in implementations
+
+
+def test_implementation_per_parser():
+    """Ensure setting the Implementation of one Parser does not change the
+    Implementation used by any other Parser."""
+    default = simdjson.Parser().implementation
+
+    parser = simdjson.Parser(implementation='fallback')
+    assert parser.implementation[0] == 'fallback'
+    assert parser.parse(b'{"hello": "world"}')['hello'] == 'world'
+
+    assert simdjson.Parser().implementation == default
+
+    with pytest.raises(ValueError):
+        simdjson.Parser(implementation='rubbish')
+
+
+def test_autotune():
+    """Ensure autotune picks one of the supported Implementations."""
+    parser = simdjson.Parser()
+    implementations = [imp[0] for imp in parser.get_implementations()]
+    default = parser.implementation[0]
+
+    name = simdjson.autotune([b'{"hello": "world"}', '[1, 2, 3]'],
+                             repeat=1, apply=False)
+    assert name in implementations
+    assert simdjson.Parser().implementation[0] == default
+
+    with pytest.raises(ValueError):
+        simdjson.autotune([])
+
+
+def test_stats(jsonexamples):
+    """Ensure parsing statistics are collected when enabled."""
+    assert simdjson.Parser().stats is None
+
+    exported = []
+    parser = simdjson.Parser(
+        stats=True,
+        stats_hook=exported.append,
+        stats_interval=2
+    )
+
+    content = b'{"a": "b", "c": [0, 1, 2], "x": {"f": "z"}}'
+    parser.parse(content, True)
+    assert not exported
+
+    doc = parser.load(os.path.join(jsonexamples, 'small', 'demo.json'))
+    assert len(exported) == 1
+    del doc
+
+    stats = parser.stats
+    assert stats['documents'] == 2
+    assert stats['bytes_parsed'] > len(content)
+    assert stats['tape_slots'] > 0
+    assert stats['parse_ns'] > 0
+    assert stats['capacity'] > 0
+    assert stats['reallocations'] >= 1
+    # 3 containers and 6 strings (keys included) from the first document,
+    # a single proxy from the second.
+    assert stats['objects_created'] == 4
+    assert stats['strings_created'] == 6
+
+    parser.reset_stats()
+    assert parser.stats['documents'] == 0
+
+
+def test_stats_hook_error(monkeypatch):
+    """Ensure an exception raised by the stats_hook doesn't lose the
+    document that was parsed."""
+    def hook(stats):
+        raise KeyError('broken')
+
+    unraisable = []
+    monkeypatch.setattr(sys, 'unraisablehook', unraisable.append)
+
+    parser = simdjson.Parser(stats_hook=hook, stats_interval=1)
+    assert parser.parse(b'{"a": 1}', True) == {'a': 1}
+    assert len(unraisable) == 1
+    assert isinstance(unraisable[0].exc_value, KeyError)
+    assert parser.stats['documents'] == 1
+
+
+def test_capacity():
+    """Ensure we can preallocate and shrink a Parser."""
+    parser = simdjson.Parser(initial_capacity=4096, max_depth=16)
+    assert parser.capacity == 4096
+    assert parser.max_depth == 16
+
+    doc = parser.parse(b'[' + b' ' * 10000 + b'1]')
+    assert parser.capacity > 10000
+
+    # Proxies still exist referencing the document.
+    with pytest.raises(RuntimeError):
+        parser.shrink()
+
+    del doc
+    parser.shrink()
+    assert parser.capacity == 4096
+    assert parser.max_depth == 16
+
+    parser.shrink(to=100)
+    assert parser.capacity == 100
+    assert parser.parse(b'[1, 2, 3]', True) == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        simdjson.Parser(max_capacity=100).shrink(to=1000)
+
+    # DEPTH_ERROR
+    with pytest.raises(RuntimeError):
+        simdjson.Parser(max_depth=2).parse(b'[[[1]]]')
+
+
+def test_capacity_auto_shrink():
+    """Ensure a Parser shrinks after enough small documents."""
+    parser = simdjson.Parser(shrink_after=2)
+
+    parser.parse(b'[' + b' ' * 10000 + b'1]')
+    assert parser.capacity > 10000
+
+    parser.parse(b'[1]')
+    parser.parse(b'[1]')
+    assert parser.capacity > 10000
+
+    parser.parse(b'[1, 2]')
+    assert parser.capacity < 10000
+
+
+def test_string_modes():
+    """Ensure strings and keys can be returned as raw bytes."""
+    content = '{"a": "b", "ü": ["ß", {"c": "d"}]}'.encode('utf-8')
+
+    parser = simdjson.Parser(strings='bytes')
+    assert parser.strings == 'bytes'
+    assert parser.keys == 'str'
+    assert parser.parse(content, True) == {
+        'a': b'b',
+        'ü': ['ß'.encode('utf-8'), {'c': b'd'}]
+    }
+
+    parser = simdjson.Parser(strings='bytes', keys='bytes')
+    assert parser.parse(content, True) == {
+        b'a': b'b',
+        'ü'.encode('utf-8'): ['ß'.encode('utf-8'), {b'c': b'd'}]
+    }
+    doc = parser.parse(content)
+    assert list(doc) == [b'a', 'ü'.encode('utf-8')]
+    assert doc['a'] == b'b'
+    # Typed getters always return the requested type.
+    assert doc.get_str('a') == 'b'
+    del doc
+
+    # The default, with both ASCII and non-ASCII strings.
+    assert simdjson.Parser().parse(content, True) == {
+        'a': 'b',
+        'ü': ['ß', {'c': 'd'}]
+    }
+
+    with pytest.raises(ValueError):
+        simdjson.Parser(strings='rubbish')
+
+
+def test_parse_partial(jsonexamples, tmp_path):
+    """Ensure the Parser can convert only part of a document."""
+    parser = simdjson.Parser()
+
+    doc = parser.parse(
+        b'{"a": {"b": 1}, "c": [2], "d": 3}',
+        recursive={'max_depth': 1, 'exclude': ['d']}
+    )
+    assert set(doc) == {'a', 'c'}
+    assert isinstance(doc['a'], simdjson.Object)
+    assert doc['a']['b'] == 1
+    del doc
+
+    assert parser.parse(
+        b'[{"id": 1, "payload": [1, 2]}, {"id": 2}]',
+        recursive={'include': ['id']}
+    ) == [{'id': 1}, {'id': 2}]
+
+    assert parser.parse(
+        b'{"id": 1, "user": {"id": 2, "name": "a"}, "text": "b"}',
+        recursive={'include': ['user']}
+    ) == {'user': {'id': 2, 'name': 'a'}}
+
+    with pytest.raises(ValueError):
+        parser.parse(b'[]', recursive={'max_depth': 0})
+
+    doc = parser.load(
+        os.path.join(jsonexamples, 'twitter.json'),
+        recursive={'max_depth': 1}
+    )
+    assert isinstance(doc['statuses'], simdjson.Array)
+    path = tmp_path / 'twitter.tape'
+    doc['search_metadata'].save_tape(path)
+    del doc
+
+    doc = parser.load_tape(path, recursive={'max_depth': 1})
+    assert doc['count'] == 100
+    del doc
+
+    with pytest.raises(TypeError):
+        parser.parse(b'{}', recursive={'bogus': 1})
+
+    # Anything else used to be silently treated as True.
+    for invalid in ('lazzy', 'bytes', 1, None):
+        with pytest.raises(ValueError):
+            parser.parse(b'{}', recursive=invalid)
+    with pytest.raises(ValueError):
+        parser.load_tape(path, recursive='eager')
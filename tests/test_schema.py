@@ -0,0 +1,143 @@
+"""Tests for validating documents with compiled JSON Schemas."""
+import json
+
+import pytest
+
+import simdjson
+
+
+SCHEMA = {
+    'title': 'An order',
+    'type': 'object',
+    'required': ['id', 'items'],
+    'additionalProperties': False,
+    'properties': {
+        'id': {'type': 'integer', 'minimum': 1},
+        'status': {'enum': ['open', 'closed', None]},
+        'score': {'type': 'number', 'exclusiveMaximum': 10},
+        'customer': {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string', 'minLength': 2, 'maxLength': 5},
+                'a/b': {'type': 'null'}
+            }
+        },
+        'items': {
+            'type': 'array',
+            'minItems': 1,
+            'maxItems': 3,
+            'items': {'type': ['integer', 'string']}
+        },
+        'paid': {'const': True},
+        'tags': {
+            'type': 'object',
+            'maxProperties': 1,
+            'additionalProperties': {'type': 'boolean'}
+        }
+    }
+}
+
+VALID = {
+    'id': 1,
+    'status': 'open',
+    'score': 9.5,
+    'customer': {'name': 'ab'},
+    'items': [1, 'x'],
+    'paid': True,
+    'tags': {'a': True}
+}
+
+
+@pytest.fixture(scope='module')
+def schema():
+    return simdjson.Schema(SCHEMA)
+
+
+@pytest.mark.parametrize('changes, pointer', [
+    ({}, None),
+    ({'id': 1.0}, None),
+    ({'status': None}, None),
+    ({'customer': {'name': 'é€x'}}, None),
+    ({'id': 0}, '/id'),
+    ({'id': 1.5}, '/id'),
+    ({'id': True}, '/id'),
+    ({'status': 'pending'}, '/status'),
+    ({'score': 10}, '/score'),
+    ({'customer': {'name': 'a'}}, '/customer/name'),
+    ({'customer': {'name': 'abcdef'}}, '/customer/name'),
+    ({'customer': {}}, '/customer'),
+    ({'customer': {'name': 'ab', 'a/b': 1}}, '/customer/a~1b'),
+    ({'items': []}, '/items'),
+    ({'items': [1, 2, 3, 4]}, '/items'),
+    ({'items': [1, 2.5]}, '/items/1'),
+    ({'paid': 1}, '/paid'),
+    ({'tags': {'a': True, 'b': True}}, '/tags'),
+    ({'tags': {'a': 1}}, '/tags/a'),
+    ({'extra': 1}, '/extra'),
+    ({'items': None}, '/items'),
+])
+def test_schema_validate(parser, schema, changes, pointer):
+    """Ensure the first invalid value is reported by its JSON pointer."""
+    doc = parser.parse(json.dumps({**VALID, **changes}).encode('utf-8'))
+    result = schema.validate(doc)
+
+    if pointer is None:
+        assert result is None
+    else:
+        assert result[0] == pointer
+        assert isinstance(result[1], str)
+
+
+def test_schema_messages(parser, schema):
+    """Ensure failures are described."""
+    doc = parser.parse(b'{"items": [1]}')
+    assert schema.validate(doc) == (
+        '',
+        "missing the required property 'id'"
+    )
+    del doc
+
+    doc = parser.parse(b'{"id": "1", "items": [1]}')
+    assert schema.validate(doc) == ('/id', "expected 'integer', got 'string'")
+
+
+def test_schema_bool(parser):
+    """Ensure boolean schemas accept or reject everything."""
+    doc = parser.parse(b'[1, 2]')
+    assert simdjson.Schema(True).validate(doc) is None
+    assert simdjson.Schema(False).validate(doc) == (
+        '',
+        'not allowed by a false schema'
+    )
+    assert simdjson.Schema({'items': False}).validate(doc)[0] == '/0'
+
+    with pytest.raises(TypeError):
+        simdjson.Schema(True).validate(1)
+
+    # A Schema that was never compiled mustn't crash the interpreter.
+    with pytest.raises(ValueError):
+        simdjson.Schema.__new__(simdjson.Schema).validate(doc)
+
+
+@pytest.mark.parametrize('invalid, exception', [
+    ({'type': 'float'}, ValueError),
+    ({'pattern': '^a'}, ValueError),
+    ({'minimum': '1'}, TypeError),
+    ({'minimum': float('nan')}, ValueError),
+    ({'exclusiveMaximum': float('inf')}, ValueError),
+    ({'maximum': 10 ** 400}, ValueError),
+    ({'enum': [1, float('nan')]}, ValueError),
+    ({'const': float('-inf')}, ValueError),
+    ({'minItems': -1}, ValueError),
+    ({'required': 'id'}, TypeError),
+    ({'required': ['id', 1]}, TypeError),
+    ({'enum': [[1]]}, ValueError),
+    ({'enum': [1], 'const': 1}, ValueError),
+    ({'items': [{}]}, ValueError),
+    ({'properties': {'a': 1}}, TypeError),
+])
+def test_schema_unsupported(invalid, exception):
+    """Ensure schemas that can't be enforced are rejected."""
+    with pytest.raises(exception):
+        simdjson.Schema(invalid)
@@ -0,0 +1,222 @@
+"""Tests for saving and loading binary tapes."""
+import os.path
+import struct
+import subprocess
+import sys
+
+import pytest
+
+import simdjson
+
+
+def test_save_load_tape(parser, jsonexamples, tmp_path):
+    """Ensure documents and subtrees survive a round trip through a saved
+    tape."""
+    path = tmp_path / 'canada.tape'
+    doc = parser.load(os.path.join(jsonexamples, 'canada.json'))
+    expected = doc.as_dict()
+    doc.save_tape(path)
+
+    # Subtrees are re-rooted into their own document.
+    sub_path = tmp_path / 'features.tape'
+    doc['features'][0]['properties'].save_tape(str(sub_path))
+    expected_sub = doc['features'][0]['properties'].as_dict()
+
+    other = simdjson.Parser()
+    loaded = other.load_tape(path)
+    assert isinstance(loaded, simdjson.Object)
+    assert loaded.as_dict() == expected
+    assert loaded.mini == doc.mini
+
+    # The tape is in use by proxies.
+    with pytest.raises(RuntimeError):
+        other.load_tape(path)
+    del loaded
+
+    assert other.load_tape(sub_path, True) == expected_sub
+
+    # The Parser can still be used normally afterwards.
+    assert other.parse(b'[1, "two"]', True) == [1, 'two']
+
+
+def test_save_load_tape_array(parser, tmp_path):
+    """Ensure arrays with every type of element can be saved."""
+    path = tmp_path / 'array.tape'
+    content = [1, -2, 18446744073709551615, 1.5, 'three', True, False, None,
+               [], {}, {'a': ['b', {'c': 'd'}]}]
+    doc = parser.parse(str(content).replace("'", '"').replace(
+        'True', 'true').replace('False', 'false').replace('None', 'null'))
+    doc[-1].save_tape(path)
+    doc.save_tape(path)
+    del doc
+
+    loaded = parser.load_tape(path)
+    assert loaded.as_list() == content
+    assert loaded[-1]['a'][1]['c'] == 'd'
+
+
+def test_load_tape_invalid(parser, jsonexamples, tmp_path):
+    """Ensure invalid or corrupted tapes are rejected."""
+    with pytest.raises(ValueError):
+        parser.load_tape(os.path.join(jsonexamples, 'small', 'demo.json'))
+
+    path = tmp_path / 'demo.tape'
+    parser.load(os.path.join(jsonexamples, 'small', 'demo.json')).save_tape(
+        path
+    )
+    content = bytearray(path.read_bytes())
+
+    # Truncated
+    path.write_bytes(content[:-1])
+    with pytest.raises(ValueError):
+        parser.load_tape(path)
+
+    # Corrupt string offset
+    content[64 + 8 * 3] = 0xFF
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        parser.load_tape(path)
+
+    with pytest.raises(IOError):
+        parser.load_tape(tmp_path / 'no_such_file.tape')
+
+
+def _corrupt_tape(parser, tmp_path, content, corrupt):
+    """Save `content` as a tape, let `corrupt` modify its list of tape
+    words, and try to load the result."""
+    path = tmp_path / 'corrupt.tape'
+    parser.parse(content).save_tape(path)
+    data = bytearray(path.read_bytes())
+
+    tape_length, = struct.unpack_from('<Q', data, 24)
+    tape = list(struct.unpack_from(f'<{tape_length}Q', data, 64))
+    corrupt(tape)
+    struct.pack_into(f'<{tape_length}Q', data, 64, *tape)
+    path.write_bytes(data)
+
+    return parser.load_tape(path, True)
+
+
+def test_load_tape_corrupt_structure(parser, tmp_path):
+    """Ensure tapes whose structure has been corrupted are rejected, even
+    when every individual word looks fine."""
+    def word(type_, value=0):
+        return (ord(type_) << 56) | value
+
+    # Unchanged, to be sure the helper itself works.
+    assert _corrupt_tape(
+        parser, tmp_path, b'{"a": [1, 2], "b": "c"}', lambda tape: None
+    ) == {'a': [1, 2], 'b': 'c'}
+
+    def wrong_count(tape):
+        tape[3] += 1 << 32
+
+    def key_not_string(tape):
+        tape[2] = word('n')
+
+    def odd_slots(tape):
+        # {"a": 1} becomes {"a": "a", "a"}
+        tape[3] = tape[4] = tape[2]
+
+    def wrong_end(tape):
+        tape[8] = word('}', 3)
+
+    def overlapping(tape):
+        # The array now ends after the object that contains it.
+        tape[3] = (tape[3] & ~0xFFFFFFFF) | 12
+
+    for content, corrupt in (
+            (b'{"a": [1, 2], "b": "c"}', wrong_count),
+            (b'{"a": [1, 2], "b": "c"}', key_not_string),
+            (b'{"a": 1}', odd_slots),
+            (b'{"a": [1, 2], "b": "c"}', wrong_end),
+            (b'{"a": [1, 2], "b": "c"}', overlapping)):
+        with pytest.raises(ValueError):
+            _corrupt_tape(parser, tmp_path, content, corrupt)
+
+
+def test_load_tape_gc_cycle(parser, tmp_path):
+    """Ensure a Parser with a loaded tape can be collected as part of a
+    reference cycle."""
+    path = tmp_path / 'doc.tape'
+    parser.parse(b'{"a": [1, 2, 3]}').save_tape(path)
+
+    # Freezing the hook makes the collector clear the Parser before the
+    # rest of the cycle, which used to free the borrowed tape.
+    script = (
+        'import gc, sys, simdjson\n'
+        'class Hook:\n'
+        '    def __call__(self, stats): pass\n'
+        'hook = Hook()\n'
+        'hook.parser = None\n'
+        'gc.collect(); gc.freeze()\n'
+        'parser = simdjson.Parser(stats_hook=hook)\n'
+        'gc.collect(); gc.unfreeze()\n'
+        'hook.parser = parser\n'
+        'doc = parser.load_tape(sys.argv[1])\n'
+        'del doc, parser, hook\n'
+        'print(gc.collect())\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script, str(path)],
+        capture_output=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert int(result.stdout) > 0
+
+
+def test_share(parser):
+    """Ensure a shared document can be attached to by name."""
+    doc = parser.parse(b'{"a": [1, {"b": "shared"}], "c": 2.5}')
+    shm = doc['a'].share()
+    try:
+        other = simdjson.Parser()
+        shared = other.load_shared(shm.name)
+        assert shared[1]['b'] == 'shared'
+        assert shared == doc['a']
+        del shared
+
+        assert other.load_shared(shm.name, True) == [1, {'b': 'shared'}]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_share_between_processes(parser):
+    """Ensure a shared document can be used by another process, and isn't
+    destroyed when that process exits."""
+    doc = parser.parse(b'{"a": [1, {"b": "shared"}]}')
+    shm = doc.share()
+    try:
+        script = (
+            'import simdjson, sys;'
+            'doc = simdjson.Parser().load_shared(sys.argv[1]);'
+            'print(doc.at_pointer("/a/1/b"))'
+        )
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, '-c', script, shm.name],
+                capture_output=True,
+                check=True
+            )
+            assert result.stdout.strip() == b'shared'
+            assert result.stderr == b''
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_load_shared_invalid(parser):
+    """Ensure shared memory that doesn't hold a document is rejected."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=128)
+    try:
+        with pytest.raises(ValueError):
+            parser.load_shared(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        parser.load_shared('simdjson_no_such_block')
@@ -0,0 +1,78 @@
+"""Tests for validating documents without parsing them into Python
+objects."""
+import simdjson
+
+
+def test_validate():
+    """Ensure valid and invalid documents are reported without raising."""
+    assert simdjson.validate(b'{"a": [1, 2, 3]}') is None
+    assert simdjson.validate('{"a": "ü"}') is None
+    assert simdjson.validate(bytearray(b'[1, 2]')) is None
+    assert simdjson.validate(memoryview(b'[1, 2]')) is None
+
+    error, offset = simdjson.validate(b'{"a": [1, 2, 3}')
+    assert error.startswith('TAPE_ERROR')
+    assert offset is None
+
+    error, offset = simdjson.validate(b'')
+    assert error.startswith('EMPTY')
+
+    error, offset = simdjson.validate(b'["abc\xff"]')
+    assert error.startswith('UTF8_ERROR')
+    assert offset == 5
+
+    # Lone surrogates can't be encoded, and are reported as invalid UTF-8.
+    error, offset = simdjson.validate('["\ud800"]')
+    assert error.startswith('UTF8_ERROR')
+    assert offset == 2
+    assert simdjson.validate_utf8('a\ud800') == 1
+
+    # Documents larger than the memory kept between calls.
+    assert simdjson.validate(b'[' + b'1,' * 1000000 + b'1]') is None
+    assert simdjson.validate(b'[1]') is None
+
+
+def test_validate_retained_capacity():
+    """Ensure validating a large document doesn't leave its buffers
+    allocated."""
+    import csimdjson
+
+    assert simdjson.validate(b'[' + b'1,' * 100000 + b'1]') is None
+    assert 200000 < csimdjson._validate_capacity() <= 1024 * 1024
+
+    assert simdjson.validate(b'[' + b'1,' * 1000000 + b'1]') is None
+    assert csimdjson._validate_capacity() == 0
+
+    assert simdjson.validate(b'[1]') is None
+    assert 0 < csimdjson._validate_capacity() < 1024
+
+
+def test_validate_many():
+    """Ensure batches of documents can be validated at once."""
+    results = simdjson.validate_many([
+        b'[1]',
+        b'[1',
+        '{}',
+        bytearray(b'"\xc3\x28"')
+    ])
+    assert results[0] is None
+    assert results[1][0].startswith('TAPE_ERROR')
+    assert results[2] is None
+    assert results[3] == (results[3][0], 1)
+
+    assert simdjson.validate_many([]) == []
+
+
+def test_validate_utf8():
+    """Ensure UTF-8 can be validated and the first error located."""
+    assert simdjson.validate_utf8(b'hello \xc3\xbc') is None
+    assert simdjson.validate_utf8(b'not json at all') is None
+    assert simdjson.validate_utf8(b'ab\xc3') == 2
+    # Overlong encoding of "/".
+    assert simdjson.validate_utf8(b'abc\xc0\xaf') == 3
+    # UTF-16 surrogate.
+    assert simdjson.validate_utf8(b'\xed\xa0\x80') == 0
+
+    assert simdjson.validate_utf8_many([b'a', b'\xff', b'ab\xfe']) == [
+        None, 0, 2
+    ]